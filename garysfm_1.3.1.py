@@ -6,6 +6,7 @@ Gary's File Manager - Advanced File Manager with Cloud Sync, Thumbnails, and Mor
 """
 
 import os
+import stat
 import sys
 import wave
 import struct
@@ -15,15 +16,20 @@ import tempfile
 import time
 import traceback
 import functools
+import weakref
 import psutil
 import math
+from io import BytesIO
 from pathlib import Path
 from typing import Optional, Dict, List, Union, Any, Callable, TypeVar, Tuple, Set
 from dataclasses import dataclass
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from PyQt5.QtCore import QSettings
 import builtins as _builtins
 
+# Resolved once; expanduser() re-reads HOME (and the registry on Windows) per call
+_HOME_DIR = os.path.expanduser("~")
+
 # ==================== OPTIONAL DEPENDENCY HANDLING ====================
 # Gracefully handle missing optional dependencies
 OPTIONAL_IMPORTS = {
@@ -1530,8 +1536,6 @@ class SMBNetworkUtils:
 # smb.close()
 from PyQt5.QtWidgets import QDialog, QLineEdit, QFormLayout, QDialogButtonBox, QFileDialog, QMessageBox, QPushButton
 import re
-import ftplib
-import paramiko
 import shutil
 import sys
 
@@ -1575,7 +1579,7 @@ if sys.platform == 'darwin':
         print("[ERROR] FFmpeg not found in PATH or common locations. Please install FFmpeg (e.g., via Homebrew: 'brew install ffmpeg') and try again.")
         print("[ERROR] You can also set the FFMPEG_PATH environment variable to the full path of ffmpeg.")
         sys.exit(1)
-from PyQt5.QtGui import QPixmap, QIcon, QPainter, QPen, QKeySequence, QFont, QTextDocument, QSyntaxHighlighter, QTextCharFormat, QStandardItemModel, QStandardItem, QColor, QDesktopServices, QMovie, QTextOption, QBrush, QTextCursor, QTransform
+from PyQt5.QtGui import QPixmap, QIcon, QPainter, QPen, QKeySequence, QFont, QTextDocument, QSyntaxHighlighter, QTextCharFormat, QStandardItemModel, QStandardItem, QColor, QDesktopServices, QMovie, QTextOption, QBrush, QTextCursor, QTransform, QRadialGradient, QPixmapCache, QImageReader, QImage, QDrag, QCursor
 
 # --- EXE Icon Extraction for PyQt ---
 def get_exe_icon_qicon(exe_path, size=32):
@@ -2357,7 +2361,6 @@ def precache_video_thumbnails_in_directory(directory, thumbnail_cache, size=128,
             return
         try:
             import ffmpeg
-            from PIL import Image
             import tempfile
             logging.getLogger('thumbnail').debug('Probing video: %s', video_path)
             # Use ffmpeg-python with custom ffmpeg path if needed
@@ -2375,20 +2378,14 @@ def precache_video_thumbnails_in_directory(directory, thumbnail_cache, size=128,
                 (
                     ffmpeg
                     .input(video_path, ss=seek_time)
-                    .output(tmp_path, vframes=1, format='image2', vcodec='mjpeg')
+                    # Scale at decode time so only a size x size frame is encoded and loaded
+                    .output(tmp_path, vframes=1, format='image2', vcodec='mjpeg', vf=f'scale={size}:{size}')
                     .overwrite_output()
                     .run(cmd=ffmpeg_path, quiet=False, capture_stdout=True, capture_stderr=True)
                 )
                 if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
                     logging.getLogger('thumbnail').error('ffmpeg did not produce a valid thumbnail for %s', video_path)
                     return
-                try:
-                    img = Image.open(tmp_path)
-                    img = img.convert('RGBA').resize((size, size), Image.LANCZOS)
-                    img.save(tmp_path)
-                except Exception as e:
-                    logging.getLogger('thumbnail').exception('PIL failed to process thumbnail for %s: %s', video_path, e)
-                    return
                 qimg = QPixmap(tmp_path)
                 if qimg.isNull():
                     logging.getLogger('thumbnail').error('QPixmap failed to load thumbnail for %s (trying QImage fallback)', video_path)
@@ -2632,7 +2629,7 @@ from PyQt5.QtWidgets import (
     QTabBar, QStackedWidget, QMdiArea, QMdiSubWindow, QFileDialog, QLayout, QDateEdit, QSpacerItem,
     QStyledItemDelegate, QFormLayout
 )
-from PyQt5.QtCore import QDir, Qt, pyqtSignal, QFileInfo, QPoint, QRect, QTimer, QThread, QStringListModel, QSortFilterProxyModel, QModelIndex, QSize, QMimeData, QUrl, QEvent, QObject, QMutex, QWaitCondition, QDate
+from PyQt5.QtCore import QDir, Qt, pyqtSignal, QFileInfo, QPoint, QRect, QTimer, QThread, QStringListModel, QSortFilterProxyModel, QModelIndex, QSize, QMimeData, QUrl, QEvent, QObject, QMutex, QWaitCondition, QDate, QPointF, QRectF
 from PyQt5.QtCore import pyqtSlot
 
 # Localization system is now built-in
@@ -8417,6 +8414,9 @@ class ThumbnailCache:
             self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), 'garysfm_thumbnails')
         self.memory_cache = OrderedDict()  # LRU cache in memory
         self.max_memory_cache = 200  # Reduced from 500 to 200 for better memory usage
+        self.max_disk_bytes = 500 * 1024 * 1024  # Disk cache cap, least recently used thumbnails evicted first
+        self._puts_since_limit_check = 0
+        self._limit_check_running = False
         self.cleanup_started = False  # Flag to track cleanup thread
         
         # Add thread safety with lock
@@ -8538,8 +8538,12 @@ class ThumbnailCache:
         cleanup_thread = threading.Thread(target=cleanup_old_files, daemon=True)
         cleanup_thread.start()
     
-    def get_cache_key(self, file_path, size, debug_label=None):
-        """Generate cache key for file path and size, using normalized absolute path (and realpath on macOS)"""
+    def get_cache_key(self, file_path, size, debug_label=None, namespace=None):
+        """Generate cache key for file path and size, using normalized absolute path (and realpath on macOS).
+
+        namespace keeps other renderings of the same file and size (e.g. folder-preview slots)
+        apart from the regular thumbnails.
+        """
         import os, sys
         # Always use realpath on macOS to resolve symlinks, and abspath/normcase everywhere
         if sys.platform == 'darwin':
@@ -8548,13 +8552,15 @@ class ThumbnailCache:
             norm_path = os.path.normcase(os.path.abspath(file_path))
         # Debug label removed for less verbosity
         path_hash = hashlib.md5(norm_path.encode('utf-8')).hexdigest()
+        if namespace:
+            return f"{namespace}-{path_hash}_{size}"
         return f"{path_hash}_{size}"
     
-    def get(self, file_path, size):
+    def get(self, file_path, size, namespace=None):
         logger = logging.getLogger('thumbnail')
         logger.debug("get: %s size=%s", file_path, size)
         """Get cached thumbnail as PNG bytes and reconstruct QPixmap"""
-        cache_key = self.get_cache_key(file_path, size, debug_label='GET')
+        cache_key = self.get_cache_key(file_path, size, debug_label='GET', namespace=namespace)
         logger.debug("get_cache_key: %s", cache_key)
         with self._lock:
             if cache_key in self.memory_cache:
@@ -8662,6 +8668,9 @@ class ThumbnailCache:
                     try:
                         with open(cache_file, 'rb') as f:
                             png_bytes = f.read()
+                        # The file mtime is the last use, so the disk limit evicts least recently used
+                        with suppress(OSError):
+                            os.utime(cache_file)
                         logging.getLogger('thumbnail').debug('Read %d bytes from cache file for %s', len(png_bytes), file_path)
                         self._add_to_memory_cache(cache_key, png_bytes)
                         return self._pixmap_from_png_bytes(png_bytes)
@@ -8763,13 +8772,13 @@ class ThumbnailCache:
         pixmap.loadFromData(QByteArray(png_bytes), 'PNG')
         return pixmap
     
-    def put(self, file_path, size, thumbnail_data):
+    def put(self, file_path, size, thumbnail_data, namespace=None):
         logger = logging.getLogger('thumbnail')
         logger.debug('put: %s size=%s', file_path, size)
         """Store thumbnail as PNG bytes in cache with thread safety"""
         from PyQt5.QtCore import QBuffer, QByteArray
         import time
-        cache_key = self.get_cache_key(file_path, size, debug_label='PUT')
+        cache_key = self.get_cache_key(file_path, size, debug_label='PUT', namespace=namespace)
         logger.debug('put_cache_key: %s', cache_key)
         # Accept either QPixmap or PNG bytes
         if isinstance(thumbnail_data, QPixmap):
@@ -8801,9 +8810,59 @@ class ThumbnailCache:
                     'created': time.time(),
                     'file_size': file_size
                 }
+                self._puts_since_limit_check += 1
+                check_limit = self._puts_since_limit_check >= 200
+                if check_limit:
+                    self._puts_since_limit_check = 0
+            if check_limit:
+                self._start_disk_limit_check()
             self._save_metadata()
         except Exception as e:
             logger.error('Failed to cache thumbnail: %s', e)
+
+    def _start_disk_limit_check(self):
+        """Run _enforce_disk_limit on a background thread, like the old-file cleanup; one at a time"""
+        with self._lock:
+            if self._limit_check_running:
+                return
+            self._limit_check_running = True
+
+        def check_limit():
+            try:
+                self._enforce_disk_limit()
+            finally:
+                with self._lock:
+                    self._limit_check_running = False
+
+        threading.Thread(target=check_limit, daemon=True).start()
+
+    def _enforce_disk_limit(self):
+        """Evict the least recently used .thumb files (get() touches their mtime) until the cache fits max_disk_bytes"""
+        try:
+            entries = []
+            total = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.thumb'):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path, entry.name[:-6]))
+                        total += st.st_size
+            if total <= self.max_disk_bytes:
+                return
+            entries.sort()
+            for _mtime, fsize, path, key in entries:
+                if total <= self.max_disk_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= fsize
+                with self._lock:
+                    self.metadata.pop(key, None)
+                    self.memory_cache.pop(key, None)
+        except Exception:
+            logging.getLogger('thumbnail').debug('Thumbnail disk limit check failed', exc_info=True)
     
     def _add_to_memory_cache(self, key, value):
         """Add item to memory cache with LRU eviction and thread safety"""
@@ -9068,15 +9127,17 @@ class VirtualFileLoader:
                 # Build the items list (was missing, causing 'items' undefined errors)
                 try:
                     import time
-                    # Include full paths for items for consistency with other loaders
-                    items = [os.path.join(directory_path, name) for name in os.listdir(directory_path)]
+                    # Items are os.DirEntry objects: callers get name, path and a cached is_dir() for free
+                    with os.scandir(directory_path) as it:
+                        items = list(it)
+                    # sort_func takes the whole list and returns it sorted
+                    sorted_items = None
                     if sort_func:
                         try:
-                            items = sorted(items, key=sort_func)
+                            sorted_items = sort_func(items)
                         except Exception:
-                            items = sorted(items)
-                    else:
-                        items = sorted(items)
+                            pass
+                    items = sorted_items if sorted_items is not None else sorted(items, key=lambda e: e.name)
                 except Exception as e:
                     print(f"[VirtualFileLoader] Failed to list directory {directory_path}: {e}")
                     callback([], True)
@@ -9742,7 +9803,7 @@ class SearchEngine:
 
 # ==================== CONCURRENT FILE TRANSFER MANAGER ====================
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QMutex, QMutexLocker
 from PyQt5.QtWidgets import QProgressBar, QLabel, QHBoxLayout, QVBoxLayout, QWidget, QPushButton
 import uuid
@@ -15317,11 +15378,247 @@ class ViewModeManager:
     def get_mode(self):
         return self.current_mode
 
+# View mode -> (FileManagerTab widget attribute, refresh method); unknown modes use the list view
+_VIEW_MODE_DISPATCH = {
+    ViewModeManager.THUMBNAIL_VIEW: ('thumbnail_view_widget', 'refresh_thumbnail_view'),
+    ViewModeManager.ICON_VIEW: ('thumbnail_view_widget', 'refresh_current_view'),
+    ViewModeManager.LIST_VIEW: ('list_view', 'refresh_list_view'),
+    ViewModeManager.DETAIL_VIEW: ('detail_view', 'refresh_detail_view'),
+}
+_DEFAULT_VIEW_DISPATCH = _VIEW_MODE_DISPATCH[ViewModeManager.LIST_VIEW]
+
+def _is_dir_fast(path):
+    """Return True if path is a directory, using a single stat() call"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+@functools.lru_cache(maxsize=128)
+def _is_drive_root(path):
+    """Return True if path is a Windows drive root such as C:/ (cached to avoid repeated ismount calls)"""
+    return (os.name == 'nt' and len(path) >= 2 and path[1] == ':'
+            and (path.endswith('/') or path.endswith('\\')) and os.path.ismount(path))
+
+def _best_icon_pixmap(icon, size):
+    """Render icon at the best available size for size and scale it to exactly size x size.
+
+    Returns None if the icon is null or cannot be rendered.
+    """
+    if icon.isNull():
+        return None
+    chosen = icon.actualSize(QSize(size, size))
+    if chosen.isEmpty():
+        return None
+    pixmap = icon.pixmap(chosen)
+    if pixmap.isNull() or pixmap.width() <= 0 or pixmap.height() <= 0:
+        return None
+    if pixmap.width() != size or pixmap.height() != size:
+        pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return pixmap
+
+@functools.lru_cache(maxsize=4096)
+def _is_safe_image_cached(file_path, mtime_ns):
+    """Memoized IconWidget.is_safe_image_file; mtime_ns invalidates entries for modified files"""
+    return IconWidget.is_safe_image_file(file_path)
+
+_scratch_image_reader = None
+
+def _read_scaled_pixmap(path, size):
+    """Load an image file scaled to fit exactly within size x size.
+
+    QImageReader decodes directly at the target resolution (e.g. JPEG DCT scaling)
+    instead of materializing the full-resolution image and scaling it afterwards.
+    One reader is reused for every call (QPixmap work is GUI-thread only anyway),
+    re-pointed with setFileName. Returns a null QPixmap on failure.
+    """
+    global _scratch_image_reader
+    reader = _scratch_image_reader
+    if reader is None:
+        reader = _scratch_image_reader = QImageReader()
+        reader.setAutoTransform(True)
+    reader.setFileName(path)
+    source_size = reader.size()
+    if source_size.isValid() and source_size.width() > 0 and source_size.height() > 0:
+        reader.setScaledSize(source_size.scaled(size, size, Qt.KeepAspectRatio))
+    else:
+        reader.setScaledSize(QSize())
+    image = reader.read()
+    # Release the file handle until the next call
+    reader.setFileName('')
+    if image.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(image)
+
+def _fit_pixmap(pixmap, size):
+    """Scale pixmap to fit within size x size, skipping the copy when it already fits exactly"""
+    if pixmap.isNull() or max(pixmap.width(), pixmap.height()) == size:
+        return pixmap
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+_icon_provider = None
+
+def _get_icon_provider():
+    """Return the shared QFileIconProvider (created on first use, once QApplication exists)"""
+    global _icon_provider
+    if _icon_provider is None:
+        _icon_provider = QFileIconProvider()
+    return _icon_provider
+
+def _standard_icon_pixmap(icon_type, size):
+    """Return the generic Folder/File icon pixmap at size, memoized in QPixmapCache"""
+    key = f"garysfm-std-icon:{int(icon_type)}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = _get_icon_provider().icon(icon_type).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+# Extensions whose icon is specific to the file itself, so it can't be shared per extension
+_PER_FILE_ICON_EXTENSIONS = frozenset({'', '.exe', '.lnk', '.ico', '.url', '.dll', '.desktop', '.app'})
+
+def _file_icon_pixmap(path, size):
+    """Return the system icon for path at size, falling back to the cached generic file icon.
+
+    File-type icons are memoized in QPixmapCache per extension, so files sharing an
+    extension cost one QFileInfo/icon lookup in total rather than one each.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    key = None
+    if ext not in _PER_FILE_ICON_EXTENSIONS:
+        key = f"garysfm-ext-icon:{ext}:{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+    icon = _get_icon_provider().icon(QFileInfo(path))
+    if icon.isNull():
+        return _standard_icon_pixmap(QFileIconProvider.File, size)
+    pixmap = icon.pixmap(size, size)
+    if key is not None:
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+class PreviewType(IntEnum):
+    """Kind of file shown in a folder-preview slot (indexes IconWidget._PREVIEW_SLOT_HANDLERS)"""
+    IMAGE = 0
+    VIDEO = 1
+    AUDIO = 2
+    PDF = 3
+    TEXT = 4
+    DOCX = 5
+    EXE = 6
+    ARCHIVE = 7
+    ISO = 8
+
+# Classified folder-preview scans keyed by folder path: {path: (mtime_ns, scan_result)}
+_folder_preview_cache = {}
+_FOLDER_PREVIEW_CACHE_MAX = 1024
+
+# _folder_thumb_key()s of ISOs with no extractable EXE icon. The key embeds the
+# mtime, so a modified ISO is tried again.
+_iso_icon_misses = set()
+_ISO_ICON_MISSES_MAX = 4096
+
+# Background decoding of folder-preview image slots. Workers only use PIL; the
+# QPixmap conversion happens on the GUI thread (see IconWidget._apply_decoded_previews).
+_preview_executor = None
+# (folder, slot size) -> WeakSet of the IconWidgets waiting for that decode; all of them
+# are repainted when it lands
+_pending_preview_jobs = {}
+# (path, mtime_ns) of images PIL could not decode; an edited image is tried again
+_failed_preview_images = set()
+# ThumbnailCache namespace for scaled folder-preview slots, so a slot never overwrites (or is
+# served as) the framed view thumbnail of the same image at the same size
+_FOLDER_SLOT_NAMESPACE = 'folder-slot'
+
+def _get_preview_executor():
+    """Return the shared thread pool used to decode folder-preview images"""
+    global _preview_executor
+    if _preview_executor is None:
+        _preview_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='folder-preview')
+    return _preview_executor
+
+def _folder_thumb_key(path, mtime_ns, size):
+    """QPixmapCache key for a folder-preview slot; includes the file mtime (from the preview scan) so edits invalidate it"""
+    return f"garysfm-folder-thumb:{path}|{mtime_ns}|{size}"
+
+def _decode_preview_images(paths, size):
+    """Decode and downscale images to PNG bytes (worker thread, no Qt objects).
+
+    Returns a list of (path, png_bytes or None) tuples.
+    """
+    Image = _get_pil_image()
+    results = []
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                img.thumbnail((size, size))
+                buf = BytesIO()
+                img.convert('RGBA').save(buf, 'PNG')
+                results.append((path, buf.getvalue()))
+        except Exception:
+            results.append((path, None))
+    return results
+
+# Optional thumbnail dependencies, imported once on first use (False = unavailable)
+_pycdlib = None
+_PILImage = None
+
+def _get_pycdlib():
+    """Return the pycdlib module, or None if it is not installed"""
+    global _pycdlib
+    if _pycdlib is None:
+        try:
+            import pycdlib as _p
+        except ImportError:
+            _p = False
+        _pycdlib = _p
+    return _pycdlib or None
+
+def _get_pil_image():
+    """Return PIL.Image, or None if Pillow is not installed"""
+    global _PILImage
+    if _PILImage is None:
+        try:
+            from PIL import Image as _img
+        except ImportError:
+            _img = False
+        _PILImage = _img
+    return _PILImage or None
+
+@functools.lru_cache(maxsize=32)
+def _disc_gradient(size):
+    """Return the shared radial gradient used to paint ISO disc icons of the given size"""
+    grad = QRadialGradient(QPoint(size // 2, size // 2), size // 2 - 4)
+    grad.setColorAt(0.0, QColor(230, 230, 230))
+    grad.setColorAt(0.6, QColor(200, 200, 220))
+    grad.setColorAt(1.0, QColor(160, 160, 200))
+    return grad
+
 class IconWidget(QWidget):
     clicked = pyqtSignal(str, object)  # Pass the event modifiers
     doubleClicked = pyqtSignal(str)
     rightClicked = pyqtSignal(str, QPoint)
 
+    # Shared pens/brushes for ISO disc rendering (avoid re-allocating per paint)
+    _DISC_PEN = QPen(QColor(90, 90, 120), 2)
+    _DISC_RING_PEN = QPen(QColor(120, 120, 140), 1)
+    _DISC_RING_BRUSH = QBrush(QColor(240, 240, 255, 200))
+    _DISC_HOLE_BRUSH = QBrush(QColor(20, 20, 20))
+    _EXE_BADGE_PEN = QPen(QColor(60, 60, 60), 2)
+    _EXE_BADGE_BRUSH = QBrush(QColor(240, 240, 240))
+    # Rendered default 'EXE' badge pixmaps, keyed by icon size
+    _exe_default_pix = {}
+    # Applied once; the selection highlight is painted by IconContainer, so toggling
+    # selection never touches style sheets. The transparent border keeps label metrics stable,
+    # and the transparent background overrides the themes' QWidget background-color, which
+    # would otherwise paint the labels opaque over that highlight.
+    _STYLE_SHEET = 'QWidget { border: 2px solid transparent; background: transparent; }'
+
+    # Folder-preview slot background and border
+    _SLOT_FILL_BRUSH = QBrush(Qt.white)
+    _SLOT_BORDER_PEN = QPen(Qt.darkGray, 1)
+
     def __init__(self, file_name, full_path, is_dir, thumbnail_size=64, thumbnail_cache=None, use_icon_only=False, parent=None):
         super().__init__(parent)
         self.file_name = file_name
@@ -15425,7 +15722,9 @@ class IconWidget(QWidget):
         self.setLayout(layout)
         self.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
         self.setToolTip(full_path)
-        self.setStyleSheet("QWidget { border: 2px solid transparent; }")
+        # Lets IconContainer recognise icons with a property read instead of hasattr
+        self.setProperty('isIconWidget', True)
+        self.setStyleSheet(self._STYLE_SHEET)
     
     def update_label_text(self):
         """Update label text based on selection state and apply formatting"""
@@ -15451,11 +15750,6 @@ class IconWidget(QWidget):
         if self.is_selected != selected:
             self.is_selected = selected
             self.update_label_text()
-            # Update border style to show selection
-            if selected:
-                self.setStyleSheet("QWidget { border: 2px solid #0078d4; background-color: rgba(0, 120, 212, 0.1); }")
-            else:
-                self.setStyleSheet("QWidget { border: 2px solid transparent; }")
 
     def update_style_for_theme(self, dark_mode):
         """Update the widget style based on the current theme"""
@@ -15593,21 +15887,8 @@ class IconWidget(QWidget):
                     if not effective_icon_only:
                         # Show archive contents preview for all archive types in thumbnail mode
                         if archive_type == '.iso':
-                            # ISO files: try enhanced ISO thumbnail first, fallback to contents preview
-                            try:
-                                # draw_archive_icon supports a force_custom flag via locals()
-                                self.draw_archive_icon(painter, full_path, size, force_custom=True)
-                            except TypeError:
-                                # Older call signature fallback
-                                try:
-                                    self.draw_custom_archive_icon(painter, full_path, size)
-                                except Exception:
-                                    # If ISO-specific handling fails, show contents preview
-                                    archive_preview = ArchiveManager.create_archive_preview_thumbnail(full_path, size)
-                                    if archive_preview:
-                                        painter.drawPixmap(0, 0, archive_preview)
-                                    else:
-                                        self.draw_archive_icon(painter, full_path, size)
+                            # ISO files: request the enhanced ISO thumbnail
+                            self.draw_archive_icon(painter, full_path, size, force_custom=True)
                         else:
                             # For other archive types (ZIP, RAR, 7z, etc.), show contents preview
                             archive_preview = ArchiveManager.create_archive_preview_thumbnail(full_path, size)
@@ -15669,21 +15950,8 @@ class IconWidget(QWidget):
                 if not effective_icon_only:
                     # Show archive contents preview for all archive types in thumbnail mode
                     if archive_type == '.iso':
-                        try:
-                            # draw_archive_icon supports a force_custom flag; use it to
-                            # request the ISO-specific rendering.
-                            self.draw_archive_icon(painter, full_path, size, force_custom=True)
-                        except TypeError:
-                            # older signature fallback
-                            try:
-                                self.draw_custom_archive_icon(painter, full_path, size)
-                            except Exception:
-                                # If ISO-specific handling fails, show contents preview
-                                archive_preview = ArchiveManager.create_archive_preview_thumbnail(full_path, size)
-                                if archive_preview:
-                                    painter.drawPixmap(0, 0, archive_preview)
-                                else:
-                                    self.draw_custom_archive_icon(painter, full_path, size)
+                        # Request the ISO-specific rendering
+                        self.draw_archive_icon(painter, full_path, size, force_custom=True)
                     else:
                         # For other archive types (ZIP, RAR, 7z, etc.), show contents preview
                         archive_preview = ArchiveManager.create_archive_preview_thumbnail(full_path, size)
@@ -16162,9 +16430,9 @@ class IconWidget(QWidget):
                                 thumbnail_debug('XCF thumbnail error for {}: {}', full_path, e)
                                 original_pixmap = QPixmap()
                         else:
-                            original_pixmap = QPixmap(full_path)
+                            original_pixmap = _read_scaled_pixmap(full_path, size)
                         if not original_pixmap.isNull() and original_pixmap.width() > 0 and original_pixmap.height() > 0:
-                            thumbnail = original_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                            thumbnail = _fit_pixmap(original_pixmap, size)
                             x = (size - thumbnail.width()) // 2
                             y = (size - thumbnail.height()) // 2
                             painter.drawPixmap(x, y, thumbnail)
@@ -16408,7 +16676,8 @@ class IconWidget(QWidget):
             self.thumbnail_cache.put(full_path, size, framed_pixmap)
         return framed_pixmap
 
-    def is_safe_image_file(self, file_path):
+    @staticmethod
+    def is_safe_image_file(file_path):
         """Check if the file is safe to load as an image on the current platform"""
         try:
             # Check file size - avoid very large files that could cause memory issues
@@ -16454,34 +16723,20 @@ class IconWidget(QWidget):
                 icon_provider = QFileIconProvider()
                 file_info = QFileInfo(full_path)
                 icon = icon_provider.icon(file_info)
-                preferred_sizes = [256, 128, 64, 48, 32, 16]
-                best_pixmap = None
-                for icon_size in preferred_sizes:
-                    file_pixmap = icon.pixmap(icon_size, icon_size)
-                    if not file_pixmap.isNull() and file_pixmap.width() > 0 and file_pixmap.height() > 0:
-                        best_pixmap = file_pixmap
-                        break
+                best_pixmap = _best_icon_pixmap(icon, size)
                 if best_pixmap:
-                    if best_pixmap.width() != size or best_pixmap.height() != size:
-                        best_pixmap = best_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                     x = (size - best_pixmap.width()) // 2
                     y = (size - best_pixmap.height()) // 2
                     painter.drawPixmap(x, y, best_pixmap)
                     return
             else:
                 icon_provider = QFileIconProvider()
-                icon = icon_provider.icon(QFileInfo(full_path))
-                if not icon.isNull():
-                    preferred_sizes = [size * 2, size, 128, 64, 48, 32, 16]
-                    for icon_size in preferred_sizes:
-                        file_pixmap = icon.pixmap(icon_size, icon_size)
-                        if not file_pixmap.isNull() and file_pixmap.width() > 0 and file_pixmap.height() > 0:
-                            if file_pixmap.width() != size or file_pixmap.height() != size:
-                                file_pixmap = file_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            x = (size - file_pixmap.width()) // 2
-                            y = (size - file_pixmap.height()) // 2
-                            painter.drawPixmap(x, y, file_pixmap)
-                            return
+                file_pixmap = _best_icon_pixmap(icon_provider.icon(QFileInfo(full_path)), size)
+                if file_pixmap:
+                    x = (size - file_pixmap.width()) // 2
+                    y = (size - file_pixmap.height()) // 2
+                    painter.drawPixmap(x, y, file_pixmap)
+                    return
         except Exception as e:
             print(f"Error getting system icon for {full_path}: {e}")
         self.draw_generic_file_icon(painter, size, False)
@@ -16506,21 +16761,10 @@ class IconWidget(QWidget):
                     type_icon = icon_provider.icon(temp_info)
                     
                     if not type_icon.isNull():
-                        # Try multiple sizes to get the best quality
-                        preferred_sizes = [256, 128, 64, 48, 32, 16]
-                        best_pixmap = None
-                        
-                        for icon_size in preferred_sizes:
-                            icon_pixmap = type_icon.pixmap(icon_size, icon_size)
-                            if not icon_pixmap.isNull() and icon_pixmap.width() > 0:
-                                best_pixmap = icon_pixmap
-                                break
+                        # Render at the best available size, scaled to the exact requested size
+                        best_pixmap = _best_icon_pixmap(type_icon, size)
                         
                         if best_pixmap:
-                            # Always scale to the exact requested size
-                            if best_pixmap.width() != size or best_pixmap.height() != size:
-                                best_pixmap = best_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            
                             x = (size - best_pixmap.width()) // 2
                             y = (size - best_pixmap.height()) // 2
                             painter.drawPixmap(x, y, best_pixmap)
@@ -16539,20 +16783,13 @@ class IconWidget(QWidget):
                     system_icon = icon_provider.icon(file_info)
                     
                     if not system_icon.isNull():
-                        # Use the same multi-size approach
-                        preferred_sizes = [256, 128, 64, 48, 32, 16]
-                        
-                        for icon_size in preferred_sizes:
-                            sys_pixmap = system_icon.pixmap(icon_size, icon_size)
-                            if not sys_pixmap.isNull() and sys_pixmap.width() > 0:
-                                # Scale to exact requested size
-                                if sys_pixmap.width() != size or sys_pixmap.height() != size:
-                                    sys_pixmap = sys_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                                
-                                x = (size - sys_pixmap.width()) // 2
-                                y = (size - sys_pixmap.height()) // 2
-                                painter.drawPixmap(x, y, sys_pixmap)
-                                return True
+                        # Use the same best-size approach
+                        sys_pixmap = _best_icon_pixmap(system_icon, size)
+                        if sys_pixmap:
+                            x = (size - sys_pixmap.width()) // 2
+                            y = (size - sys_pixmap.height()) // 2
+                            painter.drawPixmap(x, y, sys_pixmap)
+                            return True
             except Exception as e:
                 print(f"System icon extraction failed: {e}")
             
@@ -16562,17 +16799,13 @@ class IconWidget(QWidget):
             print(f"Windows icon extraction failed: {e}")
             return False
     
-    def draw_archive_icon(self, painter, archive_path, size):
-        """Draw a custom icon for archive files"""
+    def draw_archive_icon(self, painter, archive_path, size, force_custom=False):
+        """Draw a custom icon for archive files.
+
+        force_custom requests the enhanced/custom rendering for ISO images (used in
+        thumbnail mode where we prefer richer ISO thumbnails).
+        """
         try:
-            # Backwards-compatible: allow callers to force the enhanced/custom archive
-            # rendering (useful for thumbnail mode where we prefer richer ISO thumbnails)
-            force_custom = False
-            try:
-                # If caller passed a 4th arg, it'll be available in locals(); tolerate absence
-                force_custom = locals().get('force_custom', False)
-            except Exception:
-                force_custom = False
             archive_type = ArchiveManager.get_archive_type(archive_path)
             if force_custom and archive_type == '.iso':
                 try:
@@ -16591,9 +16824,7 @@ class IconWidget(QWidget):
                 if not file_pixmap.isNull():
                     painter.drawPixmap(0, 0, file_pixmap)
                     # Only add archive overlay if not a drive root (e.g., not C:/)
-                    import os
-                    # Heuristic: skip overlay for drive roots
-                    if not (os.name == 'nt' and len(archive_path) >= 2 and archive_path[1] == ':' and (archive_path.endswith('/') or archive_path.endswith('\\')) and os.path.ismount(archive_path)):
+                    if not _is_drive_root(archive_path):
                         self.draw_archive_overlay(painter, size)
                     return
             
@@ -16662,48 +16893,44 @@ class IconWidget(QWidget):
                     # - prefer shallower (root-level) paths
                     # - prefer larger file size when available
                     IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif')
-                    candidates = []
+                    # Classify and score in a single pass, tracking the best entry
+                    best_score = -1
                     for ent in entries_or_err:
                         if ent.get('is_dir'):
                             continue
-                        ext = os.path.splitext(ent['name'])[1].lower()
-                        if ext in IMAGE_EXTS:
-                            candidates.append(ent)
-                    if candidates:
-                        def _score(ent):
-                            name = (ent.get('name') or '').lower()
-                            # base score from presence of desirable keywords
-                            score = 0
-                            if 'cover' in name or 'front' in name or 'folder' in name:
-                                score += 2000
-                            # prefer root-level (fewer '/')
-                            depth = name.count('/')
-                            score += max(0, 500 - depth * 50)
-                            # prefer larger sizes (if available)
-                            try:
-                                sz = int(ent.get('size') or 0)
-                            except Exception:
-                                sz = 0
-                            # scale size contribution modestly
-                            score += min(sz, 5_000_000) // 1024
-                            return score
-
-                        best = max(candidates, key=_score)
-                        image_entry = best['name']
+                        name = (ent.get('name') or '').lower()
+                        if os.path.splitext(name)[1] not in IMAGE_EXTS:
+                            continue
+                        # base score from presence of desirable keywords
+                        score = 0
+                        if 'cover' in name or 'front' in name or 'folder' in name:
+                            score += 2000
+                        # prefer root-level (fewer '/')
+                        score += max(0, 500 - name.count('/') * 50)
+                        # prefer larger sizes (if available), scaled modestly
+                        try:
+                            sz = int(ent.get('size') or 0)
+                        except Exception:
+                            sz = 0
+                        score += min(sz, 5_000_000) >> 10
+                        if score > best_score:
+                            best_score = score
+                            image_entry = ent['name']
                 if image_entry:
                     # Prepare cache key based on ISO path + entry + size
                     cache_key_path = f"{archive_path}::{image_entry}"
                     if cache and cache.is_cached(cache_key_path, size):
                         img_pix = cache.get(cache_key_path, size)
                     else:
-                        # Extract the image to a temp file then load and cache it
-                        import tempfile
-                        import pycdlib
+                        # Extract the image into memory then load and cache it
+                        from io import BytesIO
+                        pycdlib = _get_pycdlib()
+                        if pycdlib is None:
+                            raise ArchiveError("pycdlib is not available")
                         iso = pycdlib.PyCdlib()
                         try:
                             iso.open(archive_path)
-                            tmpf = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(image_entry)[1])
-                            tmpf.close()
+                            buf = BytesIO()
                             extracted = False
                             # Build a set of candidate paths for pycdlib to try. pycdlib
                             # can require different forms (leading slash, uppercase,
@@ -16725,60 +16952,51 @@ class IconWidget(QWidget):
                             except Exception:
                                 pass
 
-                            for kw in ('iso_path', 'joliet_path', 'rr_path'):
-                                for candidate in candidates:
-                                    try:
-                                        with open(tmpf.name, 'wb') as out_f:
-                                            iso.get_file_from_iso_fp(out_f, **{kw: candidate})
-                                        extracted = True
-                                        break
-                                    except Exception as ex_get:
-                                        # If we get a pycdlib parsing error, continue trying
-                                        # other candidate forms/namespace keywords.
-                                        msg = str(ex_get).lower()
-                                        # If the error looks fatal for this candidate, continue
-                                        try:
-                                            if os.path.exists(tmpf.name):
-                                                os.remove(tmpf.name)
-                                        except Exception:
-                                            pass
-                                        continue
-                                if extracted:
+                            # Most ISOs expose a single preferred namespace: try its
+                            # canonical path form first and only sweep every
+                            # keyword/candidate combination if that fails.
+                            canonical = '/' + base.lstrip('/')
+                            if iso.has_joliet():
+                                attempts = [('joliet_path', canonical)]
+                            elif iso.has_rock_ridge():
+                                attempts = [('rr_path', canonical)]
+                            else:
+                                attempts = [('iso_path', canonical.upper() + ';1')]
+                            attempts.extend((kw, candidate)
+                                            for kw in ('iso_path', 'joliet_path', 'rr_path')
+                                            for candidate in candidates)
+                            for kw, candidate in attempts:
+                                try:
+                                    iso.get_file_from_iso_fp(buf, **{kw: candidate})
+                                    extracted = True
                                     break
+                                except (pycdlib.pycdlibexception.PyCdlibException, KeyError, OSError):
+                                    # Wrong path form/namespace for this ISO: continue trying
+                                    # other candidate forms/namespace keywords.
+                                    # Discard any partial output before the next attempt
+                                    buf.seek(0)
+                                    buf.truncate()
+                                    continue
                             iso.close()
-                            if extracted and os.path.exists(tmpf.name):
-                                try:
-                                    from PIL import Image
-                                except Exception:
-                                    Image = None
+                            if extracted:
+                                Image = _get_pil_image()
                                 if Image is None:
                                     img_pix = None
                                 else:
-                                    img = Image.open(tmpf.name).convert('RGBA')
+                                    buf.seek(0)
+                                    img = Image.open(buf).convert('RGBA')
                                     img = img.resize((size, size), Image.LANCZOS)
-                                    # Save to a cache temp PNG and load into QPixmap
-                                    cache_tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                                    img.save(cache_tmp.name, 'PNG')
-                                    cache_tmp.close()
-                                    img_pix = QPixmap(cache_tmp.name)
-                                    try:
-                                        os.remove(cache_tmp.name)
-                                    except Exception:
-                                        pass
-                                    try:
-                                        os.remove(tmpf.name)
-                                    except Exception:
-                                        pass
+                                    # Encode as PNG in memory and load into QPixmap
+                                    png_buf = BytesIO()
+                                    img.save(png_buf, 'PNG')
+                                    img_pix = QPixmap()
+                                    img_pix.loadFromData(png_buf.getvalue(), 'PNG')
                                     if cache and img_pix and not img_pix.isNull():
-                                        try:
+                                        with suppress(Exception):
                                             cache.put(cache_key_path, size, img_pix)
-                                        except Exception:
-                                            pass
                         except Exception:
-                            try:
+                            with suppress(Exception):
                                 iso.close()
-                            except Exception:
-                                pass
                             img_pix = None
             except Exception:
                 img_pix = None
@@ -16786,15 +17004,10 @@ class IconWidget(QWidget):
             # If we obtained an image pixmap, draw disc then overlay
             if img_pix and not getattr(img_pix, 'isNull', lambda: False)():
                 try:
-                    from PyQt5.QtGui import QRadialGradient
                     center = QPoint(size // 2, size // 2)
                     radius = size // 2 - 4
-                    grad = QRadialGradient(center, radius)
-                    grad.setColorAt(0.0, QColor(230, 230, 230))
-                    grad.setColorAt(0.6, QColor(200, 200, 220))
-                    grad.setColorAt(1.0, QColor(160, 160, 200))
-                    painter.setBrush(grad)
-                    painter.setPen(QPen(QColor(90, 90, 120), 2))
+                    painter.setBrush(_disc_gradient(size))
+                    painter.setPen(self._DISC_PEN)
                     painter.drawEllipse(center, radius, radius)
                     # Overlay the image centered with padding
                     padding = max(4, size // 10)
@@ -16816,23 +17029,16 @@ class IconWidget(QWidget):
             # If no image was used, and an EXE exists, draw a default EXE icon
             if had_exe:
                 try:
-                    default_pix = QPixmap(size, size)
-                    default_pix.fill(Qt.transparent)
-                    p2 = QPainter(default_pix)
-                    p2.setRenderHint(QPainter.Antialiasing)
-                    # Background box
-                    p2.setBrush(QColor(240, 240, 240))
-                    p2.setPen(QPen(QColor(60, 60, 60), 2))
-                    rect = QRect(4, 4, size - 8, size - 8)
-                    p2.drawRoundedRect(rect, 6, 6)
-                    # EXE label
-                    font = p2.font()
-                    font.setBold(True)
-                    font.setPointSize(max(8, size // 6))
-                    p2.setFont(font)
-                    p2.setPen(QColor(30, 30, 30))
-                    p2.drawText(rect, Qt.AlignCenter, 'EXE')
-                    p2.end()
+                    default_pix = self._exe_default_pix.get(size)
+                    if default_pix is None:
+                        default_pix = QPixmap(size, size)
+                        default_pix.fill(Qt.transparent)
+                        badge_painter = QPainter(default_pix)
+                        try:
+                            self._draw_default_exe_badge(badge_painter, size)
+                        finally:
+                            badge_painter.end()
+                        self._exe_default_pix[size] = default_pix
                     painter.drawPixmap(0, 0, default_pix)
                     return
                 except Exception:
@@ -16841,24 +17047,19 @@ class IconWidget(QWidget):
             # (Duplicate image-extraction block removed: images are attempted above first.)
             # Fallback: draw disc-style icon
             try:
-                from PyQt5.QtGui import QRadialGradient
                 center = QPoint(size // 2, size // 2)
                 radius = size // 2 - 4
-                grad = QRadialGradient(center, radius)
-                grad.setColorAt(0.0, QColor(230, 230, 230))
-                grad.setColorAt(0.6, QColor(200, 200, 220))
-                grad.setColorAt(1.0, QColor(160, 160, 200))
-                painter.setBrush(grad)
-                painter.setPen(QPen(QColor(90, 90, 120), 2))
+                painter.setBrush(_disc_gradient(size))
+                painter.setPen(self._DISC_PEN)
                 painter.drawEllipse(center, radius, radius)
                 # Inner shiny ring
                 inner_radius = max(6, size // 6)
-                painter.setBrush(QColor(240, 240, 255, 200))
-                painter.setPen(QPen(QColor(120, 120, 140), 1))
+                painter.setBrush(self._DISC_RING_BRUSH)
+                painter.setPen(self._DISC_RING_PEN)
                 painter.drawEllipse(center, inner_radius, inner_radius)
                 # Small central hole
                 hole_radius = max(3, size // 14)
-                painter.setBrush(QColor(20, 20, 20))
+                painter.setBrush(self._DISC_HOLE_BRUSH)
                 painter.drawEllipse(center, hole_radius, hole_radius)
                 # Draw 'ISO' label at bottom
                 font = painter.font()
@@ -16906,6 +17107,31 @@ class IconWidget(QWidget):
             text_rect = QRect(margin, size - margin - size//4, size - 2*margin, size//4)
             painter.drawText(text_rect, Qt.AlignCenter, label)
 
+    def _draw_default_exe_badge(self, painter, size):
+        """Draw the generic 'EXE' badge used when an ISO contains executables.
+
+        Renders into the painter of the per-size _exe_default_pix entry once; painter state
+        is saved/restored and the font is set explicitly, so nothing leaks in or out.
+        """
+        painter.save()
+        try:
+            painter.setClipRect(0, 0, size, size)
+            painter.setRenderHint(QPainter.Antialiasing)
+            # Background box
+            painter.setBrush(self._EXE_BADGE_BRUSH)
+            painter.setPen(self._EXE_BADGE_PEN)
+            rect = QRect(4, 4, size - 8, size - 8)
+            painter.drawRoundedRect(rect, 6, 6)
+            # EXE label
+            font = QFont()
+            font.setBold(True)
+            font.setPointSize(max(8, size // 6))
+            painter.setFont(font)
+            painter.setPen(QColor(30, 30, 30))
+            painter.drawText(rect, Qt.AlignCenter, 'EXE')
+        finally:
+            painter.restore()
+
     def draw_generic_file_icon(self, painter, size, is_dir):
         """Draw a simple generic icon when system icons fail"""
         try:
@@ -16954,17 +17180,279 @@ class IconWidget(QWidget):
             painter.setPen(QPen(Qt.gray, 1))
             painter.drawRect(size//4, size//4, size//2, size//2)
 
+    def _scan_folder_preview(self, folder_path):
+        """Classify the first entries of folder_path for the composite folder preview.
+
+        Results are cached per folder and reused until the folder's mtime changes,
+        so repainting an unchanged folder does not re-list and re-stat its entries.
+        """
+        try:
+            mtime_ns = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = _folder_preview_cache.get(folder_path)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Supported extensions for previews
+        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico'}
+        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.wmv', '.flv', '.mpg', '.mpeg', '.3gp'}
+        audio_extensions = {'.wav', '.mp3', '.flac', '.ogg', '.oga', '.aac', '.m4a', '.wma', '.opus', '.aiff', '.alac'}
+        pdf_extensions = {'.pdf'}
+        text_extensions = {'.txt', '.md', '.log', '.ini', '.csv', '.json', '.xml', '.py', '.c', '.cpp', '.h', '.java', '.js', '.html', '.css', '.qss', '.gsfmt', 'LICENSE'}
+        docx_extensions = {'.docx', '.doc'}
+        exe_extensions = {'.exe'}
+        preview_files = []
+        # Platform-specific file filtering
+        if PlatformUtils.is_macos():
+            is_hidden = lambda name: name.startswith('.')
+        elif PlatformUtils.is_windows():
+            is_hidden = lambda name: name.lower() in ('thumbs.db', 'desktop.ini')
+        else:  # Linux/Unix
+            is_hidden = lambda name: name.startswith('.')
+        # Limit the number of files scanned for previews to the first 20 for performance.
+        # os.scandir exposes the entry type without an extra stat() per entry.
+        entries = []
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if is_hidden(entry.name):
+                    continue
+                entries.append(entry)
+                if len(entries) >= 20:
+                    break
+        only_folders = True
+        only_isos = True
+        only_archives = True
+        folder_paths = []
+        iso_paths = []
+        archive_paths = []
+        # Regular files in scan order, used to fill slots left over by previews.
+        # preview_files entries are (type, path, index into file_paths, file mtime_ns);
+        # the mtime comes from the DirEntry so slot lookups never stat() again.
+        file_paths = []
+        for entry in entries:
+            file_ext = os.path.splitext(entry.name)[1].lower()
+            file_path = entry.path
+            if entry.is_file():
+                try:
+                    file_mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    file_mtime_ns = 0
+                index = len(file_paths)
+                file_paths.append(file_path)
+                only_folders = False
+                if file_ext == '.iso':
+                    iso_paths.append(file_path)
+                    # Add ISO as a preview type (after other thumbnails)
+                    preview_files.append((PreviewType.ISO, file_path, index, file_mtime_ns))
+                else:
+                    only_isos = False
+                if file_ext in {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.tgz', '.tbz2', '.lz', '.lzma', '.z', '.cab', '.arj', '.ace', '.jar'}:
+                    archive_paths.append(file_path)
+                    preview_files.append((PreviewType.ARCHIVE, file_path, index, file_mtime_ns))
+                else:
+                    only_archives = False
+                if file_ext in image_extensions and _is_safe_image_cached(file_path, file_mtime_ns):
+                    preview_files.append((PreviewType.IMAGE, file_path, index, file_mtime_ns))
+                elif file_ext in video_extensions:
+                    preview_files.append((PreviewType.VIDEO, file_path, index, file_mtime_ns))
+                elif file_ext in audio_extensions:
+                    preview_files.append((PreviewType.AUDIO, file_path, index, file_mtime_ns))
+                elif file_ext in pdf_extensions:
+                    preview_files.append((PreviewType.PDF, file_path, index, file_mtime_ns))
+                elif file_ext in text_extensions or entry.name.upper() in ['LICENSE', 'LICENCE', 'COPYRIGHT', 'COPYING']:
+                    preview_files.append((PreviewType.TEXT, file_path, index, file_mtime_ns))
+                elif file_ext in docx_extensions:
+                    preview_files.append((PreviewType.DOCX, file_path, index, file_mtime_ns))
+                elif file_ext in exe_extensions:
+                    preview_files.append((PreviewType.EXE, file_path, index, file_mtime_ns))
+            elif entry.is_dir():
+                only_isos = False
+                only_archives = False
+                folder_paths.append(file_path)
+        result = (file_paths, preview_files, folder_paths, iso_paths, archive_paths,
+                  only_folders, only_isos, only_archives)
+        if mtime_ns is not None:
+            if len(_folder_preview_cache) >= _FOLDER_PREVIEW_CACHE_MAX:
+                _folder_preview_cache.pop(next(iter(_folder_preview_cache)))
+            _folder_preview_cache[folder_path] = (mtime_ns, result)
+        return result
+
+    # Folder-preview slot generators used on a thumbnail-cache miss, by preview type.
+    # Types without an entry use the regular create_icon_or_thumbnail rendering.
+    _PREVIEW_GENERATORS = {
+        PreviewType.AUDIO: lambda fpath, size: get_waveform_thumbnail(fpath, width=size, height=size),
+    }
+
+    def _resolve_preview_thumbnail(self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images):
+        """Return the folder-preview slot pixmap for a video/audio/pdf/text/docx file.
+
+        Finished slot pixmaps live in QPixmapCache, so a hit is a cheap implicitly
+        shared copy with no PNG decode or scaling.
+        """
+        slot_key = _folder_thumb_key(fpath, mtime_ns, preview_size)
+        thumbnail = QPixmapCache.find(slot_key)
+        if thumbnail is not None:
+            return thumbnail
+        thumb = tcache.get(fpath, preview_size) if tcache else None
+        if isinstance(thumb, QPixmap) and not thumb.isNull():
+            thumbnail = _fit_pixmap(thumb, preview_size)
+        else:
+            generator = self._PREVIEW_GENERATORS.get(ftype)
+            if generator is not None:
+                try:
+                    thumbnail = generator(fpath, preview_size)
+                except Exception:
+                    thumbnail = None
+        if thumbnail is None:
+            thumbnail = self.create_icon_or_thumbnail(fpath, False)
+        if thumbnail is not None and not thumbnail.isNull():
+            # Generators already render at preview_size; only foreign sizes get rescaled
+            thumbnail = _fit_pixmap(thumbnail, preview_size)
+            QPixmapCache.insert(slot_key, thumbnail)
+        return thumbnail
+
+    def _image_preview_slot(self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images):
+        """Return the folder-preview slot pixmap for an image file"""
+        thumbnail = QPixmapCache.find(_folder_thumb_key(fpath, mtime_ns, preview_size))
+        if thumbnail is None and fpath in pending_images:
+            # Placeholder frame until the background decode finishes
+            return QPixmap()
+        if thumbnail is None:
+            img_pixmap = _read_scaled_pixmap(fpath, preview_size)
+            if not img_pixmap.isNull():
+                thumbnail = img_pixmap
+        return thumbnail
+
+    def _exe_preview_slot(self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images):
+        """Return the folder-preview slot pixmap for an executable"""
+        return get_exe_icon_qicon(fpath, size=preview_size).pixmap(preview_size, preview_size)
+
+    def _archive_preview_slot(self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images):
+        """Return the folder-preview slot pixmap for an archive (its file type icon)"""
+        return _file_icon_pixmap(fpath, preview_size)
+
+    def _iso_preview_slot(self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images):
+        """Return the folder-preview slot pixmap for an ISO image.
+
+        Uses the icon of an EXE inside the ISO when there is one; ISOs without one
+        are remembered so repaints skip the ISO9660 scan.
+        """
+        iso_key = _folder_thumb_key(fpath, mtime_ns, preview_size)
+        thumbnail = QPixmapCache.find(iso_key)
+        if thumbnail is None and iso_key not in _iso_icon_misses:
+            try:
+                thumbnail = ArchiveManager.extract_exe_icon_from_iso(fpath, size=preview_size)
+            except Exception:
+                thumbnail = None
+            if thumbnail and not thumbnail.isNull():
+                QPixmapCache.insert(iso_key, thumbnail)
+            else:
+                if len(_iso_icon_misses) >= _ISO_ICON_MISSES_MAX:
+                    _iso_icon_misses.clear()
+                _iso_icon_misses.add(iso_key)
+        if not thumbnail or thumbnail.isNull():
+            thumbnail = _file_icon_pixmap(fpath, preview_size)
+        return thumbnail
+
+    # Folder-preview slot renderers, indexed by PreviewType
+    _PREVIEW_SLOT_HANDLERS = (
+        _image_preview_slot,          # IMAGE
+        _resolve_preview_thumbnail,   # VIDEO
+        _resolve_preview_thumbnail,   # AUDIO
+        _resolve_preview_thumbnail,   # PDF
+        _resolve_preview_thumbnail,   # TEXT
+        _resolve_preview_thumbnail,   # DOCX
+        _exe_preview_slot,            # EXE
+        _archive_preview_slot,        # ARCHIVE
+        _iso_preview_slot,            # ISO
+    )
+
+    def _submit_preview_image_job(self, folder_path, preview_files, preview_size):
+        """Queue background decoding of the folder's uncached image slots.
+
+        Returns the set of image paths that are (still) being decoded. Returns an
+        empty set when PIL is unavailable, in which case images load synchronously.
+        """
+        tcache = getattr(self, 'thumbnail_cache', None)
+        paths = []
+        mtimes = {}
+        for ftype, fpath, _, mtime_ns in preview_files:
+            if ftype != PreviewType.IMAGE or (fpath, mtime_ns) in _failed_preview_images:
+                continue
+            key = _folder_thumb_key(fpath, mtime_ns, preview_size)
+            if QPixmapCache.find(key) is not None:
+                continue
+            # Scaled slots persist across restarts in the on-disk thumbnail cache,
+            # which invalidates entries when the image's mtime or size changes
+            if tcache:
+                try:
+                    cached = tcache.get(fpath, preview_size, namespace=_FOLDER_SLOT_NAMESPACE)
+                except Exception:
+                    cached = None
+                if isinstance(cached, QPixmap) and not cached.isNull():
+                    QPixmapCache.insert(key, cached)
+                    continue
+            paths.append(fpath)
+            mtimes[fpath] = mtime_ns
+        paths = paths[:4]
+        if not paths or _get_pil_image() is None:
+            return set()
+        job_key = (folder_path, preview_size)
+        waiters = _pending_preview_jobs.get(job_key)
+        if waiters is None:
+            waiters = _pending_preview_jobs[job_key] = weakref.WeakSet()
+            future = _get_preview_executor().submit(_decode_preview_images, paths, preview_size)
+
+            def _on_done(fut, job_key=job_key):
+                try:
+                    results = fut.result()
+                except Exception:
+                    results = [(path, None) for path in paths]
+                GuiInvoker.instance().invoke.emit(
+                    lambda: self._apply_decoded_previews(job_key, results, mtimes))
+
+            future.add_done_callback(_on_done)
+        # Other widgets showing the same folder (another tab, a resize) share the job
+        waiters.add(self)
+        return set(paths)
+
+    def _apply_decoded_previews(self, job_key, results, mtimes):
+        """GUI-thread half of the folder-preview decode: cache pixmaps and repaint every waiting widget (mtimes: {path: mtime_ns} from the scan)"""
+        waiters = _pending_preview_jobs.pop(job_key, ())
+        preview_size = job_key[1]
+        tcache = getattr(self, 'thumbnail_cache', None)
+        for path, data in results:
+            pixmap = QPixmap()
+            if data and pixmap.loadFromData(data, 'PNG'):
+                QPixmapCache.insert(_folder_thumb_key(path, mtimes[path], preview_size), pixmap)
+                if tcache:
+                    with suppress(Exception):
+                        tcache.put(path, preview_size, data, namespace=_FOLDER_SLOT_NAMESPACE)
+            else:
+                _failed_preview_images.add((path, mtimes[path]))
+        for widget in list(waiters):
+            try:
+                if widget.is_dir and widget.full_path == job_key[0]:
+                    widget.icon_label.setPixmap(widget.create_icon_or_thumbnail(widget.full_path, widget.is_dir))
+                    widget.update()
+            except RuntimeError:
+                # Widget was deleted while the decode was running
+                pass
+
     def create_folder_preview(self, folder_path, size):
         """Create a folder icon with preview thumbnails of images inside"""
-        preview_pixmap = QPixmap(size, size)
-        preview_pixmap.fill(Qt.transparent)
+        # Compose everything into one raster image and convert to a pixmap once at the end
+        preview_image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        preview_image.fill(Qt.transparent)
         
-        painter = QPainter(preview_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Everything drawn here is an integer-positioned pixmap or axis-aligned rect,
+        # so the painter stays on the non-antialiased raster path
+        painter = QPainter(preview_image)
         
         # Start with the default folder icon as background
         try:
-            icon_provider = QFileIconProvider()
+            icon_provider = _get_icon_provider()
             
             if PlatformUtils.is_windows():
                 # On Windows, try to get the actual folder icon for the specific path
@@ -16977,21 +17465,10 @@ class IconWidget(QWidget):
                 folder_icon = icon_provider.icon(QFileIconProvider.Folder)
             
             if not folder_icon.isNull():
-                # Try different sizes for better quality at all thumbnail sizes
-                preferred_sizes = [256, 128, 64, 48, 32, 16]
-                folder_pixmap = None
-                
-                for icon_size in preferred_sizes:
-                    temp_pixmap = folder_icon.pixmap(icon_size, icon_size)
-                    if not temp_pixmap.isNull() and temp_pixmap.width() > 0 and temp_pixmap.height() > 0:
-                        folder_pixmap = temp_pixmap
-                        break
+                # Render at the best available size, scaled to the exact requested size
+                folder_pixmap = _best_icon_pixmap(folder_icon, size)
                 
                 if folder_pixmap:
-                    # Always scale to the exact requested size for consistency
-                    if folder_pixmap.width() != size or folder_pixmap.height() != size:
-                        folder_pixmap = folder_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    
                     # Center and draw the folder icon
                     x = (size - folder_pixmap.width()) // 2
                     y = (size - folder_pixmap.height()) // 2
@@ -17007,247 +17484,102 @@ class IconWidget(QWidget):
         
         # Try to find previewable files in the folder (image, video, exe)
         try:
-            # Supported extensions for previews
-            image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico'}
-            video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.wmv', '.flv', '.mpg', '.mpeg', '.3gp'}
-            audio_extensions = {'.wav', '.mp3', '.flac', '.ogg', '.oga', '.aac', '.m4a', '.wma', '.opus', '.aiff', '.alac'}
-            pdf_extensions = {'.pdf'}
-            text_extensions = {'.txt', '.md', '.log', '.ini', '.csv', '.json', '.xml', '.py', '.c', '.cpp', '.h', '.java', '.js', '.html', '.css', '.qss', '.gsfmt', 'LICENSE'}
-            docx_extensions = {'.docx', '.doc'}
-            exe_extensions = {'.exe'}
-            preview_files = []
-            files = os.listdir(folder_path)
-            # Platform-specific file filtering
-            if PlatformUtils.is_macos():
-                files = [f for f in files if not f.startswith('.') and not f.startswith('._')]
-            elif PlatformUtils.is_windows():
-                files = [f for f in files if f.lower() not in ('thumbs.db', 'desktop.ini')]
-            else:  # Linux/Unix
-                files = [f for f in files if not f.startswith('.')]
-            # Limit the number of files scanned for previews to the first 20 for performance
-            files = files[:20]
-            only_folders = True
-            only_isos = True
-            only_archives = True
-            folder_paths = []
-            iso_paths = []
-            archive_paths = []
-            for file_name in files:
-                file_ext = os.path.splitext(file_name)[1].lower()
-                file_path = os.path.join(folder_path, file_name)
-                if os.path.isfile(file_path):
-                    only_folders = False
-                    if file_ext == '.iso':
-                        iso_paths.append(file_path)
-                        # Add ISO as a preview type (after other thumbnails)
-                        preview_files.append(('iso', file_path))
-                    else:
-                        only_isos = False
-                    if file_ext in {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.tgz', '.tbz2', '.lz', '.lzma', '.z', '.cab', '.arj', '.ace', '.jar'}:
-                        archive_paths.append(file_path)
-                        preview_files.append(('archive', file_path))
-                    else:
-                        only_archives = False
-                    if file_ext in image_extensions and self.is_safe_image_file(file_path):
-                        preview_files.append(('image', file_path))
-                    elif file_ext in video_extensions:
-                        preview_files.append(('video', file_path))
-                    elif file_ext in audio_extensions:
-                        preview_files.append(('audio', file_path))
-                    elif file_ext in pdf_extensions:
-                        preview_files.append(('pdf', file_path))
-                    elif file_ext in text_extensions or os.path.basename(file_path).upper() in ['LICENSE', 'LICENCE', 'COPYRIGHT', 'COPYING']:
-                        preview_files.append(('text', file_path))
-                    elif file_ext in docx_extensions:
-                        preview_files.append(('docx', file_path))
-                    elif file_ext in exe_extensions:
-                        preview_files.append(('exe', file_path))
-                elif os.path.isdir(file_path):
-                    only_isos = False
-                    only_archives = False
-                    folder_paths.append(file_path)
+            (file_paths, preview_files, folder_paths, iso_paths, archive_paths,
+             only_folders, only_isos, only_archives) = self._scan_folder_preview(folder_path)
+            # Up to 4 small preview slots in the top-right corner (same for every branch)
+            preview_size = max(8, size // 4)
+            positions = (
+                (size - preview_size - 2, 2),
+                (size - preview_size - 2, preview_size + 4),
+                (size - preview_size * 2 - 4, 2),
+                (size - preview_size * 2 - 4, preview_size + 4),
+            )
             if only_archives and archive_paths:
                 # Composite up to 4 small archive icons
-                preview_size = max(8, size // 4)
-                positions = [
-                    (size - preview_size - 2, 2),
-                    (size - preview_size - 2, preview_size + 4),
-                    (size - preview_size * 2 - 4, 2),
-                    (size - preview_size * 2 - 4, preview_size + 4)
-                ]
-                icon_provider = QFileIconProvider()
                 for i, archive in enumerate(archive_paths[:4]):
-                    archive_icon = icon_provider.icon(QFileInfo(archive))
-                    if archive_icon.isNull():
-                        archive_icon = icon_provider.icon(QFileIconProvider.File)
-                    archive_pixmap = archive_icon.pixmap(preview_size, preview_size)
+                    archive_pixmap = _file_icon_pixmap(archive, preview_size)
                     pos_x, pos_y = positions[i]
                     painter.drawPixmap(pos_x, pos_y, archive_pixmap)
             elif only_isos and iso_paths:
                 # Composite up to 4 small ISO icons
-                preview_size = max(8, size // 4)
-                positions = [
-                    (size - preview_size - 2, 2),
-                    (size - preview_size - 2, preview_size + 4),
-                    (size - preview_size * 2 - 4, 2),
-                    (size - preview_size * 2 - 4, preview_size + 4)
-                ]
                 # Use a generic CD/DVD icon for ISO, or fallback to exe icon if not available
-                icon_provider = QFileIconProvider()
                 for i, iso in enumerate(iso_paths[:4]):
-                    iso_icon = icon_provider.icon(QFileInfo(iso))
-                    if iso_icon.isNull():
-                        iso_icon = icon_provider.icon(QFileIconProvider.File)
-                    iso_pixmap = iso_icon.pixmap(preview_size, preview_size)
+                    iso_pixmap = _file_icon_pixmap(iso, preview_size)
                     pos_x, pos_y = positions[i]
                     painter.drawPixmap(pos_x, pos_y, iso_pixmap)
             elif only_folders and folder_paths:
                 # Composite up to 4 small folder icons
-                preview_size = max(8, size // 4)
-                positions = [
-                    (size - preview_size - 2, 2),
-                    (size - preview_size - 2, preview_size + 4),
-                    (size - preview_size * 2 - 4, 2),
-                    (size - preview_size * 2 - 4, preview_size + 4)
-                ]
-                icon_provider = QFileIconProvider()
-                for i, subfolder in enumerate(folder_paths[:4]):
-                    try:
-                        folder_icon = icon_provider.icon(QFileIconProvider.Folder)
-                        folder_pixmap = folder_icon.pixmap(preview_size, preview_size)
-                        pos_x, pos_y = positions[i]
-                        painter.drawPixmap(pos_x, pos_y, folder_pixmap)
-                    except Exception:
-                        continue
+                # Every slot shows the same folder pixmap, so submit all of them
+                # in a single batched drawPixmapFragments call
+                try:
+                    folder_pixmap = _standard_icon_pixmap(QFileIconProvider.Folder, preview_size)
+                    half_w = folder_pixmap.width() / 2
+                    half_h = folder_pixmap.height() / 2
+                    source = QRectF(folder_pixmap.rect())
+                    fragments = [
+                        QPainter.PixmapFragment.create(QPointF(pos_x + half_w, pos_y + half_h), source)
+                        for pos_x, pos_y in positions[:len(folder_paths[:4])]
+                    ]
+                    painter.drawPixmapFragments(fragments, folder_pixmap)
+                except Exception:
+                    pass
             elif preview_files:
-                preview_size = max(8, size // 4)
-                positions = [
-                    (size - preview_size - 2, 2),
-                    (size - preview_size - 2, preview_size + 4),
-                    (size - preview_size * 2 - 4, 2),
-                    (size - preview_size * 2 - 4, preview_size + 4)
-                ]
+                # Decode image slots in the background; until they arrive the
+                # slots are drawn as empty placeholder frames
+                pending_images = self._submit_preview_image_job(folder_path, preview_files, preview_size)
                 # Compose up to 4: prefer thumbnails, fill with icons if needed
                 composited = 0
-                used_files = set()
+                used_indices = set()
+                slot_rects = []
+                tcache = getattr(self, 'thumbnail_cache', None)
+                slot_handlers = self._PREVIEW_SLOT_HANDLERS
                 # 1. Try to composite all available thumbnails first
-                for ftype, fpath in preview_files:
+                for ftype, fpath, index, mtime_ns in preview_files:
                     if composited >= 4:
                         break
                     try:
-                        thumbnail = None
-                        if ftype == 'image':
-                            img_pixmap = QPixmap(fpath)
-                            if not img_pixmap.isNull() and img_pixmap.width() > 0 and img_pixmap.height() > 0:
-                                thumbnail = img_pixmap.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        elif ftype == 'video':
-                            thumb = None
-                            if hasattr(self, 'thumbnail_cache') and self.thumbnail_cache:
-                                thumb = self.thumbnail_cache.get(fpath, preview_size)
-                            if not thumb:
-                                try:
-                                    from PyQt5.QtMultimedia import QMediaPlayer, QVideoWidget
-                                except Exception:
-                                    pass
-                            if thumb:
-                                if isinstance(thumb, (bytes, bytearray)):
-                                    img_pixmap = QPixmap()
-                                    img_pixmap.loadFromData(thumb, 'PNG')
-                                    if not img_pixmap.isNull():
-                                        thumbnail = img_pixmap.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                                elif isinstance(thumb, QPixmap):
-                                    thumbnail = thumb.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            if thumbnail is None:
-                                thumbnail = self.create_icon_or_thumbnail(fpath, False)
-                        elif ftype == 'audio':
-                            thumb = None
-                            if hasattr(self, 'thumbnail_cache') and self.thumbnail_cache:
-                                thumb = self.thumbnail_cache.get(fpath, preview_size)
-                            if not thumb:
-                                try:
-                                    thumbnail = get_waveform_thumbnail(fpath, width=preview_size, height=preview_size)
-                                except Exception:
-                                    thumbnail = None
-                            if thumb and thumbnail is None:
-                                if isinstance(thumb, (bytes, bytearray)):
-                                    img_pixmap = QPixmap()
-                                    img_pixmap.loadFromData(thumb, 'PNG')
-                                    if not img_pixmap.isNull():
-                                        thumbnail = img_pixmap.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                                elif isinstance(thumb, QPixmap):
-                                    thumbnail = thumb.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            if thumbnail is None:
-                                thumbnail = self.create_icon_or_thumbnail(fpath, False)
-                        elif ftype == 'pdf' or ftype == 'text' or ftype == 'docx':
-                            thumb = None
-                            if hasattr(self, 'thumbnail_cache') and self.thumbnail_cache:
-                                thumb = self.thumbnail_cache.get(fpath, preview_size)
-                            if not thumb:
-                                try:
-                                    thumbnail = self.create_icon_or_thumbnail(fpath, False)
-                                except Exception:
-                                    thumbnail = None
-                            if thumb and thumbnail is None:
-                                if isinstance(thumb, (bytes, bytearray)):
-                                    img_pixmap = QPixmap()
-                                    img_pixmap.loadFromData(thumb, 'PNG')
-                                    if not img_pixmap.isNull():
-                                        thumbnail = img_pixmap.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                                elif isinstance(thumb, QPixmap):
-                                    thumbnail = thumb.scaled(preview_size, preview_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            if thumbnail is None:
-                                thumbnail = self.create_icon_or_thumbnail(fpath, False)
-                        elif ftype == 'exe':
-                            icon = get_exe_icon_qicon(fpath, size=preview_size)
-                            thumbnail = icon.pixmap(preview_size, preview_size)
-                        elif ftype == 'archive':
-                            # Use the file type icon for the archive as a thumbnail
-                            icon = icon_provider.icon(QFileInfo(fpath))
-                            if icon.isNull():
-                                icon = icon_provider.icon(QFileIconProvider.File)
-                            thumbnail = icon.pixmap(preview_size, preview_size)
-                        elif ftype == 'iso':
-                            # Try to extract EXE icon from ISO for thumbnail
-                            try:
-                                thumbnail = ArchiveManager.extract_exe_icon_from_iso(fpath, size=preview_size)
-                            except Exception:
-                                thumbnail = None
-                            if not thumbnail or thumbnail.isNull():
-                                icon = icon_provider.icon(QFileInfo(fpath))
-                                if icon.isNull():
-                                    icon = icon_provider.icon(QFileIconProvider.File)
-                                thumbnail = icon.pixmap(preview_size, preview_size)
-                        else:
-                            continue
+                        thumbnail = slot_handlers[ftype](self, ftype, fpath, mtime_ns, preview_size, tcache, pending_images)
                         if thumbnail is not None:
-                            preview_frame = QPixmap(preview_size, preview_size)
-                            preview_frame.fill(Qt.white)
-                            frame_painter = QPainter(preview_frame)
-                            frame_painter.setRenderHint(QPainter.Antialiasing)
-                            thumb_x = (preview_size - thumbnail.width()) // 2
-                            thumb_y = (preview_size - thumbnail.height()) // 2
-                            frame_painter.drawPixmap(thumb_x, thumb_y, thumbnail)
-                            pen = QPen(Qt.darkGray, 1)
-                            frame_painter.setPen(pen)
-                            frame_painter.drawRect(0, 0, preview_size - 1, preview_size - 1)
-                            frame_painter.end()
+                            # Draw the slot straight onto the preview in slot-local
+                            # coordinates: the opaque white background needs no
+                            # blending, so use CompositionMode_Source
                             pos_x, pos_y = positions[composited]
-                            painter.drawPixmap(pos_x, pos_y, preview_frame)
-                            used_files.add(fpath)
+                            # save/restore so a failure mid-slot cannot leave the offset or
+                            # composition mode behind for the next slot
+                            painter.save()
+                            try:
+                                painter.translate(pos_x, pos_y)
+                                painter.setCompositionMode(QPainter.CompositionMode_Source)
+                                painter.fillRect(0, 0, preview_size, preview_size, self._SLOT_FILL_BRUSH)
+                                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+                                # Center the thumbnail, cropping anything outside the slot
+                                thumb_x = (preview_size - thumbnail.width()) // 2
+                                thumb_y = (preview_size - thumbnail.height()) // 2
+                                src_x = max(0, -thumb_x)
+                                src_y = max(0, -thumb_y)
+                                painter.drawPixmap(max(0, thumb_x), max(0, thumb_y), thumbnail,
+                                                   src_x, src_y,
+                                                   min(thumbnail.width() - src_x, preview_size),
+                                                   min(thumbnail.height() - src_y, preview_size))
+                            finally:
+                                painter.restore()
+                            slot_rects.append(QRect(pos_x, pos_y, preview_size - 1, preview_size - 1))
+                            used_indices.add(index)
                             composited += 1
                     except Exception:
                         continue
+                # Stroke all slot borders in one call
+                if slot_rects:
+                    painter.setPen(self._SLOT_BORDER_PEN)
+                    painter.setBrush(Qt.NoBrush)
+                    painter.drawRects(slot_rects)
                 # 2. Fill remaining slots with icons for other files
                 if composited < 4:
-                    for file_name in files:
+                    for index, file_path in enumerate(file_paths):
                         if composited >= 4:
                             break
-                        file_path = os.path.join(folder_path, file_name)
-                        if os.path.isfile(file_path) and file_path not in used_files:
-                            icon = icon_provider.icon(QFileInfo(file_path))
-                            if icon.isNull():
-                                icon = icon_provider.icon(QFileIconProvider.File)
-                            icon_pixmap = icon.pixmap(preview_size, preview_size)
+                        if index not in used_indices:
+                            icon_pixmap = _file_icon_pixmap(file_path, preview_size)
                             pos_x, pos_y = positions[composited]
                             painter.drawPixmap(pos_x, pos_y, icon_pixmap)
                             composited += 1
@@ -17255,17 +17587,7 @@ class IconWidget(QWidget):
             pass
         
         painter.end()
-        return preview_pixmap
-
-    def mousePressEvent(self, event):
-        try:
-            icon_container_debug('mousePressEvent button={} pos={} global={} modifiers={}', getattr(event, 'button', lambda: None)(), getattr(event, 'pos', lambda: '<no-pos>')(), getattr(event, 'globalPos', lambda: '<no-global>')(), getattr(event, 'modifiers', lambda: 0)())
-        except Exception:
-            pass
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.full_path, event.modifiers())
-        elif event.button() == Qt.RightButton:
-            self.rightClicked.emit(self.full_path, event.globalPos())
+        return QPixmap.fromImage(preview_image)
 
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -17288,26 +17610,40 @@ class IconWidget(QWidget):
         else:
             super().mousePressEvent(event)
 
+    def _drag_pixmap(self):
+        """Return the 64px drag image for the current icon, rescaled only when the icon changes"""
+        pix = self.icon_label.pixmap()
+        if pix is None or pix.isNull():
+            return None
+        cached = getattr(self, '_drag_pix_cache', None)
+        if cached is None or cached[0] != pix.cacheKey():
+            cached = (pix.cacheKey(), pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self._drag_pix_cache = cached
+        return cached[1]
+
+    def _find_container(self):
+        """Return the IconContainer ancestor, cached until the widget is reparented"""
+        container = getattr(self, '_container', None)
+        if container is None:
+            container = self.parent()
+            while container is not None and not isinstance(container, IconContainer):
+                container = container.parent()
+            self._container = container
+        return container
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.ParentChange:
+            self._container = None
+        super().changeEvent(event)
+
     def mouseMoveEvent(self, event):
         # Start drag if moved beyond threshold
-        try:
-            from PyQt5.QtCore import QUrl, QMimeData
-            from PyQt5.QtWidgets import QApplication
-            from PyQt5.QtGui import QDrag
-        except Exception:
-            # If imports fail for any reason, fall back to default handling
-            super().mouseMoveEvent(event)
-            return
-
         if hasattr(self, '_press_pos') and event.buttons() & Qt.LeftButton:
             dist = (event.pos() - self._press_pos).manhattanLength()
             start_dist = QApplication.startDragDistance()
-            print(f"[DRAG-DEBUG] mouseMoveEvent: pos={event.pos()}, press_pos={self._press_pos}, dist={dist}, threshold={start_dist}")
             if dist >= start_dist:
                 # Determine selected items (support multi-select)
-                container = self.parent()
-                while container is not None and not isinstance(container, IconContainer):
-                    container = container.parent()
+                container = self._find_container()
                 if container and getattr(container, 'selected_widgets', None):
                     paths = [w.full_path for w in container.selected_widgets]
                 else:
@@ -17320,15 +17656,13 @@ class IconWidget(QWidget):
                 drag.setMimeData(mime)
                 # Set a drag pixmap from the icon for visual feedback
                 try:
-                    pix = self.icon_label.pixmap()
-                    if pix and not pix.isNull():
-                        drag_pix = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    drag_pix = self._drag_pixmap()
+                    if drag_pix is not None:
                         drag.setPixmap(drag_pix)
                 except Exception as e:
-                    print(f"[DRAG-DEBUG] failed to set drag pixmap: {e}")
+                    icon_container_debug('failed to set drag pixmap: {}', e)
 
-
-                print(f"[DRAG-DEBUG] Starting drag for paths: {paths}")
+                icon_container_debug('Starting drag for paths: {}', paths)
 
                 # If dragging to browser, use CopyAction. If dragging to a directory in-app, ask user.
                 drop_action = Qt.CopyAction
@@ -17336,8 +17670,6 @@ class IconWidget(QWidget):
                 # If so, ask user whether to Move or Copy
                 # This is a heuristic: if QApplication.widgetAt(QCursor.pos()) is an IconContainer, treat as internal
                 try:
-                    from PyQt5.QtWidgets import QApplication, QMessageBox
-                    from PyQt5.QtGui import QCursor
                     widget = QApplication.widgetAt(QCursor.pos())
                     if widget is not None:
                         # Check if it's a directory drop target (IconContainer or similar)
@@ -17349,7 +17681,7 @@ class IconWidget(QWidget):
                             else:
                                 drop_action = Qt.CopyAction
                 except Exception as e:
-                    print(f"[DRAG-DEBUG] Could not determine drop target: {e}")
+                    icon_container_debug('Could not determine drop target: {}', e)
 
                 drag.exec_(drop_action)
                 # Clear press pos so we don't restart drag
@@ -17366,6 +17698,10 @@ class IconContainer(QWidget):
     emptySpaceRightClicked = pyqtSignal(QPoint)
     selectionChanged = pyqtSignal(list)
 
+    # Selection overlay drawn under selected icons in paintEvent
+    _SELECTION_PEN = QPen(QColor(0, 120, 212), 2)
+    _SELECTION_BRUSH = QBrush(QColor(0, 120, 212, 26))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QGridLayout()
@@ -17379,12 +17715,25 @@ class IconContainer(QWidget):
         self.drag_start = None
         self.drag_end = None
         self.selection_rect = QRect()
+        # Rubber-band rect as last painted, used to repaint only the swept area
+        self._last_selection_rect = QRect()
         self.is_dragging = False
         self.selected_widgets = set()
+        # Paths of the selected widgets, kept in step with selected_widgets: a set
+        # for O(1) membership tests and a list in selection order for selectionChanged
+        self.selected_widgets_paths = set()
+        self._selected_paths_list = []
         self.last_width = 0
-
-        # Enable mouse tracking and expandability
-        self.setMouseTracking(True)
+        # Icon widgets in insertion order; None when stale (see _icon_widgets)
+        self._widgets = None
+        # {full_path: widget}; None when stale (see _widget_for_path)
+        self._path_to_widget = None
+        # {(row, col): widget} for rubber-band hit-testing; None when stale
+        self._grid_cells = None
+        self._grid_rows = 0
+        self._grid_cols = 0
+
+        # Expandability; mouse tracking stays off so moves only arrive while a button is held
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(100, 100)
 
@@ -17395,12 +17744,31 @@ class IconContainer(QWidget):
         self.setPalette(palette)
 
         # Auto-scroll timer for selection drag
+        # Runs at ~60 FPS; the step grows with how far the cursor is into (or past)
+        # the edge margin, so long lists are crossed in fewer ticks
         self.auto_scroll_timer = QTimer(self)
-        self.auto_scroll_timer.setInterval(30)
+        self.auto_scroll_timer.setInterval(16)
         self.auto_scroll_timer.timeout.connect(self._auto_scroll_during_drag)
         self._auto_scroll_direction = None
-        self._auto_scroll_margin = 30
-        self._auto_scroll_speed = 20
+        self._auto_scroll_overshoot = 0
+        self._auto_scroll_margin = 64
+        self._auto_scroll_speed = 10
+
+        # Rubber-band updates are coalesced to at most one per frame (~16 ms)
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._apply_pending_selection)
+
+        # Ancestors looked up on hot paths (scroll area, settings owner), see _cached_ancestor
+        self._ancestor_cache = {}
+
+        # Debounced auto-width relayout (see resizeEvent)
+        self.last_available_width = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self.relayout_icons)
 
         # Track press for fallback container-level drags
         self._press_pos = None
@@ -17451,16 +17819,7 @@ class IconContainer(QWidget):
         parent_scroll = self._get_parent_scroll_area()
         if parent_scroll:
             view_rect = parent_scroll.viewport().rect()
-            mapped_pos = self.mapToParent(pos)
-            direction = None
-            if mapped_pos.y() < self._auto_scroll_margin:
-                direction = 'up'
-            elif mapped_pos.y() > view_rect.height() - self._auto_scroll_margin:
-                direction = 'down'
-            elif mapped_pos.x() < self._auto_scroll_margin:
-                direction = 'left'
-            elif mapped_pos.x() > view_rect.width() - self._auto_scroll_margin:
-                direction = 'right'
+            direction = self._update_auto_scroll_edge(self.mapToParent(pos), view_rect)
 
             if direction:
                 self._auto_scroll_direction = direction
@@ -17485,22 +17844,17 @@ class IconContainer(QWidget):
         
         if event.mimeData().hasUrls():
             drop_pos = event.pos()
-            candidate = self.childAt(drop_pos)
-            target_widget = candidate
-            while target_widget is not None and not hasattr(target_widget, 'full_path'):
-                if target_widget is self:
-                    target_widget = None
-                    break
-                target_widget = target_widget.parent()
+            target_widget = self._icon_widget_at(drop_pos)
 
             paths = [url.toLocalFile() for url in event.mimeData().urls()]
-            print(f"[DROP-DEBUG] dropEvent: pos={drop_pos}, candidate={getattr(candidate, '__class__', None)}, resolved_target={getattr(target_widget, 'full_path', None)}, paths={paths}")
+            if ICON_CONTAINER_VERBOSE:
+                icon_container_debug('dropEvent: pos={} resolved_target={} paths={}', drop_pos, getattr(target_widget, 'full_path', None), paths)
 
             # Determine target directory
             target_dir = None
             if target_widget is not None and os.path.isdir(getattr(target_widget, 'full_path', '')):
                 target_dir = target_widget.full_path
-                print(f"[DROP-DEBUG] Dropping into target folder: {target_dir}")
+                icon_container_debug('Dropping into target folder: {}', target_dir)
             else:
                 # Try to get current directory from parent FileManagerTab
                 ancestor = self.parent()
@@ -17509,9 +17863,9 @@ class IconContainer(QWidget):
                 if ancestor is not None and hasattr(ancestor, 'get_current_path'):
                     try:
                         target_dir = ancestor.get_current_path()
-                        print(f"[DROP-DEBUG] Dropping into current directory: {target_dir}")
+                        icon_container_debug('Dropping into current directory: {}', target_dir)
                     except Exception as e:
-                        print(f"[DROP-ERROR] Failed to get current path: {e}")
+                        icon_container_logger.error("Failed to get current path: %s", e)
 
             if target_dir and os.path.isdir(target_dir):
                 for src_path in paths:
@@ -17519,7 +17873,7 @@ class IconContainer(QWidget):
                         if not src_path:
                             continue
                         if not os.path.exists(src_path):
-                            print(f"[DROP-DEBUG] source does not exist: {src_path}")
+                            icon_container_debug('source does not exist: {}', src_path)
                             continue
                         dest_path = os.path.join(target_dir, os.path.basename(src_path))
                         if os.path.exists(dest_path):
@@ -17535,12 +17889,12 @@ class IconContainer(QWidget):
                             abs_src = os.path.abspath(src_path)
                             abs_dest = os.path.abspath(dest_path)
                             if abs_dest.startswith(abs_src + os.sep):
-                                print(f"[DROP-ERROR] Cannot move folder into itself or subfolder: {src_path} -> {dest_path}")
+                                icon_container_logger.error("Cannot move folder into itself or subfolder: %s -> %s", src_path, dest_path)
                                 continue
                         fast_move(src_path, dest_path)
-                        print(f"[DROP-DEBUG] moved {src_path} -> {dest_path}")
+                        icon_container_debug('moved {} -> {}', src_path, dest_path)
                     except Exception as e:
-                        print(f"[DROP-ERROR] Failed to move {src_path} to {dest_path}: {e}")
+                        icon_container_logger.error("Failed to move %s to %s: %s", src_path, dest_path, e)
 
                 # Refresh view (FileManagerTab)
                 ancestor = self.parent()
@@ -17549,19 +17903,17 @@ class IconContainer(QWidget):
                 if ancestor is not None and hasattr(ancestor, 'refresh_current_view'):
                     try:
                         ancestor.refresh_current_view()
-                        print(f"[DROP-DEBUG] refresh_current_view called on {ancestor}")
+                        icon_container_debug('refresh_current_view called on {}', ancestor)
                     except Exception as e:
-                        print(f"[DROP-ERROR] refresh_current_view failed: {e}")
+                        icon_container_logger.error("refresh_current_view failed: %s", e)
                 event.acceptProposedAction()
             else:
-                print("[DROP-DEBUG] no valid folder target under drop")
+                icon_container_debug('no valid folder target under drop')
                 event.ignore()
         else:
             event.ignore()
 
     def startDrag(self, supportedActions):
-        from PyQt5.QtCore import QMimeData
-        from PyQt5.QtGui import QDrag
         mime_data = QMimeData()
         selected_paths = [w.full_path for w in self.selected_widgets]
         urls = [QUrl.fromLocalFile(p) for p in selected_paths]
@@ -17579,43 +17931,15 @@ class IconContainer(QWidget):
             pass
         drag.exec_(supportedActions)
 
-    def mouseMoveEvent(self, event):
-        if self.is_dragging and self.drag_start:
-            if (event.pos() - self.drag_start).manhattanLength() > QApplication.startDragDistance():
-                self.is_dragging = False
-                self.startDrag(Qt.MoveAction)
-        else:
-            try:
-                if self._press_pos and (event.buttons() & Qt.LeftButton):
-                    dist = (event.pos() - self._press_pos).manhattanLength()
-                    if dist > QApplication.startDragDistance():
-                        if self._press_widget and hasattr(self._press_widget, 'full_path'):
-                            if self._press_widget in self.selected_widgets or getattr(self, 'selected_widgets_paths', None) and self._press_widget.full_path in self.selected_widgets_paths:
-                                self._press_pos = None
-                                self._press_widget = None
-                                self.startDrag(Qt.MoveAction)
-                                return
-            except Exception:
-                pass
-        super().mouseMoveEvent(event)
-
     def _highlight_drop_target(self, pos):
         """Highlight potential drop target widget under cursor."""
         try:
-            candidate = self.childAt(pos)
             # Remove previous highlights
             self._clear_drop_target_highlight()
-            
-            # Find target widget that has full_path (directory)
-            target_widget = candidate
-            while target_widget is not None and not hasattr(target_widget, 'full_path'):
-                if target_widget is self:
-                    target_widget = None
-                    break
-                target_widget = target_widget.parent()
-            
-            # Highlight if it's a directory
-            if target_widget and hasattr(target_widget, 'full_path') and os.path.isdir(target_widget.full_path):
+
+            # Highlight the icon under the cursor if it's a directory
+            target_widget = self._icon_widget_at(pos)
+            if target_widget is not None and os.path.isdir(target_widget.full_path):
                 original_style = getattr(target_widget, '_original_style', target_widget.styleSheet())
                 target_widget._original_style = original_style
                 target_widget.setStyleSheet(original_style + "QWidget { background-color: rgba(76, 175, 80, 0.3); }")
@@ -17636,30 +17960,21 @@ class IconContainer(QWidget):
     def setAcceptDrops(self, accept):
         super().setAcceptDrops(accept)
 
-    def _get_parent_scroll_area(self):
-        parent = self.parent()
-        while parent and not isinstance(parent, QScrollArea):
-            parent = parent.parent()
-        return parent if isinstance(parent, QScrollArea) else None
-
-    def _auto_scroll_during_drag(self):
-        parent_scroll = self._get_parent_scroll_area()
-        if not parent_scroll or not self._auto_scroll_direction:
-            self.auto_scroll_timer.stop()
-            return
-        vbar = parent_scroll.verticalScrollBar()
-        hbar = parent_scroll.horizontalScrollBar()
-        if self._auto_scroll_direction == 'up':
-            vbar.setValue(vbar.value() - self._auto_scroll_speed)
-        elif self._auto_scroll_direction == 'down':
-            vbar.setValue(vbar.value() + self._auto_scroll_speed)
-        elif self._auto_scroll_direction == 'left':
-            hbar.setValue(hbar.value() - self._auto_scroll_speed)
-        elif self._auto_scroll_direction == 'right':
-            hbar.setValue(hbar.value() + self._auto_scroll_speed)
-
     # ... keep the rest of methods like sizeHint, resizeEvent, mousePressEvent, selection helpers unchanged
     
+    def _icon_widget_at(self, pos):
+        """Return the icon widget under pos, or None.
+
+        childAt may return a QLabel inside an IconWidget, so walk up to the
+        widget tagged with the isIconWidget property.
+        """
+        candidate = self.childAt(pos)
+        while candidate is not None and candidate is not self:
+            if candidate.property('isIconWidget'):
+                return candidate
+            candidate = candidate.parent()
+        return None
+
     def sizeHint(self):
         """Provide size hint to ensure proper expansion"""
         # Get the size needed for all widgets
@@ -17672,41 +17987,21 @@ class IconContainer(QWidget):
         min_height = 300
         
         # Get the parent scroll area size if available
-        parent_widget = self.parent()
-        while parent_widget and not isinstance(parent_widget, QScrollArea):
-            parent_widget = parent_widget.parent()
+        parent_widget = self._get_parent_scroll_area()
             
-        if parent_widget and isinstance(parent_widget, QScrollArea):
+        if parent_widget is not None:
             viewport_size = parent_widget.viewport().size()
             min_width = max(min_width, viewport_size.width())
             min_height = max(min_height, viewport_size.height())
         
         return QSize(min_width, min_height)
     
-    def resizeEvent(self, event):
-        """Handle resize events to ensure proper layout"""
-        super().resizeEvent(event)
-        # Force layout update when resized
-        self.layout().activate()
-
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            # Determine if click is on empty space or on an icon.
-            # childAt may return a QLabel or internal child inside an IconWidget.
-            # Walk up the parent chain to find a widget that has 'full_path'.
-            raw_clicked = self.childAt(event.pos())
-            clicked_widget = None
-            candidate = raw_clicked
-            while candidate is not None and candidate is not self:
-                if hasattr(candidate, 'full_path'):
-                    clicked_widget = candidate
-                    break
-                candidate = candidate.parent()
+            # Determine if click is on empty space or on an icon
+            clicked_widget = self._icon_widget_at(event.pos())
 
-            is_empty_space = (clicked_widget is None or 
-                              clicked_widget == self or 
-                              clicked_widget == self.layout() or
-                              isinstance(clicked_widget, QLayout))
+            is_empty_space = clicked_widget is None
 
             # If clicking empty space, start selection drag (rubber-band)
             if is_empty_space:
@@ -17717,33 +18012,13 @@ class IconContainer(QWidget):
                 if not (event.modifiers() & Qt.ControlModifier):
                     self.clear_selection()
 
-                # Special logic: allow single click to the right of the furthest right icon to only register for drag selection
-                layout = self.layout()
-                if layout.count() > 0:
-                    # Find the bottom-most, right-most widget
-                    max_right = 0
-                    max_bottom = 0
-                    for i in range(layout.count()):
-                        item = layout.itemAt(i)
-                        if item and item.widget():
-                            rect = item.widget().geometry()
-                            max_right = max(max_right, rect.right())
-                            max_bottom = max(max_bottom, rect.bottom())
-                    # If click is to the right of the right-most icon (and within the vertical bounds of icons)
-                    if event.pos().x() > max_right and event.pos().y() <= max_bottom:
-                        # Treat as empty space: clear selection handled above, and allow drag selection to start
-                        self.emptySpaceClicked.emit()
-                        event.accept()
-                        return
-
-                # Default empty-space click behavior
+                # Empty-space click, including to the right of the right-most icon:
+                # the selection drag has already started above
                 self.emptySpaceClicked.emit()
                 event.accept()
                 return
             else:
                 # Click landed on a widget (icon) — record press so container can start a drag fallback if needed
-                # clicked_widget already resolved to the IconWidget (or None)
-                clicked_widget = clicked_widget if clicked_widget is not None else self.childAt(event.pos())
                 try:
                     # Record press position and widget for fallback
                     self._press_pos = event.pos()
@@ -17756,25 +18031,13 @@ class IconContainer(QWidget):
                 super().mousePressEvent(event)
                 return
         elif event.button() == Qt.RightButton:
-            # Determine if right-click hit an icon by walking up parent chain similar to left-click
-            raw_clicked = self.childAt(event.pos())
-            clicked_widget = None
-            candidate = raw_clicked
-            while candidate is not None and candidate is not self:
-                if hasattr(candidate, 'full_path'):
-                    clicked_widget = candidate
-                    break
-                candidate = candidate.parent()
+            # Determine if right-click hit an icon, as for left-click
+            clicked_widget = self._icon_widget_at(event.pos())
 
-            is_empty_space = (clicked_widget is None or 
-                              clicked_widget == self or 
-                              clicked_widget == self.layout() or
-                              isinstance(clicked_widget, QLayout))
+            is_empty_space = clicked_widget is None
             if is_empty_space:
-                try:
+                if ICON_CONTAINER_VERBOSE:
                     icon_container_debug('Right click in container empty space at pos={} global={}', event.pos(), event.globalPos())
-                except Exception:
-                    pass
                 self.emptySpaceRightClicked.emit(event.globalPos())
                 event.accept()
                 return
@@ -17784,27 +18047,24 @@ class IconContainer(QWidget):
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
+        if not (event.buttons() & Qt.LeftButton):
+            # Nothing to track without the left button; just make sure auto-scroll is idle
+            if self.auto_scroll_timer.isActive():
+                self._auto_scroll_direction = None
+                self.auto_scroll_timer.stop()
+            return
         if self.is_dragging and self.drag_start:
+            # Record the position; hit-testing and repaint run once per frame
             self.drag_end = event.pos()
-            self.selection_rect = QRect(self.drag_start, self.drag_end).normalized()
-            self.update_selection()
-            self.update()  # Trigger repaint
+            if not self._selection_timer.isActive():
+                self._selection_timer.start()
 
             # --- Auto-scroll logic ---
             parent_scroll = self._get_parent_scroll_area()
             if parent_scroll:
                 view_rect = parent_scroll.viewport().rect()
-                mapped_pos = self.mapToParent(event.pos())
                 # Determine scroll direction
-                direction = None
-                if mapped_pos.y() < self._auto_scroll_margin:
-                    direction = 'up'
-                elif mapped_pos.y() > view_rect.height() - self._auto_scroll_margin:
-                    direction = 'down'
-                elif mapped_pos.x() < self._auto_scroll_margin:
-                    direction = 'left'
-                elif mapped_pos.x() > view_rect.width() - self._auto_scroll_margin:
-                    direction = 'right'
+                direction = self._update_auto_scroll_edge(self.mapToParent(event.pos()), view_rect)
                 if direction:
                     self._auto_scroll_direction = direction
                     if not self.auto_scroll_timer.isActive():
@@ -17818,12 +18078,12 @@ class IconContainer(QWidget):
         else:
             # Fallback: if user pressed on an icon (not empty space) and moved beyond drag threshold, start drag of selected items
             try:
-                if self._press_pos and (event.buttons() & Qt.LeftButton):
+                if self._press_pos:
                     dist = (event.pos() - self._press_pos).manhattanLength()
                     if dist > QApplication.startDragDistance():
                         # Only start container drag if the pressed widget is part of the selection
                         if self._press_widget and hasattr(self._press_widget, 'full_path'):
-                            if self._press_widget in self.selected_widgets or self._press_widget.full_path in getattr(self, 'selected_widgets_paths', []):
+                            if self._press_widget in self.selected_widgets or self._press_widget.full_path in self.selected_widgets_paths:
                                 # Reset press tracking to avoid re-entrancy
                                 self._press_pos = None
                                 self._press_widget = None
@@ -17835,11 +18095,49 @@ class IconContainer(QWidget):
             self._auto_scroll_direction = None
             self.auto_scroll_timer.stop()
 
+    def _cached_ancestor(self, key, predicate):
+        """Return the nearest ancestor matching predicate, remembered per key until reparenting"""
+        ancestor = self._ancestor_cache.get(key)
+        if ancestor is not None:
+            try:
+                if ancestor.isAncestorOf(self):
+                    return ancestor
+            except RuntimeError:
+                pass
+        ancestor = self.parent()
+        while ancestor is not None and not predicate(ancestor):
+            ancestor = ancestor.parent()
+        self._ancestor_cache[key] = ancestor
+        return ancestor
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.ParentChange and getattr(self, '_ancestor_cache', None):
+            self._ancestor_cache.clear()
+        elif event.type() == QEvent.ActivationChange and not self.isActiveWindow():
+            # Alt-tab or a modal dialog swallows the release; don't keep scrolling in the background
+            if self.is_dragging:
+                self._end_rubber_band()
+            self._stop_auto_scroll()
+        super().changeEvent(event)
+
     def _get_parent_scroll_area(self):
-        parent = self.parent()
-        while parent and not isinstance(parent, QScrollArea):
-            parent = parent.parent()
-        return parent if isinstance(parent, QScrollArea) else None
+        return self._cached_ancestor('scroll_area', lambda w: isinstance(w, QScrollArea))
+
+    def _update_auto_scroll_edge(self, mapped_pos, view_rect):
+        """Return the auto-scroll direction for mapped_pos and record how far past the margin it is"""
+        margin = self._auto_scroll_margin
+        direction = None
+        overshoot = 0
+        if mapped_pos.y() < margin:
+            direction, overshoot = 'up', margin - mapped_pos.y()
+        elif mapped_pos.y() > view_rect.height() - margin:
+            direction, overshoot = 'down', mapped_pos.y() - (view_rect.height() - margin)
+        elif mapped_pos.x() < margin:
+            direction, overshoot = 'left', margin - mapped_pos.x()
+        elif mapped_pos.x() > view_rect.width() - margin:
+            direction, overshoot = 'right', mapped_pos.x() - (view_rect.width() - margin)
+        self._auto_scroll_overshoot = overshoot
+        return direction
 
     def _auto_scroll_during_drag(self):
         parent_scroll = self._get_parent_scroll_area()
@@ -17848,112 +18146,279 @@ class IconContainer(QWidget):
             return
         vbar = parent_scroll.verticalScrollBar()
         hbar = parent_scroll.horizontalScrollBar()
+        step = self._auto_scroll_speed + self._auto_scroll_overshoot // 4
         if self._auto_scroll_direction == 'up':
-            vbar.setValue(vbar.value() - self._auto_scroll_speed)
+            vbar.setValue(vbar.value() - step)
         elif self._auto_scroll_direction == 'down':
-            vbar.setValue(vbar.value() + self._auto_scroll_speed)
+            vbar.setValue(vbar.value() + step)
         elif self._auto_scroll_direction == 'left':
-            hbar.setValue(hbar.value() - self._auto_scroll_speed)
+            hbar.setValue(hbar.value() - step)
         elif self._auto_scroll_direction == 'right':
-            hbar.setValue(hbar.value() + self._auto_scroll_speed)
+            hbar.setValue(hbar.value() + step)
+
+    def _apply_pending_selection(self):
+        """Apply the latest rubber-band position recorded by mouseMoveEvent"""
+        if not self.is_dragging or self.drag_start is None or self.drag_end is None:
+            return
+        self.selection_rect = QRect(self.drag_start, self.drag_end).normalized()
+        self.update_selection()
+        # Repaint only the area covered by the old and new frames
+        self._invalidate_rubber_band(self._last_selection_rect.united(self.selection_rect))
+        self._last_selection_rect = QRect(self.selection_rect)
+
+    def _invalidate_rubber_band(self, rect):
+        """Schedule a repaint of rect plus the rubber-band pen width.
+
+        All rubber-band invalidation goes through here so it stays a coalesced,
+        region-bounded update(); never call repaint() from the drag handlers.
+        """
+        self.update(rect.adjusted(-2, -2, 2, 2))
 
     def mouseReleaseEvent(self, event):
-        try:
-            icon_container_debug('mouseReleaseEvent button={} pos={} global={}', getattr(event, 'button', lambda: None)(), getattr(event, 'pos', lambda: '<no-pos>')(), getattr(event, 'globalPos', lambda: '<no-global>')())
-        except Exception:
-            pass
-        if event.button() == Qt.LeftButton and self.is_dragging:
-            self.is_dragging = False
-            self.drag_start = None
-            self.drag_end = None
-            self.update()  # Clear selection rectangle
-            self._auto_scroll_direction = None
-            self.auto_scroll_timer.stop()
+        if ICON_CONTAINER_VERBOSE:
+            icon_container_debug('mouseReleaseEvent button={} pos={} global={}', event.button(), event.pos(), event.globalPos())
+        if event.button() == Qt.LeftButton:
+            if self.is_dragging:
+                self._end_rubber_band()
+            self._stop_auto_scroll()
+
+    def _end_rubber_band(self):
+        """Finish a rubber-band drag, applying its last position and erasing the frame"""
+        # Make sure the final rubber-band position is reflected in the selection
+        if self._selection_timer.isActive():
+            self._selection_timer.stop()
+            self._apply_pending_selection()
+        self.is_dragging = False
+        self.drag_start = None
+        self.drag_end = None
+        # Clear the selection rectangle
+        self._invalidate_rubber_band(self._last_selection_rect)
+        self.selection_rect = QRect()
+        self._last_selection_rect = QRect()
+
+    def _stop_auto_scroll(self):
+        self._auto_scroll_direction = None
+        self.auto_scroll_timer.stop()
+
+    def _invalidate_icon(self, widget):
+        """Schedule a repaint of the selection overlay under widget"""
+        self.update(widget.geometry())
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        if self.is_dragging and self.selection_rect.isValid():
-            painter = QPainter(self)
-            pen = QPen(Qt.blue, 1, Qt.DashLine)
-            painter.setPen(pen)
+        dragging = self.is_dragging and self.selection_rect.isValid()
+        if not self.selected_widgets and not dragging:
+            return
+        painter = QPainter(self)
+        if self.selected_widgets:
+            # One pass over the selected icons that intersect the damaged region;
+            # the 2px pen is inset so it stays inside each icon's geometry
+            region = event.region()
+            painter.setPen(self._SELECTION_PEN)
+            painter.setBrush(self._SELECTION_BRUSH)
+            for widget in self.selected_widgets:
+                try:
+                    rect = widget.geometry()
+                except RuntimeError:
+                    continue
+                if region.intersects(rect):
+                    painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        if dragging:
+            painter.setPen(QPen(Qt.blue, 1, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
             painter.drawRect(self.selection_rect)
 
-    def update_selection(self):
+    def childEvent(self, event):
+        if event.type() == QEvent.ChildRemoved:
+            self._widgets = None
+            self._path_to_widget = None
+            self._grid_cells = None
+            # A removed icon must not keep its highlight (paintEvent draws at its stale geometry)
+            child = event.child()
+            if child in self.selected_widgets:
+                self.selected_widgets.discard(child)
+                self._forget_selected_paths((child.full_path,))
+                self._emit_selection_changed()
+        super().childEvent(event)
+
+    def take_widgets(self):
+        """Take every icon out of the grid, keeping it parented here, and return them in grid order"""
         layout = self.layout()
+        widgets = []
+        for i in reversed(range(layout.count())):
+            item = layout.itemAt(i)
+            if item:
+                if item.widget() is not None:
+                    widgets.append(item.widget())
+                layout.removeItem(item)
+        widgets.reverse()
+        self._widgets = []
+        self._path_to_widget = {}
+        self._grid_cells = None
+        return widgets
+
+    def _icon_widgets(self):
+        """Return the icon widgets in the layout, kept Python-side until a widget is removed"""
+        widgets = self._widgets
+        if widgets is None:
+            layout = self.layout()
+            widgets = []
+            for i in range(layout.count()):
+                item = layout.itemAt(i)
+                widget = item.widget() if item else None
+                if widget is not None:
+                    widgets.append(widget)
+            self._widgets = widgets
+        return widgets
+
+    def _widget_for_path(self, path):
+        """Return the icon widget showing path, or None"""
+        index = self._path_to_widget
+        if index is None:
+            index = {}
+            for widget in self._icon_widgets():
+                full_path = getattr(widget, 'full_path', None)
+                if full_path is not None:
+                    index.setdefault(full_path, widget)
+            self._path_to_widget = index
+        return index.get(path)
+
+    def _grid_index(self):
+        """Return {(row, col): widget} for the icon grid, rebuilt after the layout changes"""
+        cells = self._grid_cells
+        if cells is None:
+            layout = self.layout()
+            cells = {}
+            rows = cols = 0
+            for i in range(layout.count()):
+                item = layout.itemAt(i)
+                widget = item.widget() if item else None
+                if widget is not None:
+                    row, col, _, _ = layout.getItemPosition(i)
+                    cells[(row, col)] = widget
+                    rows = max(rows, row + 1)
+                    cols = max(cols, col + 1)
+            self._grid_cells = cells
+            self._grid_rows = rows
+            self._grid_cols = cols
+        return cells
+
+    def _selection_candidates(self, rect):
+        """Return the widgets in the grid cells overlapping rect.
+
+        Icons share one fixed size, so cell pitch comes from the first cell and its
+        neighbours; anything else (e.g. before the first layout pass) falls back to
+        every widget.
+        """
+        cells = self._grid_index()
+        origin = cells.get((0, 0))
+        if origin is None:
+            return self._icon_widgets()
+        geo = origin.geometry()
+        right = cells.get((0, 1))
+        below = cells.get((1, 0))
+        spacing = self.layout().spacing()
+        col_pitch = right.geometry().x() - geo.x() if right is not None else geo.width() + spacing
+        row_pitch = below.geometry().y() - geo.y() if below is not None else geo.height() + spacing
+        if col_pitch <= 0 or row_pitch <= 0:
+            return self._icon_widgets()
+        r0 = max(0, (rect.top() - geo.y() - geo.height()) // row_pitch)
+        r1 = min(self._grid_rows - 1, (rect.bottom() - geo.y()) // row_pitch)
+        c0 = max(0, (rect.left() - geo.x() - geo.width()) // col_pitch)
+        c1 = min(self._grid_cols - 1, (rect.right() - geo.x()) // col_pitch)
+        candidates = []
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                widget = cells.get((row, col))
+                if widget is not None:
+                    candidates.append(widget)
+        return candidates
+
+    def update_selection(self):
         newly_selected = set()
         
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                widget_rect = widget.geometry()
-                
-                if self.selection_rect.intersects(widget_rect):
-                    newly_selected.add(widget)
-                    widget.setStyleSheet("QWidget { border: 2px solid #0078d7; background-color: rgba(0, 120, 215, 0.2); }")
-                elif widget not in self.selected_widgets:
-                    widget.setStyleSheet("QWidget { border: 2px solid transparent; }")
+        # Only icons in grid cells under the rubber band need hit-testing
+        for widget in self._selection_candidates(self.selection_rect):
+            widget_rect = widget.geometry()
+            
+            if self.selection_rect.intersects(widget_rect):
+                newly_selected.add(widget)
+        # Icons the rubber band has moved off are deselected
+        removed = self.selected_widgets - newly_selected
+        for widget in removed:
+            widget.set_selected(False)
+            self._invalidate_icon(widget)
+        added = newly_selected - self.selected_widgets
+        for widget in added:
+            self._invalidate_icon(widget)
         
         # Update selected widgets
         self.selected_widgets = newly_selected
         
         # Emit selection changed signal
-        selected_paths = [w.full_path for w in self.selected_widgets]
-        self.selectionChanged.emit(selected_paths)
+        if removed:
+            self._forget_selected_paths(w.full_path for w in removed)
+        for widget in added:
+            self._remember_selected_path(widget.full_path)
+        self._emit_selection_changed()
 
     def clear_selection(self):
-        layout = self.layout()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                widget.setStyleSheet("QWidget { border: 2px solid transparent; }")
-                # Update IconWidget selection state for truncation
-                if hasattr(widget, 'set_selected'):
-                    widget.set_selected(False)
+        # Only selected icons carry the highlight, so there is no need to visit every icon
+        for widget in self.selected_widgets:
+            # Update IconWidget selection state for truncation
+            if hasattr(widget, 'set_selected'):
+                widget.set_selected(False)
+            self._invalidate_icon(widget)
         self.selected_widgets.clear()
-        self.selectionChanged.emit([])
+        self.selected_widgets_paths.clear()
+        self._selected_paths_list.clear()
+        self._emit_selection_changed()
 
     def add_to_selection(self, widget):
         self.selected_widgets.add(widget)
-        widget.setStyleSheet("QWidget { border: 2px solid #0078d7; background-color: rgba(0, 120, 215, 0.2); }")
         # Update IconWidget selection state for truncation
         if hasattr(widget, 'set_selected'):
             widget.set_selected(True)
-        selected_paths = [w.full_path for w in self.selected_widgets]
-        self.selectionChanged.emit(selected_paths)
+        self._invalidate_icon(widget)
+        self._remember_selected_path(widget.full_path)
+        self._emit_selection_changed()
 
     def remove_from_selection(self, widget):
         if widget in self.selected_widgets:
             self.selected_widgets.remove(widget)
-            widget.setStyleSheet("QWidget { border: 2px solid transparent; }")
             # Update IconWidget selection state for truncation
             if hasattr(widget, 'set_selected'):
                 widget.set_selected(False)
-            selected_paths = [w.full_path for w in self.selected_widgets]
-            self.selectionChanged.emit(selected_paths)
+            self._invalidate_icon(widget)
+            self._forget_selected_paths((widget.full_path,))
+            self._emit_selection_changed()
+
+    def _remember_selected_path(self, path):
+        if path not in self.selected_widgets_paths:
+            self.selected_widgets_paths.add(path)
+            self._selected_paths_list.append(path)
+
+    def _forget_selected_paths(self, paths):
+        paths = set(paths) & self.selected_widgets_paths
+        if paths:
+            self.selected_widgets_paths -= paths
+            self._selected_paths_list = [p for p in self._selected_paths_list if p not in paths]
+
+    def _emit_selection_changed(self):
+        """Emit selectionChanged with a copy of the maintained path list"""
+        self.selectionChanged.emit(list(self._selected_paths_list))
 
     def add_to_selection_by_path(self, path):
         """Add widget to selection by file path"""
-        layout = self.layout()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'full_path') and widget.full_path == path:
-                    self.add_to_selection(widget)
-                    break
+        widget = self._widget_for_path(path)
+        if widget is not None:
+            self.add_to_selection(widget)
 
     def remove_from_selection_by_path(self, path):
         """Remove widget from selection by file path"""
-        layout = self.layout()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'full_path') and widget.full_path == path:
-                    self.remove_from_selection(widget)
-                    break
+        widget = self._widget_for_path(path)
+        if widget is not None:
+            self.remove_from_selection(widget)
 
     def add_widget_optimized(self, widget, thumbnail_size, icons_wide=0):
         """Add widget to grid layout with optimized positioning for icons per row"""
@@ -17963,62 +18428,7 @@ class IconContainer(QWidget):
         self._in_add_widget = True
         
         try:
-            layout = self.layout()
-            
-            # Calculate approximate widget width (thumbnail + padding + margins)
-            # Include space for text label underneath
-            widget_width = thumbnail_size + 10  # thumbnail + margins/padding
-            widget_height = thumbnail_size + 30  # thumbnail + text height + margins
-            
-            # Add spacing between widgets to the width calculation
-            spacing = layout.spacing()  # Get the layout spacing (10 pixels)
-            effective_widget_width = widget_width + spacing
-            
-            # Determine icons per row
-            if icons_wide > 0:
-                # Fixed number of icons per row
-                icons_per_row = icons_wide
-            else:
-                # Auto-calculate based on available space
-                # Get the actual available width from the scroll area viewport
-                parent = self.parent()
-                scroll_area = None
-                while parent:
-                    if hasattr(parent, 'viewport'):
-                        scroll_area = parent
-                        break
-                    parent = parent.parent()
-                if scroll_area:
-                    viewport_width = scroll_area.viewport().width()
-                else:
-                    viewport_width = self.width()
-                # Get layout margins
-                layout_margins = self.layout().contentsMargins()
-                left_margin = layout_margins.left()
-                right_margin = layout_margins.right()
-                spacing = layout.spacing()
-                # Calculate available width for icons (viewport minus margins)
-                available_width = viewport_width - left_margin - right_margin
-                # Calculate max icons per row that fit without scrolling
-                if available_width < effective_widget_width:
-                    icons_per_row = 1
-                else:
-                    # n*W + (n-1)*S <= available_width  =>  n = floor((available_width + S) / (W + S))
-                    icons_per_row = max(1, (available_width + spacing) // (effective_widget_width))
-            
-            # Calculate current position
-            current_count = layout.count()
-            row = current_count // icons_per_row
-            col = current_count % icons_per_row
-            
-            # Force widget size BEFORE adding to layout to ensure proper grid display
-            widget.setMinimumSize(widget_width, widget_height)
-            widget.setMaximumWidth(widget_width + 20)  # Allow some flexibility
-            widget.setFixedSize(widget_width, widget_height)  # Force exact size for grid layout
-            
-            # Add widget at calculated position
-            layout.addWidget(widget, row, col)
-            
+            self.add_widget_fast(widget, self.begin_add_batch(thumbnail_size, icons_wide))
         finally:
             self._in_add_widget = False
 
@@ -18026,104 +18436,129 @@ class IconContainer(QWidget):
         """Handle resize events to re-layout icons in auto-width mode"""
         super().resizeEvent(event)
         
-        # Prevent recursive resize events
-        if hasattr(self, '_in_resize') and self._in_resize:
+        # Check scroll area viewport width instead of container width for better auto-width calculation
+        scroll_area = self._get_parent_scroll_area()
+        current_width = scroll_area.viewport().width() if scroll_area else self.width()
+        if current_width == self.last_available_width:
             return
-        self._in_resize = True
+        self.last_available_width = current_width
         
-        try:
-            # Check scroll area viewport width instead of container width for better auto-width calculation
-            scroll_area = None
-            parent = self.parent()
-            while parent:
-                if hasattr(parent, 'viewport'):
-                    scroll_area = parent
-                    break
-                parent = parent.parent()
-            
-            # Get current available width
-            if scroll_area:
-                current_width = scroll_area.viewport().width()
-            else:
-                current_width = self.width()
-            
-            if not hasattr(self, 'last_available_width'):
-                self.last_available_width = current_width
-            
-            # Only re-layout if width changed significantly and we're in auto-width mode
-            if abs(current_width - self.last_available_width) > 50:  # Significant width change
-                self.last_available_width = current_width
-                
-                # Check if we're in auto-width mode by trying to get the setting from parent
-                main_window = None
-                parent = self.parent()
-                while parent:
-                    if hasattr(parent, 'main_window'):
-                        main_window = parent.main_window
-                        break
-                    elif hasattr(parent, 'icons_wide'):
-                        main_window = parent
-                        break
-                    parent = parent.parent()
-                
-                # Re-layout icons if in auto-width mode (icons_wide == 0)
-                if main_window and getattr(main_window, 'icons_wide', 0) == 0:
-                    # Use a timer to prevent excessive calls
-                    if not hasattr(self, '_resize_timer'):
-                        from PyQt5.QtCore import QTimer
-                        self._resize_timer = QTimer()
-                        self._resize_timer.setSingleShot(True)
-                        self._resize_timer.timeout.connect(self.relayout_icons)
-                    
-                    self._resize_timer.stop()
-                    self._resize_timer.start(100)  # Delay 100ms before relayout
-        finally:
-            self._in_resize = False
+        # Check if we're in auto-width mode by trying to get the setting from parent
+        main_window = self._cached_ancestor(
+            'settings', lambda w: hasattr(w, 'main_window') or hasattr(w, 'icons_wide'))
+        if main_window is not None and hasattr(main_window, 'main_window'):
+            main_window = main_window.main_window
+        
+        # Re-layout icons if in auto-width mode (icons_wide == 0). Every resize
+        # restarts the timer, so a continuous drag relayouts once at the final size.
+        if main_window and getattr(main_window, 'icons_wide', 0) == 0:
+            self._resize_timer.start()
     
+    def begin_add_batch(self, thumbnail_size, icons_wide=0):
+        """Compute the grid parameters shared by a run of add_widget_fast calls.
+
+        Returns (icons_per_row, widget_size), so populating a folder reads spacing,
+        margins and the viewport width once instead of per icon.
+        """
+        self._layout_thumbnail_size = thumbnail_size
+        # Calculate approximate widget size (thumbnail + padding + margins),
+        # including space for the text label underneath
+        return (self._icons_per_row(thumbnail_size, icons_wide), QSize(thumbnail_size + 10, thumbnail_size + 30))
+
+    def add_widget_fast(self, widget, batch):
+        """Add widget at the next grid cell using parameters from begin_add_batch"""
+        icons_per_row, widget_size = batch
+        layout = self.layout()
+        
+        # Calculate current position
+        row, col = divmod(layout.count(), icons_per_row)
+        
+        # Force exact size BEFORE adding to layout to ensure proper grid display.
+        # setFixedSize sets both minimum and maximum; skip it when they already match
+        # so re-adding a widget doesn't invalidate its geometry.
+        if widget.minimumSize() != widget_size or widget.maximumSize() != widget_size:
+            widget.setFixedSize(widget_size)
+        
+        # Add widget at calculated position
+        layout.addWidget(widget, row, col)
+        if self._widgets is not None:
+            self._widgets.append(widget)
+        if self._path_to_widget is not None and hasattr(widget, 'full_path'):
+            self._path_to_widget.setdefault(widget.full_path, widget)
+        self._grid_cells = None
+
+    def _icons_per_row(self, thumbnail_size, icons_wide=0):
+        """Return how many icons of thumbnail_size fit in a row (icons_wide > 0 fixes the count)"""
+        if icons_wide > 0:
+            # Fixed number of icons per row
+            return icons_wide
+        layout = self.layout()
+        # Add spacing between widgets to the width calculation
+        spacing = layout.spacing()
+        effective_widget_width = thumbnail_size + 10 + spacing
+        # Auto-calculate based on available space
+        # Get the actual available width from the scroll area viewport
+        scroll_area = self._get_parent_scroll_area()
+        if scroll_area:
+            viewport_width = scroll_area.viewport().width()
+        else:
+            viewport_width = self.width()
+        # Calculate available width for icons (viewport minus margins)
+        layout_margins = layout.contentsMargins()
+        available_width = viewport_width - layout_margins.left() - layout_margins.right()
+        # Calculate max icons per row that fit without scrolling
+        if available_width < effective_widget_width:
+            return 1
+        # n*W + (n-1)*S <= available_width  =>  n = floor((available_width + S) / (W + S))
+        return max(1, (available_width + spacing) // effective_widget_width)
+
     def relayout_icons(self):
         """Re-layout existing icons to adjust to new container width"""
         layout = self.layout()
-        widgets = []
         
-        # Collect all existing widgets
+        # Collect all existing widgets in grid order
+        placed = []
         for i in range(layout.count()):
             item = layout.itemAt(i)
             if item and item.widget():
-                widgets.append(item.widget())
+                row, col, _, _ = layout.getItemPosition(i)
+                placed.append((row, col, item.widget()))
+        if not placed:
+            return
+        placed.sort(key=lambda p: (p[0], p[1]))
         
-        # Clear the layout
-        for i in reversed(range(layout.count())):
-            item = layout.itemAt(i)
-            if item:
-                layout.removeItem(item)
+        # Get current settings
+        main_window = self._cached_ancestor('thumbnail_size', lambda w: hasattr(w, 'thumbnail_size'))
         
-        # Re-add widgets with new layout calculation
-        if widgets:
-            # Get current settings
-            main_window = None
-            parent = self.parent()
-            while parent and not main_window:
-                if hasattr(parent, 'thumbnail_size'):
-                    main_window = parent
-                    break
-                parent = parent.parent()
-            
-            thumbnail_size = getattr(main_window, 'thumbnail_size', 64) if main_window else 64
-            icons_wide = getattr(main_window, 'icons_wide', 0) if main_window else 0
-            
-            for widget in widgets:
-                self.add_widget_optimized(widget, thumbnail_size, icons_wide)
+        thumbnail_size = getattr(main_window, 'thumbnail_size', 64) if main_window else 64
+        icons_wide = getattr(main_window, 'icons_wide', 0) if main_window else 0
+        
+        if thumbnail_size != getattr(self, '_layout_thumbnail_size', None):
+            # Icon size changed: clear the layout and re-add every widget at its new size
+            for i in reversed(range(layout.count())):
+                item = layout.itemAt(i)
+                if item:
+                    layout.removeItem(item)
+            self._widgets = []
+            batch = self.begin_add_batch(thumbnail_size, icons_wide)
+            for _, _, widget in placed:
+                self.add_widget_fast(widget, batch)
+            return
+        
+        # Only the column count changed: move just the widgets whose cell differs
+        icons_per_row = self._icons_per_row(thumbnail_size, icons_wide)
+        for index, (row, col, widget) in enumerate(placed):
+            new_row, new_col = divmod(index, icons_per_row)
+            if (row, col) != (new_row, new_col):
+                layout.addWidget(widget, new_row, new_col)
+        self._grid_cells = None
 
 class BreadcrumbWidget(QWidget):
     def show_address_bar(self, current_path):
         from PyQt5.QtWidgets import QLineEdit
-        # Remove all widgets
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.spacerItem():
-                del item
+        # The breadcrumbs are hidden after this, so set_path must lay them out again
+        self._last_path = None
+        self._clear_layout()
         # Add address bar
         address_bar = QLineEdit(current_path)
         address_bar.setStyleSheet("font-size: 18px; padding: 2px 8px;")
@@ -18132,9 +18567,8 @@ class BreadcrumbWidget(QWidget):
         address_bar.setFocus()
     def set_text_color(self, color):
         """Set the text color of all breadcrumb buttons and separators."""
-        for i in range(self.layout.count()):
-            item = self.layout.itemAt(i)
-            widget = item.widget() if item else None
+        # Walk the pools rather than the layout so hidden, reusable widgets match too
+        for widget in self._buttons + self._separators:
             if isinstance(widget, QPushButton):
                 # Update only color, keep other styles
                 style = widget.styleSheet()
@@ -18168,17 +18602,70 @@ class BreadcrumbWidget(QWidget):
         font = self.font()
         font.setPointSize(font.pointSize())  # Keep original size, don't multiply by 2
         self.setFont(font)
+        # Path the current buttons were built for; None forces a rebuild
+        self._last_path = None
+        # Buttons and separators are kept and relabelled across navigations
+        self._buttons = []
+        self._separators = []
+
+    def _clear_layout(self):
+        """Take every item out of the layout, hiding pooled widgets and deleting the rest"""
+        pooled = set(self._buttons)
+        pooled.update(self._separators)
+        while self.layout.count():
+            item = self.layout.takeAt(0)
+            widget = item.widget()
+            if widget is None:
+                continue
+            if widget in pooled:
+                widget.hide()
+            else:
+                widget.deleteLater()
+
+    def _new_separator(self):
+        separator = QLabel(self)
+        separator.setStyleSheet("color: gray; font-weight: bold; font-size: 13px;")
+        separator.hide()
+        self._separators.append(separator)
+        return separator
+
+    def _new_button(self):
+        button = QPushButton(self)
+        button.setFlat(True)
+        button.setStyleSheet("""
+            QPushButton {
+                border: none;
+                padding: 2px 8px 6px 8px;
+                text-decoration: underline;
+                text-align: left;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: rgba(0, 102, 204, 0.1);
+            }
+            QPushButton:pressed {
+                background-color: rgba(0, 102, 204, 0.2);
+            }
+        """)
+        button.hide()
+        button.clicked.connect(lambda checked, button=button: self._on_button_clicked(button))
+        self._buttons.append(button)
+        return button
+
+    def _on_button_clicked(self, button):
+        path = button.property('crumbPath')
+        if button.property('crumbIsLast'):
+            self.show_address_bar(path)
+        else:
+            self.pathClicked.emit(path)
         
     def set_path(self, path):
         """Set the current path and update breadcrumb buttons"""
-        # Clear existing widgets and layout items (including stretch)
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.spacerItem():
-                # Remove spacer items (stretch)
-                del item
+        if path == self._last_path:
+            return
+        self._last_path = path
+        # Take existing widgets and layout items (including stretch) out of the layout
+        self._clear_layout()
         
         if not path:
             # Even with no path, add stretch to maintain left alignment
@@ -18187,22 +18674,22 @@ class BreadcrumbWidget(QWidget):
             
         # Split path into parts
         parts = []
+        seen = set()
         current = path
         is_windows = os.name == 'nt'
-        while current and current != os.path.dirname(current):
-            # On Windows, show C:\ for drive root (not C:\\)
-            if is_windows and os.path.dirname(current) == current and len(current) == 2 and current[1] == ':':
-                parts.append((current + '\\', current + '\\'))
-                break
-            parts.append((os.path.basename(current) or current, current))
-            current = os.path.dirname(current)
+        head, tail = os.path.split(current)
+        while current and current != head:
+            parts.append((tail or current, current))
+            seen.add(current)
+            current = head
+            head, tail = os.path.split(current)
         # Fix: convert C:\\ to C:\ for display
         for idx, (name, full_path) in enumerate(parts):
             # On Windows, show 'C:\\' for root (not 'C:' or 'C')
             if is_windows and ((name.endswith('\\') and len(name) == 3 and name[1] == ':' and name[2] == '\\') or (name.endswith(':') and len(name) == 2 and name[1] == ':')):
                 parts[idx] = (name[0:2] + '\\', full_path)  # C:\\ or C: -> C:\
         # Add root if not already included
-        if current and current not in [p[1] for p in parts]:
+        if current and current not in seen:
             if is_windows and len(current) == 2 and current[1] == ':':
                 parts.append((current + '\\', current + '\\'))
             else:
@@ -18211,37 +18698,24 @@ class BreadcrumbWidget(QWidget):
         
         # Choose separator based on OS
         sep = ' \\ ' if os.name == 'nt' else ' / '
-        # Create breadcrumb buttons
+        # Lay out breadcrumb buttons, creating widgets only when the pools run short
+        while len(self._buttons) < len(parts):
+            self._new_button()
+        while len(self._separators) < len(parts) - 1:
+            self._new_separator()
         for i, (name, full_path) in enumerate(parts):
             if i > 0:
-                # Add separator with appropriately sized font
-                separator = QLabel(sep)
-                separator.setStyleSheet("color: gray; font-weight: bold; font-size: 13px;")
+                separator = self._separators[i - 1]
+                separator.setText(sep)
                 self.layout.addWidget(separator)
-            # Create clickable button for path part with underscore wrapping
-            formatted_name = format_filename_with_underscore_wrap(name)
-            button = QPushButton(formatted_name)
-            button.setFlat(True)
-            button.setStyleSheet("""
-                QPushButton {
-                    border: none;
-                    padding: 2px 8px 6px 8px;
-                    text-decoration: underline;
-                    text-align: left;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(0, 102, 204, 0.1);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(0, 102, 204, 0.2);
-                }
-            """)
-            if i == len(parts) - 1:
-                button.clicked.connect(lambda checked, path=full_path: self.show_address_bar(path))
-            else:
-                button.clicked.connect(lambda checked, path=full_path: self.pathClicked.emit(path))
+                separator.show()
+            # Clickable button for path part with underscore wrapping
+            button = self._buttons[i]
+            button.setText(format_filename_with_underscore_wrap(name))
+            button.setProperty('crumbPath', full_path)
+            button.setProperty('crumbIsLast', i == len(parts) - 1)
             self.layout.addWidget(button)
+            button.show()
         # Add stretch to left-align breadcrumbs
         self.layout.addStretch()
 
@@ -20274,6 +20748,295 @@ class CollectionsWidget(QWidget):
         self.smart_value_input.clear()
 
 
+# Splits a name into alternating text and digit runs for natural sorting ("a10b" -> ['a', '10', 'b'])
+_NUM_SPLIT = re.compile(r'(\d+)').split
+
+def _sort_prefix(text):
+    """First 8 UTF-8 bytes of text as an int.
+
+    Orders the same way as text itself (UTF-8 preserves code point order), so putting it in front of a
+    name key settles most comparisons with one int compare; equal prefixes fall through to the full key.
+    """
+    return int.from_bytes(text[:8].encode('utf-8', 'surrogatepass')[:8].ljust(8, b'\0'), 'big')
+
+# Group-by-type sort categories; extensions not listed sort as "7_other"
+_EXT_CATEGORY = {}
+for _category, _extensions in (
+    ("1_images", ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')),
+    ("2_documents", ('.txt', '.pdf', '.doc', '.docx', '.rtf', '.odt')),
+    ("3_videos", ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm')),
+    ("4_audio", ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma')),
+    ("5_code", ('.py', '.js', '.html', '.css', '.cpp', '.java', '.c')),
+    ("6_archives", ('.zip', '.rar', '.7z', '.tar', '.gz')),
+):
+    _EXT_CATEGORY.update(dict.fromkeys(_extensions, _category))
+del _category, _extensions
+
+# Folder scans each tab keeps for reuse while the folder's mtime is unchanged
+_DIR_META_CACHE_MAX = 64
+
+# Standard folders listed first in the home folder and the filesystem root
+_STD_FOLDER_NAMES = ('Desktop', 'Documents', 'Downloads', 'Pictures', 'Music', 'Videos')
+_HOME_AND_ROOT = frozenset(os.path.normcase(os.path.abspath(p)) for p in (_HOME_DIR, os.sep))
+_std_home_folders = None
+
+def _standard_home_folders():
+    """Names of the standard folders that exist under the home directory (checked once per session)"""
+    global _std_home_folders
+    if _std_home_folders is None:
+        _std_home_folders = tuple(name for name in _STD_FOLDER_NAMES
+                                  if os.path.exists(os.path.join(_HOME_DIR, name)))
+    return _std_home_folders
+
+def _scan_dir_entries(folder_path, limit=None):
+    """Return {name: os.DirEntry} for folder_path in one scandir pass (raises OSError like os.listdir).
+
+    With limit, gives up and returns None as soon as more than limit non-hidden entries are seen.
+    """
+    with os.scandir(folder_path) as it:
+        if limit is None:
+            return {entry.name: entry for entry in it}
+        entries = {}
+        visible = 0
+        for entry in it:
+            entries[entry.name] = entry
+            if not entry.name.startswith('.'):
+                visible += 1
+                if visible > limit:
+                    return None
+        return entries
+
+# Filesystem types whose stat() is a network round-trip
+_NETWORK_FSTYPES = frozenset(('cifs', 'smbfs', 'smb3', 'nfs', 'nfs4', 'afpfs', 'webdav', 'davfs', 'fuse.sshfs', '9p'))
+_network_mounts = None
+
+def _is_network_path(path):
+    """True if path is a UNC path or lies on a network mount (mount table read once per session)"""
+    global _network_mounts
+    if path.startswith(('\\\\', '//')):
+        return True
+    if _network_mounts is None:
+        try:
+            _network_mounts = tuple(
+                os.path.normcase(p.mountpoint) for p in psutil.disk_partitions(all=True)
+                if p.fstype.lower() in _NETWORK_FSTYPES or 'remote' in p.opts)
+        except Exception:
+            _network_mounts = ()
+    path = os.path.normcase(os.path.abspath(path))
+    for mount in _network_mounts:
+        if path == mount or path.startswith(mount.rstrip(os.sep) + os.sep):
+            return True
+    return False
+
+def _prime_stat(entry):
+    try:
+        entry.stat()
+    except OSError:
+        pass
+
+def _stat_entries(entries, skip_dirs=False, parallel=False):
+    """Fill each DirEntry's stat cache, in inode order where that is cheap to know.
+
+    On Linux filesystems (and CIFS) stat()ing in inode order turns random inode-table reads into a
+    mostly sequential sweep on a cold cache; readdir already returned the inode numbers.
+    skip_dirs leaves directories unstat()ed for callers that never read their stat data; parallel
+    overlaps the round-trips of a network share on a thread pool instead.
+    """
+    if skip_dirs:
+        # is_dir() comes from the readdir entry type, so this filter costs no syscalls
+        entries = [entry for entry in entries if not _entry_is_dir(entry)]
+    if parallel:
+        with ThreadPoolExecutor(max_workers=16, thread_name_prefix="SortStat") as executor:
+            for _ in executor.map(_prime_stat, entries):
+                pass
+        return
+    if sys.platform != 'win32':
+        entries = sorted(entries, key=os.DirEntry.inode)
+    for entry in entries:
+        _prime_stat(entry)
+
+def _entry_is_dir(entry):
+    """DirEntry.is_dir() that, like os.path.isdir, reports False instead of raising"""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+def _path_signature(path):
+    """(st_mtime_ns, st_size, st_ino, is_dir) from a fresh stat of path; None if it cannot be stat()ed.
+
+    Any change to it (edit, replace by mv or rsync -t, file <-> folder) means the icon must be rebuilt.
+    Never taken from a DirEntry: _scan_folder_cached reuses those while only the folder's mtime is
+    unchanged, and in-place edits leave that alone.
+    """
+    try:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = os.lstat(path)  # dangling symlink
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino, stat.S_ISDIR(st.st_mode))
+
+def _path_signatures(paths, parallel=False):
+    """_path_signature for each path, in order; parallel overlaps the round-trips of a network share"""
+    if parallel:
+        with ThreadPoolExecutor(max_workers=16, thread_name_prefix="IconStat") as executor:
+            return list(executor.map(_path_signature, paths))
+    return [_path_signature(path) for path in paths]
+
+# scheme://[user[:pass]@]host[:port]/path for the remote browsers
+_FTP_URL_RE = re.compile(r'ftp://(?:(?P<user>[^:@/]+)(?::(?P<passwd>[^@/]*))?@)?(?P<host>[^:/]+)(?::(?P<port>\d+))?(?P<path>/.*)?')
+_SFTP_URL_RE = re.compile(r'sftp://(?:(?P<user>[^:@/]+)(?::(?P<passwd>[^@/]*))?@)?(?P<host>[^:/]+)(?::(?P<port>\d+))?(?P<path>/.*)?')
+
+# Recently listed remote directories: (protocol, user, host, port, path) -> (expiry, entries).
+# Only touched from the GUI thread.
+_remote_listing_cache = OrderedDict()
+_REMOTE_LISTING_CACHE_MAX = 32
+_REMOTE_LISTING_TTL = 30.0  # seconds
+
+def _cached_remote_listing(key):
+    """Return the cached listing for key if it is still fresh, else None"""
+    hit = _remote_listing_cache.get(key)
+    if hit is None:
+        return None
+    expiry, entries = hit
+    if time.monotonic() >= expiry:
+        del _remote_listing_cache[key]
+        return None
+    _remote_listing_cache.move_to_end(key)
+    return entries
+
+def _store_remote_listing(key, entries):
+    """Remember a complete listing for _REMOTE_LISTING_TTL seconds, evicting the least recently used"""
+    _remote_listing_cache[key] = (time.monotonic() + _REMOTE_LISTING_TTL, entries)
+    _remote_listing_cache.move_to_end(key)
+    while len(_remote_listing_cache) > _REMOTE_LISTING_CACHE_MAX:
+        _remote_listing_cache.popitem(last=False)
+
+# RemoteListThreads whose tab closed while they were still blocked on the network; held here,
+# unparented, until they finish so Qt never destroys a running thread
+_detached_remote_threads = set()
+
+@dataclass
+class RemoteEntry:
+    """One remote directory entry, parsed once when the listing arrives"""
+    text: str  # what the listing shows (raw LIST line for FTP)
+    name: str
+    size: Optional[int]
+    is_dir: bool
+
+def _parse_ftp_list_line(line):
+    """Parse one FTP LIST line (Unix or DOS/IIS style) into a RemoteEntry"""
+    parts = line.split(None, 8)
+    if len(parts) == 9 and parts[0][:1] in ('-', 'd', 'l'):
+        # drwxr-xr-x 2 owner group 4096 Jan 01 12:00 name [-> target]
+        name = parts[8]
+        if parts[0][0] == 'l' and ' -> ' in name:
+            name = name.split(' -> ', 1)[0]
+        size = int(parts[4]) if parts[4].isdigit() else None
+        return RemoteEntry(line, name, size, parts[0][0] == 'd')
+    parts = line.split(None, 3)
+    if len(parts) == 4 and (parts[2] == '<DIR>' or parts[2].isdigit()):
+        # 01-02-21  10:00AM  <DIR>|1234  name
+        is_dir = parts[2] == '<DIR>'
+        return RemoteEntry(line, parts[3], None if is_dir else int(parts[2]), is_dir)
+    # Unknown format: fall back to the last word, as the listing always did
+    words = line.split()
+    return RemoteEntry(line, words[-1] if words else line, None, False)
+
+
+class RemoteListThread(QThread):
+    """Background thread that connects to an FTP/SFTP server and streams one directory listing"""
+    connected = pyqtSignal(object, object)  # connection, SFTP transport (None for FTP)
+    entriesReceived = pyqtSignal(list)  # RemoteEntry batches
+    listingDone = pyqtSignal()
+    listingFailed = pyqtSignal(str)
+
+    # Entries per entriesReceived emission; keeps the GUI updating without one event per line
+    ENTRY_BATCH = 200
+
+    def __init__(self, protocol, host, port, user, passwd, path, list_entries=True, parent=None):
+        super().__init__(parent)
+        # list_entries=False only connects, e.g. when the listing is already cached
+        self.list_entries = list_entries
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.user = user
+        self.passwd = passwd
+        self.path = path
+        self._sock = None
+
+    def _watch_socket(self, sock):
+        """Remember the control socket so abort() can unblock it; honours an abort already requested"""
+        self._sock = sock
+        if self.isInterruptionRequested():
+            self.abort()
+
+    def abort(self):
+        """Unblock run() from the GUI thread; the pending network call fails and the thread finishes"""
+        import socket
+        self.requestInterruption()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def run(self):
+        """Do the blocking connect/login/list; results are delivered via signals as they arrive"""
+        pending = []
+
+        def add_entry(entry):
+            pending.append(entry)
+            if len(pending) >= self.ENTRY_BATCH:
+                self.entriesReceived.emit(pending[:])
+                del pending[:]
+
+        conn = transport = None
+        try:
+            # Imported here, on the worker thread, so startup never pays for paramiko/cryptography
+            if self.protocol == 'ftp':
+                import ftplib
+                conn = ftplib.FTP()
+                conn.connect(self.host, self.port, timeout=10)
+                self._watch_socket(conn.sock)
+                conn.login(self.user, self.passwd)
+                conn.cwd(self.path)
+                self.connected.emit(conn, None)
+                if self.list_entries:
+                    conn.retrlines('LIST', lambda line: add_entry(_parse_ftp_list_line(line)))
+            else:
+                import paramiko
+                import socket
+                # Own the socket so the connect is bounded and abort() can shut it down
+                sock = socket.create_connection((self.host, self.port), timeout=10)
+                self._watch_socket(sock)
+                transport = paramiko.Transport(sock)
+                transport.connect(username=self.user, password=self.passwd)
+                conn = paramiko.SFTPClient.from_transport(transport)
+                self.connected.emit(conn, transport)
+                if self.list_entries:
+                    for attr in conn.listdir_iter(self.path):
+                        is_dir = attr.st_mode is not None and stat.S_ISDIR(attr.st_mode)
+                        add_entry(RemoteEntry(attr.filename, attr.filename, attr.st_size, is_dir))
+        except Exception as e:
+            for closable in (conn, transport):
+                if closable is not None:
+                    try:
+                        closable.close()
+                    except Exception:
+                        pass
+            self.listingFailed.emit(str(e))
+            return
+        if pending:
+            self.entriesReceived.emit(pending)
+        if self.list_entries:
+            self.listingDone.emit()
+
+
 class FileManagerTab(QWidget):
     def prompt_credentials(self, url, default_user='', default_pass=''):
         from PyQt5.QtCore import Qt
@@ -20356,6 +21119,16 @@ class FileManagerTab(QWidget):
         return None, None
     """Individual file manager tab"""
     
+    @property
+    def tab_manager(self):
+        return self._tab_manager
+
+    @tab_manager.setter
+    def tab_manager(self, manager):
+        # Tabs move between managers in dual-pane mode; keep the main window reference in step
+        self._tab_manager = manager
+        self._main_window = getattr(manager, 'main_window', None) if manager else None
+
     def __init__(self, initial_path, tab_manager):
         super().__init__()
     # FileManagerTab.__init__ called
@@ -20367,6 +21140,40 @@ class FileManagerTab(QWidget):
         # Navigation history
         self.navigation_history = [initial_path]
         self.history_index = 0
+
+        # Bumped by every refresh_thumbnail_view so late callbacks of older refreshes can tell
+        self._refresh_epoch = 0
+
+        # Coalesces bursts of directory-change notifications into one refresh
+        self._dir_refresh_timer = QTimer(self)
+        self._dir_refresh_timer.setSingleShot(True)
+        self._dir_refresh_timer.setInterval(150)
+        self._dir_refresh_timer.timeout.connect(self._refresh_after_dir_change)
+
+        # Debounced auto-width relayouts for tab and scroll-viewport resizes
+        self._tab_resize_timer = QTimer(self)
+        self._tab_resize_timer.setSingleShot(True)
+        self._tab_resize_timer.setInterval(150)
+        self._tab_resize_timer.timeout.connect(self._do_relayout)
+        self._viewport_resize_timer = QTimer(self)
+        self._viewport_resize_timer.setSingleShot(True)
+        self._viewport_resize_timer.setInterval(50)  # Quick response for viewport changes
+        self._viewport_resize_timer.timeout.connect(self._do_relayout)
+
+        # Recent folder scans keyed by (path, folder mtime); see _scan_folder_cached
+        self._dir_meta_cache = OrderedDict()
+
+        # Icons from the last _load_icons_standard as {name: (widget, _path_signature)}, reused on the
+        # next refresh of the same folder; the key is (folder, thumbnail size, icon-only)
+        self._icon_widgets_by_name = {}
+        self._icon_widgets_key = None
+
+        # Running RemoteListThreads, including ones a newer browse superseded; see _stop_remote_activity
+        self._remote_threads = set()
+        # Idle connections for Download/Upload, set by _on_remote_connected
+        self.ftp_conn = None
+        self.sftp_conn = None
+        self.sftp_conn_transport = None
         
         # Sorting options (per tab) - set defaults first
         self.sort_by = "name"  # name, size, date, type, extension
@@ -20377,8 +21184,8 @@ class FileManagerTab(QWidget):
         self.natural_sort = True  # Natural sorting for numbers in names
         
         # Load saved sort settings BEFORE setting up UI
-        if self.tab_manager and self.tab_manager.main_window:
-            self.tab_manager.main_window.load_tab_sort_settings(self)
+        if self._main_window:
+            self._main_window.load_tab_sort_settings(self)
         
         self.setup_tab_ui()
         
@@ -20417,200 +21224,93 @@ class FileManagerTab(QWidget):
                 self.browse_sftp(self.current_folder)
             elif self.current_folder == "__MY_COMPUTER__":
                 # Configure models to show connected drives only
-                try:
-                    self.is_drive_list = True
-                    drives_filter = QDir.Drives | QDir.Dirs | QDir.NoDotAndDotDot
+                self.show_my_computer()
+            else:
+                self.navigate_to(self.current_folder)
 
-                    # Configure list model to show drives
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_model.setFilter(drives_filter)
-                    # Use empty rootPath so QFileSystemModel enumerates drives on Windows
-                    try:
-                        self.list_model.setRootPath("")
-                        self.list_view.setModel(self.list_model)
-                        self.list_view.setRootIndex(self.list_model.index(""))
-                    except Exception:
-                        # Fallback to QDir.rootPath()
-                        self.list_model.setRootPath(QDir.rootPath())
-                        self.list_view.setModel(self.list_model)
-                        self.list_view.setRootIndex(self.list_model.index(QDir.rootPath()))
+    def _refresh_after_dir_change(self):
+        try:
+            self.refresh_current_view()
+        except Exception:
+            pass
 
-                    # Configure detail model similarly
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_model.setFilter(drives_filter)
-                    try:
-                        self.detail_model.setRootPath("")
-                        self.detail_view.setModel(self.detail_model)
-                        self.detail_view.setRootIndex(self.detail_model.index(""))
-                    except Exception:
-                        self.detail_model.setRootPath(QDir.rootPath())
-                        self.detail_view.setModel(self.detail_model)
-                        self.detail_view.setRootIndex(self.detail_model.index(QDir.rootPath()))
+    def _attach_drive_models(self):
+        """Point the list view at the drive-list model now and the detail view on the next event-loop tick.
 
-                    # Update UI elements
-                    if hasattr(self, 'address_bar'):
-                        self.address_bar.setText("My Computer")
-                    if hasattr(self, 'breadcrumb'):
-                        try:
-                            self.breadcrumb.set_path("My Computer")
-                        except Exception:
-                            pass
-                    # Sync visible widget to the main window's current view mode so My Computer follows other tabs
-                    try:
-                        main_window = self.tab_manager.main_window if self.tab_manager else None
-                        mode = None
-                        if main_window and hasattr(main_window, 'view_mode_manager'):
-                            mode = main_window.view_mode_manager.get_mode()
-                        if mode == ViewModeManager.THUMBNAIL_VIEW:
-                            # Thumbnail view - use thumbnail widget
-                            try:
-                                self.view_stack.setCurrentWidget(self.thumbnail_view_widget)
-                            except Exception:
-                                self.view_stack.setCurrentWidget(self.list_view)
-                            try:
-                                self.refresh_thumbnail_view()
-                            except Exception:
-                                pass
-                        elif mode == ViewModeManager.ICON_VIEW:
-                            # Icon view uses same widget as thumbnail but mark icon flag
-                            try:
-                                self.view_stack.setCurrentWidget(self.thumbnail_view_widget)
-                                setattr(self, 'icon_view_active', True)
-                            except Exception:
-                                self.view_stack.setCurrentWidget(self.list_view)
-                            try:
-                                self.refresh_current_view()
-                            except Exception:
-                                pass
-                        elif mode == ViewModeManager.LIST_VIEW:
-                            try:
-                                self.view_stack.setCurrentWidget(self.list_view)
-                                self.refresh_list_view()
-                            except Exception:
-                                pass
-                        elif mode == ViewModeManager.DETAIL_VIEW:
-                            try:
-                                self.view_stack.setCurrentWidget(self.detail_view)
-                                self.refresh_detail_view()
-                            except Exception:
-                                pass
-                        else:
-                            # Default to list view
-                            try:
-                                self.view_stack.setCurrentWidget(self.list_view)
-                                self.refresh_list_view()
-                            except Exception:
-                                pass
+        Each setRootPath("") starts a drive enumeration, which can stall on mapped network drives,
+        so only one happens before My Computer is shown.
+        """
+        if getattr(self, '_drive_list_model', None) is None:
+            drives_filter = QDir.Drives | QDir.Dirs | QDir.NoDotAndDotDot
+            self._drive_list_model = FormattedFileSystemModel()
+            self._drive_detail_model = FormattedFileSystemModel()
+            for model in (self._drive_list_model, self._drive_detail_model):
+                model.setFilter(drives_filter)
+                # The drive list is static enough to skip the per-root watcher and symlink lookups
+                model.setOption(QFileSystemModel.DontWatchForChanges, True)
+                model.setOption(QFileSystemModel.DontResolveSymlinks, True)
+        self._bind_drive_model(self.list_view, self._drive_list_model)
+        self.list_model = self._drive_list_model
+        self.detail_model = self._drive_detail_model
+        QTimer.singleShot(0, self._attach_drive_detail_model)
+
+    def _attach_drive_detail_model(self):
+        # Skip if the tab left My Computer meanwhile or refresh_detail_view already bound it
+        if not self.is_drive_list or self.detail_view.model() is self._drive_detail_model:
+            return
+        self._bind_drive_model(self.detail_view, self._drive_detail_model)
 
-                    except Exception:
-                        try:
-                            self.view_stack.setCurrentWidget(self.list_view)
-                        except Exception:
-                            pass
+    @staticmethod
+    def _bind_drive_model(view, model):
+        # Use empty rootPath so QFileSystemModel enumerates drives on Windows
+        try:
+            model.setRootPath("")
+            view.setModel(model)
+            view.setRootIndex(model.index(""))
+        except Exception:
+            # Fallback to QDir.rootPath()
+            model.setRootPath(QDir.rootPath())
+            view.setModel(model)
+            view.setRootIndex(model.index(QDir.rootPath()))
 
-                    # Update tab title
-                    try:
-                        if self.tab_manager:
-                            self.tab_manager.update_tab_title(self, " My Computer ")
-                    except Exception:
-                        pass
-                except Exception:
-                    # Fall back to home if something goes wrong
-                    self.navigate_to(os.path.expanduser("~"))
-            else:
-                self.navigate_to(self.current_folder)
+    def _leave_drive_list(self):
+        """Switch back from the drive list to this tab's normal filesystem models"""
+        self.is_drive_list = False
+        self.list_model = self._fs_list_model
+        self.list_view.setModel(self.list_model)
+        self.detail_model = self._fs_detail_model
+        self.detail_view.setModel(self.detail_model)
+
+    def _show_view_for_mode(self, mode):
+        """Show and refresh the view widget for mode (the list view for unknown modes)"""
+        widget_attr, refresh = _VIEW_MODE_DISPATCH.get(mode, _DEFAULT_VIEW_DISPATCH)
+        if mode == ViewModeManager.ICON_VIEW:
+            self.icon_view_active = True
+        # The view widgets are all built in setup_tab_ui, so only the refresh can raise
+        self.view_stack.setCurrentWidget(getattr(self, widget_attr))
+        getattr(self, refresh)()
 
     def show_my_computer(self):
         """Configure this tab to show connected drives (My Computer)"""
         try:
             self.is_drive_list = True
             # Mark current_folder as sentinel so navigation state is clear
-            try:
-                self.current_folder = "__MY_COMPUTER__"
-            except Exception:
-                pass
-            drives_filter = QDir.Drives | QDir.Dirs | QDir.NoDotAndDotDot
-
-            # List model
-            self.list_model = FormattedFileSystemModel()
-            self.list_model.setFilter(drives_filter)
-            try:
-                self.list_model.setRootPath("")
-                self.list_view.setModel(self.list_model)
-                self.list_view.setRootIndex(self.list_model.index(""))
-            except Exception:
-                self.list_model.setRootPath(QDir.rootPath())
-                self.list_view.setModel(self.list_model)
-                self.list_view.setRootIndex(self.list_model.index(QDir.rootPath()))
-
-            # Detail model
-            self.detail_model = FormattedFileSystemModel()
-            self.detail_model.setFilter(drives_filter)
-            try:
-                self.detail_model.setRootPath("")
-                self.detail_view.setModel(self.detail_model)
-                self.detail_view.setRootIndex(self.detail_model.index(""))
-            except Exception:
-                self.detail_model.setRootPath(QDir.rootPath())
-                self.detail_view.setModel(self.detail_model)
-                self.detail_view.setRootIndex(self.detail_model.index(QDir.rootPath()))
+            self.current_folder = "__MY_COMPUTER__"
+            # List and detail models
+            self._attach_drive_models()
 
             if hasattr(self, 'address_bar'):
                 self.address_bar.setText("My Computer")
-            if hasattr(self, 'breadcrumb'):
-                try:
-                    self.breadcrumb.set_path("My Computer")
-                except Exception:
-                    pass
+            self.breadcrumb.set_path("My Computer")
 
-            # Sync view mode
+            # Sync visible widget to the main window's current view mode so My Computer follows other tabs;
+            # only the view refresh can realistically fail here
+            view_mode_manager = getattr(self._main_window, 'view_mode_manager', None)
+            mode = view_mode_manager.get_mode() if view_mode_manager is not None else None
             try:
-                main_window = self.tab_manager.main_window if self.tab_manager else None
-                mode = None
-                if main_window and hasattr(main_window, 'view_mode_manager'):
-                    mode = main_window.view_mode_manager.get_mode()
-                if mode == ViewModeManager.THUMBNAIL_VIEW:
-                    try:
-                        self.view_stack.setCurrentWidget(self.thumbnail_view_widget)
-                    except Exception:
-                        self.view_stack.setCurrentWidget(self.list_view)
-                    try:
-                        self.refresh_thumbnail_view()
-                    except Exception:
-                        pass
-                elif mode == ViewModeManager.ICON_VIEW:
-                    try:
-                        self.view_stack.setCurrentWidget(self.thumbnail_view_widget)
-                        setattr(self, 'icon_view_active', True)
-                    except Exception:
-                        self.view_stack.setCurrentWidget(self.list_view)
-                    try:
-                        self.refresh_current_view()
-                    except Exception:
-                        pass
-                elif mode == ViewModeManager.LIST_VIEW:
-                    try:
-                        self.view_stack.setCurrentWidget(self.list_view)
-                        self.refresh_list_view()
-                    except Exception:
-                        pass
-                elif mode == ViewModeManager.DETAIL_VIEW:
-                    try:
-                        self.view_stack.setCurrentWidget(self.detail_view)
-                        self.refresh_detail_view()
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        self.view_stack.setCurrentWidget(self.list_view)
-                        self.refresh_list_view()
-                    except Exception:
-                        pass
+                self._show_view_for_mode(mode)
             except Exception:
-                try:
-                    self.view_stack.setCurrentWidget(self.list_view)
-                except Exception:
-                    pass
+                self.view_stack.setCurrentWidget(self.list_view)
 
             try:
                 if self.tab_manager:
@@ -20620,7 +21320,7 @@ class FileManagerTab(QWidget):
         except Exception:
             # As a safe fallback, navigate to user's home
             try:
-                self.navigate_to(os.path.expanduser('~'))
+                self.navigate_to(_HOME_DIR)
             except Exception:
                 pass
 
@@ -20636,20 +21336,17 @@ class FileManagerTab(QWidget):
             if self.tab_manager:
                 self.tab_manager.new_tab(path)
             return
-        if os.path.isdir(path):
-            self.navigate_to(path)
-            self.address_bar.setStyleSheet("")
-            self.address_bar.setToolTip("")
+        if _is_dir_fast(path):
+            self.navigate_to(path, is_dir=True)
+            self._mark_address_bar()
         else:
-            self.address_bar.setStyleSheet("background-color: #ffcccc;")
-            self.address_bar.setToolTip("Invalid directory path")
+            self._mark_address_bar("Invalid directory path")
 
     def browse_ftp(self, url):
         # Parse ftp://[user[:pass]@]host[:port]/path
-        match = re.match(r'ftp://(?:(?P<user>[^:@/]+)(?::(?P<passwd>[^@/]*))?@)?(?P<host>[^:/]+)(?::(?P<port>\\d+))?(?P<path>/.*)?', url)
+        match = _FTP_URL_RE.match(url)
         if not match:
-            self.address_bar.setStyleSheet("background-color: #ffcccc;")
-            self.address_bar.setToolTip("Invalid FTP address")
+            self._mark_address_bar("Invalid FTP address")
             return
         user = match.group('user') or ''
         passwd = match.group('passwd') or ''
@@ -20661,29 +21358,13 @@ class FileManagerTab(QWidget):
             if u is None:
                 return
             user, passwd = u, p
-        try:
-            ftp = ftplib.FTP()
-            ftp.connect(host, port, timeout=10)
-            ftp.login(user, passwd)
-            ftp.cwd(path)
-            files = []
-            ftp.retrlines('LIST', files.append)
-            self.ftp_conn = ftp
-            self.ftp_conn_url = url
-            self.ftp_conn_path = path
-            self.show_remote_listing(files, url, protocol='ftp')
-            self.address_bar.setStyleSheet("")
-            self.address_bar.setToolTip("")
-        except Exception as e:
-            self.address_bar.setStyleSheet("background-color: #ffcccc;")
-            self.address_bar.setToolTip(f"FTP error: {e}")
+        self._start_remote_listing('ftp', url, host, port, user, passwd, path)
 
     def browse_sftp(self, url):
         # Parse sftp://[user[:pass]@]host[:port]/path
-        match = re.match(r'sftp://(?:(?P<user>[^:@/]+)(?::(?P<passwd>[^@/]*))?@)?(?P<host>[^:/]+)(?::(?P<port>\\d+))?(?P<path>/.*)?', url)
+        match = _SFTP_URL_RE.match(url)
         if not match:
-            self.address_bar.setStyleSheet("background-color: #ffcccc;")
-            self.address_bar.setToolTip("Invalid SFTP address")
+            self._mark_address_bar("Invalid SFTP address")
             return
         user = match.group('user') or ''
         passwd = match.group('passwd') or ''
@@ -20695,90 +21376,242 @@ class FileManagerTab(QWidget):
             if u is None:
                 return
             user, passwd = u, p
-        try:
-            transport = paramiko.Transport((host, port))
-            transport.connect(username=user, password=passwd)
-            sftp = paramiko.SFTPClient.from_transport(transport)
-            files = sftp.listdir(path)
-            self.sftp_conn = sftp
+        self._start_remote_listing('sftp', url, host, port, user, passwd, path)
+
+    def _start_remote_listing(self, protocol, url, host, port, user, passwd, path):
+        """Connect and list path on a RemoteListThread so the event loop never blocks on the network"""
+        cached = _cached_remote_listing((protocol, user, host, port, path))
+        if cached is not None:
+            # Show the recent listing at once; the thread only reconnects for download/upload,
+            # so those stay disabled until _on_remote_connected has the new connection
+            self.show_remote_listing(cached, url, protocol=protocol)
+            self._set_remote_actions_enabled(False)
+        # Parented to the tab, so the app's shutdown finds it; close_tab stops it first
+        thread = RemoteListThread(protocol, host, port, user, passwd, path,
+                                  list_entries=cached is None, parent=self)
+        thread.url = url
+        # Bound-method slots; each reads its request back from the sending thread
+        thread.connected.connect(self._on_remote_connected, Qt.QueuedConnection)
+        thread.entriesReceived.connect(self._on_remote_entries, Qt.QueuedConnection)
+        thread.listingDone.connect(self._on_remote_listing_done, Qt.QueuedConnection)
+        thread.listingFailed.connect(self._on_remote_listing_failed, Qt.QueuedConnection)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda t=thread: self._remote_threads.discard(t))
+        self._remote_threads.add(thread)
+        self._remote_list_thread = thread
+        thread.start()
+
+    def _stop_remote_activity(self):
+        """Stop any remote listing threads and close the FTP/SFTP connections; called before the tab goes away"""
+        self._remote_list_thread = None
+        for thread in list(self._remote_threads):
+            thread.abort()
+            if not thread.wait(2000):
+                # Still stuck in connect(); let it finish on its own rather than be destroyed running
+                thread.setParent(None)
+                _detached_remote_threads.add(thread)
+                thread.finished.connect(lambda t=thread: _detached_remote_threads.discard(t))
+        self._remote_threads.clear()
+        for name in ('ftp_conn', 'sftp_conn', 'sftp_conn_transport'):
+            conn = getattr(self, name, None)
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                setattr(self, name, None)
+
+    def _current_remote_sender(self):
+        """Return the RemoteListThread that sent the current signal, or None if a newer browse replaced it"""
+        thread = self.sender()
+        if thread is None or thread is not getattr(self, '_remote_list_thread', None):
+            return None
+        return thread
+
+    def _on_remote_connected(self, conn, transport):
+        """Store the connection and show an empty listing that entries stream into; runs on the GUI thread"""
+        thread = self._current_remote_sender()
+        if thread is None:
+            return
+        protocol, url, path = thread.protocol, thread.url, thread.path
+        if protocol == 'ftp':
+            self.ftp_conn = conn
+            self.ftp_conn_url = url
+            self.ftp_conn_path = path
+        else:
+            self.sftp_conn = conn
             self.sftp_conn_transport = transport
             self.sftp_conn_url = url
             self.sftp_conn_path = path
-            self.show_remote_listing(files, url, protocol='sftp')
-            self.address_bar.setStyleSheet("")
-            self.address_bar.setToolTip("")
-        except Exception as e:
-            self.address_bar.setStyleSheet("background-color: #ffcccc;")
-            self.address_bar.setToolTip(f"SFTP error: {e}")
+        if thread.list_entries:
+            try:
+                self.show_remote_listing([], url, protocol=protocol)
+            except Exception as e:
+                self._show_remote_error(protocol, str(e))
+                return
+            # The connection is busy with LIST until listingDone; a RETR/STOR now would corrupt it
+            self._set_remote_actions_enabled(False)
+        else:
+            self._set_remote_actions_enabled(True)
+        self._mark_address_bar()
+
+    def _on_remote_entries(self, entries):
+        # Ignore stragglers from a listing that a newer browse has replaced
+        if self._current_remote_sender() is None:
+            return
+        self._remote_entries.extend(entries)
+        list_widget = getattr(self, '_remote_view_list', None)
+        if list_widget is not None:
+            list_widget.addItems([entry.text for entry in entries])
+
+    def _on_remote_listing_done(self):
+        thread = self._current_remote_sender()
+        if thread is not None:
+            key = (thread.protocol, thread.user, thread.host, thread.port, thread.path)
+            _store_remote_listing(key, self._remote_entries)
+            self._set_remote_actions_enabled(True)
+
+    def _on_remote_listing_failed(self, message):
+        thread = self._current_remote_sender()
+        if thread is not None:
+            self._show_remote_error(thread.protocol, message)
+
+    def _set_remote_actions_enabled(self, enabled):
+        """Enable or disable Download/Upload, which may only run while the connection is idle"""
+        if getattr(self, '_remote_view', None) is not None:
+            self._remote_download_btn.setEnabled(enabled)
+            self._remote_upload_btn.setEnabled(enabled)
+
+    def _show_remote_error(self, protocol, message):
+        self._mark_address_bar(f"{protocol.upper()} error: {message}")
+
+    def _mark_address_bar(self, error=None):
+        """Flag the address bar invalid with error as its tooltip, or clear the flag when error is None.
+
+        The highlight comes from a dynamic-property rule set once, so toggling it only repolishes.
+        """
+        bar = getattr(self, 'address_bar', None)
+        if bar is None:
+            return
+        invalid = error is not None
+        if bar.property('invalid') is None:
+            bar.setStyleSheet('QLineEdit[invalid="true"] { background-color: #ffcccc; }')
+        elif bool(bar.property('invalid')) == invalid:
+            bar.setToolTip(error or "")
+            return
+        bar.setProperty('invalid', invalid)
+        bar.style().unpolish(bar)
+        bar.style().polish(bar)
+        bar.setToolTip(error or "")
+
+    def _ensure_remote_view(self):
+        """Build the remote listing page once per tab and return its list widget"""
+        if getattr(self, '_remote_view', None) is None:
+            from PyQt5.QtWidgets import QListWidget, QVBoxLayout, QWidget, QLabel, QHBoxLayout
+            remote_widget = QWidget()
+            layout = QVBoxLayout()
+            self._remote_url_label = QLabel()
+            layout.addWidget(self._remote_url_label)
+            list_widget = QListWidget()
+            # One line of text per entry, so the view can skip measuring each item
+            list_widget.setUniformItemSizes(True)
+            layout.addWidget(list_widget)
+            btn_layout = QHBoxLayout()
+            download_btn = QPushButton('Download Selected')
+            upload_btn = QPushButton('Upload File...')
+            btn_layout.addWidget(download_btn)
+            btn_layout.addWidget(upload_btn)
+            layout.addLayout(btn_layout)
+            remote_widget.setLayout(layout)
+            # The buttons act on whatever listing is current, so they are connected only once
+            download_btn.clicked.connect(self._download_remote_selection)
+            upload_btn.clicked.connect(self._upload_to_remote)
+            self.view_stack.addWidget(remote_widget)
+            self._remote_view = remote_widget
+            self._remote_view_list = list_widget
+            self._remote_download_btn = download_btn
+            self._remote_upload_btn = upload_btn
+        return self._remote_view_list
+
+    def _remote_connection(self, protocol):
+        """Return the idle connection for protocol, warning the user if it is not ready yet"""
+        conn = self.ftp_conn if protocol == 'ftp' else self.sftp_conn
+        if conn is None:
+            QMessageBox.warning(self, 'Not connected', 'The remote connection is not ready yet.')
+        return conn
 
     def show_remote_listing(self, files, url, protocol=None):
         # Replace file view with a simple list for remote files, with upload/download
-        from PyQt5.QtWidgets import QListWidget, QVBoxLayout, QWidget, QLabel, QHBoxLayout
-        remote_widget = QWidget()
-        layout = QVBoxLayout()
-        layout.addWidget(QLabel(f"Remote listing: {url}"))
-        list_widget = QListWidget()
-        for f in files:
-            list_widget.addItem(str(f))
-        layout.addWidget(list_widget)
-        btn_layout = QHBoxLayout()
-        download_btn = QPushButton('Download Selected')
-        upload_btn = QPushButton('Upload File...')
-        btn_layout.addWidget(download_btn)
-        btn_layout.addWidget(upload_btn)
-        layout.addLayout(btn_layout)
-        remote_widget.setLayout(layout)
-        self.view_stack.addWidget(remote_widget)
-        self.view_stack.setCurrentWidget(remote_widget)
-
-        def do_download():
-            selected = list_widget.currentItem()
-            if not selected:
-                QMessageBox.warning(self, 'No selection', 'Select a file to download.')
-                return
-            fname = selected.text().split()[-1]  # crude, works for FTP LIST output or SFTP name
-            file_dialog = QFileDialog(self, 'Save As')
-            file_dialog.setAcceptMode(QFileDialog.AcceptSave)
-            file_dialog.selectFile(fname)
-            file_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-            if file_dialog.exec_() == QFileDialog.Accepted:
-                save_path = file_dialog.selectedFiles()[0]
-            else:
-                return
-            try:
-                if protocol == 'ftp':
-                    with open(save_path, 'wb') as f:
-                        self.ftp_conn.retrbinary(f'RETR {fname}', f.write)
-                elif protocol == 'sftp':
-                    self.sftp_conn.get(self.sftp_conn_path.rstrip('/') + '/' + fname, save_path)
-                QMessageBox.information(self, 'Download', f'Downloaded {fname} to {save_path}')
-            except Exception as e:
-                QMessageBox.critical(self, 'Download Error', str(e))
+        list_widget = self._ensure_remote_view()
+        self._remote_protocol = protocol
+        self._remote_url_label.setText(f"Remote listing: {url}")
+        # RemoteEntry objects, row for row with the list widget
+        self._remote_entries = list(files)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.clear()
+        if files:
+            list_widget.addItems([entry.text for entry in files])
+        list_widget.setUpdatesEnabled(True)
+        self.view_stack.setCurrentWidget(self._remote_view)
+        return list_widget
+
+    def _download_remote_selection(self):
+        protocol = getattr(self, '_remote_protocol', None)
+        if self._remote_connection(protocol) is None:
+            return
+        row = self._remote_view_list.currentRow()
+        if not 0 <= row < len(self._remote_entries):
+            QMessageBox.warning(self, 'No selection', 'Select a file to download.')
+            return
+        fname = self._remote_entries[row].name
+        file_dialog = QFileDialog(self, 'Save As')
+        file_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        file_dialog.selectFile(fname)
+        file_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        # Skip per-folder icon lookups, which stat every directory shown (slow on network mounts)
+        file_dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+        if file_dialog.exec_() == QFileDialog.Accepted:
+            save_path = file_dialog.selectedFiles()[0]
+        else:
+            return
+        try:
+            if protocol == 'ftp':
+                with open(save_path, 'wb') as f:
+                    self.ftp_conn.retrbinary(f'RETR {fname}', f.write)
+            elif protocol == 'sftp':
+                self.sftp_conn.get(self.sftp_conn_path.rstrip('/') + '/' + fname, save_path)
+            QMessageBox.information(self, 'Download', f'Downloaded {fname} to {save_path}')
+        except Exception as e:
+            QMessageBox.critical(self, 'Download Error', str(e))
 
-        def do_upload():
-            file_path, _ = QFileDialog.getOpenFileName(self, 'Select file to upload')
-            if not file_path:
-                return
-            fname = os.path.basename(file_path)
-            try:
-                if protocol == 'ftp':
-                    with open(file_path, 'rb') as f:
-                        self.ftp_conn.storbinary(f'STOR {fname}', f)
-                elif protocol == 'sftp':
-                    self.sftp_conn.put(file_path, self.sftp_conn_path.rstrip('/') + '/' + fname)
-                QMessageBox.information(self, 'Upload', f'Uploaded {fname} to remote folder')
-            except Exception as e:
-                QMessageBox.critical(self, 'Upload Error', str(e))
+    def _upload_to_remote(self):
+        protocol = getattr(self, '_remote_protocol', None)
+        if self._remote_connection(protocol) is None:
+            return
+        file_path, _ = QFileDialog.getOpenFileName(self, 'Select file to upload',
+                                                   options=QFileDialog.DontUseCustomDirectoryIcons)
+        if not file_path:
+            return
+        fname = os.path.basename(file_path)
+        try:
+            if protocol == 'ftp':
+                with open(file_path, 'rb') as f:
+                    self.ftp_conn.storbinary(f'STOR {fname}', f)
+            elif protocol == 'sftp':
+                self.sftp_conn.put(file_path, self.sftp_conn_path.rstrip('/') + '/' + fname)
+            QMessageBox.information(self, 'Upload', f'Uploaded {fname} to remote folder')
+        except Exception as e:
+            QMessageBox.critical(self, 'Upload Error', str(e))
 
-        download_btn.clicked.connect(do_download)
-        upload_btn.clicked.connect(do_upload)
+    def navigate_to(self, path, add_to_history=True, is_dir=None):
+        """Navigate to the specified path
 
-    def navigate_to(self, path, add_to_history=True):
-        """Navigate to the specified path"""
+        is_dir may be passed by callers that have just checked the path, to skip another stat.
+        """
         # Only save sort settings if we're actually changing folders
         if hasattr(self, 'current_folder') and self.current_folder != path:
-            if hasattr(self, 'tab_manager') and self.tab_manager and hasattr(self.tab_manager, 'main_window'):
-                self.tab_manager.main_window.save_tab_sort_settings(self)
+            if self._main_window is not None:
+                self._main_window.save_tab_sort_settings(self)
 
         # Ensure path is a string
         if not isinstance(path, str):
@@ -20792,8 +21625,9 @@ class FileManagerTab(QWidget):
                 # navigation will work across My Computer entries.
                 if add_to_history:
                     try:
-                        # Trim any forward history when navigating to a new location
-                        self.navigation_history = self.navigation_history[:self.history_index + 1]
+                        # Trim any forward history in place when navigating to a new location
+                        if self.history_index + 1 < len(self.navigation_history):
+                            del self.navigation_history[self.history_index + 1:]
                     except Exception:
                         self.navigation_history = getattr(self, 'navigation_history', [])
                         self.history_index = getattr(self, 'history_index', -1)
@@ -20804,42 +21638,39 @@ class FileManagerTab(QWidget):
             except Exception:
                 # If show_my_computer fails, fall back to home
                 try:
-                    self.navigate_to(os.path.expanduser("~"))
+                    self.navigate_to(_HOME_DIR)
                 except Exception:
                     pass
                 return
 
-        if os.path.exists(path) and os.path.isdir(path):
+        if is_dir is None:
+            is_dir = _is_dir_fast(path)
+        if is_dir:
             # If we were showing the drive list (My Computer), switch back to normal
             # filesystem models so the directory loads correctly in this tab.
             try:
                 if getattr(self, 'is_drive_list', False):
-                    self.is_drive_list = False
-                    # Recreate normal filesystem models for listing and details
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_view.setModel(self.list_model)
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_view.setModel(self.detail_model)
+                    # Restore normal filesystem models for listing and details
+                    self._leave_drive_list()
             except Exception:
                 pass
             self.current_folder = path
             self.breadcrumb.set_path(path)
             if hasattr(self, 'address_bar'):
                 self.address_bar.setText(path)
-                self.address_bar.setStyleSheet("")
-                self.address_bar.setToolTip("")
+                self._mark_address_bar()
 
             # Load sort settings for the new folder
-            if hasattr(self, 'tab_manager') and self.tab_manager and hasattr(self.tab_manager, 'main_window'):
-                self.tab_manager.main_window.load_tab_sort_settings(self)
+            if self._main_window is not None:
+                self._main_window.load_tab_sort_settings(self)
 
             self.refresh_current_view()
 
             # Register directory with background monitor to auto-refresh on changes
             try:
-                if hasattr(self, 'tab_manager') and self.tab_manager and hasattr(self.tab_manager, 'main_window'):
-                    main = self.tab_manager.main_window
-                    if hasattr(main, 'background_monitor') and main.background_monitor:
+                main = self._main_window
+                if main is not None:
+                    if getattr(main, 'background_monitor', None):
                         # Remove previous directory if any
                         try:
                             prev = getattr(self, '_monitored_directory', None)
@@ -20847,12 +21678,11 @@ class FileManagerTab(QWidget):
                                 main.background_monitor.remove_directory(prev)
                         except Exception:
                             pass
-                        # Add new directory monitor and refresh tab when change detected
+                        # Add new directory monitor and refresh tab when change detected;
+                        # the monitor delivers this on the GUI thread, so the timer is safe to start
                         def _on_dir_changed(d):
-                            try:
-                                self.refresh_current_view()
-                            except Exception:
-                                pass
+                            if not self._dir_refresh_timer.isActive():
+                                self._dir_refresh_timer.start()
                         main.background_monitor.add_directory(path, _on_dir_changed)
                         self._monitored_directory = path
             except Exception:
@@ -20861,7 +21691,8 @@ class FileManagerTab(QWidget):
             # Add to navigation history if this is a new navigation (not back/forward)
             if add_to_history:
                 # Remove any forward history if we're navigating to a new location
-                self.navigation_history = self.navigation_history[:self.history_index + 1]
+                if self.history_index + 1 < len(self.navigation_history):
+                    del self.navigation_history[self.history_index + 1:]
                 # Add new path if it's different from current
                 if not self.navigation_history or self.navigation_history[-1] != path:
                     self.navigation_history.append(path)
@@ -20879,9 +21710,7 @@ class FileManagerTab(QWidget):
             if hasattr(self, 'tab_manager') and self.tab_manager:
                 self.tab_manager.update_tab_title(self, padded_title)
         else:
-            if hasattr(self, 'address_bar'):
-                self.address_bar.setStyleSheet("background-color: #ffcccc;")
-                self.address_bar.setToolTip("Invalid directory path")
+            self._mark_address_bar("Invalid directory path")
         
     def setup_thumbnail_view(self):
         """Setup thumbnail view for this tab (replaces icon view)"""
@@ -20915,7 +21744,9 @@ class FileManagerTab(QWidget):
     def setup_list_view(self):
         """Setup list view for this tab"""
         self.list_view = QListView()
-        self.list_model = FormattedFileSystemModel()
+        # Normal folder model, kept for the life of the tab (drive lists use their own)
+        self._fs_list_model = FormattedFileSystemModel()
+        self.list_model = self._fs_list_model
         self.list_view.setModel(self.list_model)
         # Enable word wrapping for long names with underscores
         self.list_view.setWordWrap(True)
@@ -20931,7 +21762,8 @@ class FileManagerTab(QWidget):
     def setup_detail_view(self):
         """Setup detail view for this tab"""
         self.detail_view = QTableView()
-        self.detail_model = FormattedFileSystemModel()
+        self._fs_detail_model = FormattedFileSystemModel()
+        self.detail_model = self._fs_detail_model
         self.detail_view.setModel(self.detail_model)
         # Enable word wrapping for long names with underscores
         self.detail_view.setWordWrap(True)
@@ -20950,27 +21782,30 @@ class FileManagerTab(QWidget):
             # If this tab is a My Computer drive-list and a drive was clicked, open it immediately
             try:
                 if getattr(self, 'is_drive_list', False):
-                    # Reset drive-list flag so tab behaves like a normal folder tab
-                    self.is_drive_list = False
-                    # Recreate models for normal listing
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_view.setModel(self.list_model)
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_view.setModel(self.detail_model)
+                    # Reset drive-list flag and models so tab behaves like a normal folder tab
+                    self._leave_drive_list()
                     # Navigate into the clicked drive
                     if os.path.isdir(file_path):
                         self.navigate_to(file_path)
                         return
             except Exception:
                 pass
-            # Update preview pane if main window has one
-            if hasattr(self.tab_manager, 'main_window') and hasattr(self.tab_manager.main_window, 'preview_pane'):
-                self.tab_manager.main_window.preview_pane.preview_file(file_path)
-            # Update selection
-            if hasattr(self.tab_manager, 'main_window'):
-                self.tab_manager.main_window.selected_items = [file_path]
-                if hasattr(self.tab_manager.main_window, 'safe_update_status_bar'):
-                    self.tab_manager.main_window.safe_update_status_bar()
+            self._show_clicked_file(file_path)
+
+    def _show_clicked_file(self, file_path):
+        """Preview file_path and make it the main window's selection"""
+        mw = self._main_window
+        if mw is None:
+            return
+        # Update preview pane if main window has one
+        preview_pane = getattr(mw, 'preview_pane', None)
+        if preview_pane is not None:
+            preview_pane.preview_file(file_path)
+        # Update selection
+        mw.selected_items = [file_path]
+        update_status_bar = getattr(mw, 'safe_update_status_bar', None)
+        if update_status_bar is not None:
+            update_status_bar()
 
     def on_list_item_double_clicked(self, index):
         """Handle list view double clicks"""
@@ -20987,11 +21822,7 @@ class FileManagerTab(QWidget):
             # If we are in My Computer drive-list mode and a drive was double-clicked, open it
             try:
                 if getattr(self, 'is_drive_list', False):
-                    self.is_drive_list = False
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_view.setModel(self.list_model)
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_view.setModel(self.detail_model)
+                    self._leave_drive_list()
                     if os.path.isdir(file_path):
                         self.navigate_to(file_path)
                         return
@@ -21006,24 +21837,13 @@ class FileManagerTab(QWidget):
             # Similar behavior for detail view when in My Computer drive-list
             try:
                 if getattr(self, 'is_drive_list', False):
-                    self.is_drive_list = False
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_view.setModel(self.list_model)
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_view.setModel(self.detail_model)
+                    self._leave_drive_list()
                     if os.path.isdir(file_path):
                         self.navigate_to(file_path)
                         return
             except Exception:
                 pass
-            # Update preview pane if main window has one
-            if hasattr(self.tab_manager, 'main_window') and hasattr(self.tab_manager.main_window, 'preview_pane'):
-                self.tab_manager.main_window.preview_pane.preview_file(file_path)
-            # Update selection
-            if hasattr(self.tab_manager, 'main_window'):
-                self.tab_manager.main_window.selected_items = [file_path]
-                if hasattr(self.tab_manager.main_window, 'safe_update_status_bar'):
-                    self.tab_manager.main_window.safe_update_status_bar()
+            self._show_clicked_file(file_path)
 
     def on_detail_item_double_clicked(self, index):
         """Handle detail view double clicks"""
@@ -21047,11 +21867,7 @@ class FileManagerTab(QWidget):
             # If in My Computer drive-list mode, open drive on double click
             try:
                 if getattr(self, 'is_drive_list', False):
-                    self.is_drive_list = False
-                    self.list_model = FormattedFileSystemModel()
-                    self.list_view.setModel(self.list_model)
-                    self.detail_model = FormattedFileSystemModel()
-                    self.detail_view.setModel(self.detail_model)
+                    self._leave_drive_list()
                     if isinstance(file_path, str) and os.path.isdir(file_path):
                         self.navigate_to(file_path)
                         return
@@ -21127,83 +21943,122 @@ class FileManagerTab(QWidget):
             if hasattr(self, 'address_bar'):
                 self.address_bar.setText(path)
     
-    def sort_items(self, items, folder_path):
-        """Sort items according to current tab's sort settings"""
-        import re
-        
+    def _scan_folder_cached(self, folder_path, need_stat=False, limit=None):
+        """Return {name: os.DirEntry} for folder_path, reusing the last scan while the folder's mtime is unchanged.
+
+        The folder's mtime only moves when entries are added, removed or renamed, so a hit is exact for
+        names and types but not for file sizes and dates; need_stat forces a fresh scan for those.
+        With limit, returns None (caching nothing) if the folder has more than limit non-hidden entries.
+        """
+        key = (folder_path, os.stat(folder_path).st_mtime_ns)
+        cache = self._dir_meta_cache
+        entries = None if need_stat else cache.get(key)
+        if entries is not None:
+            if limit is not None and sum(1 for name in entries if not name.startswith('.')) > limit:
+                return None
+        else:
+            entries = _scan_dir_entries(folder_path, limit)
+            if entries is None:
+                return None
+            cache[key] = entries
+            while len(cache) > _DIR_META_CACHE_MAX:
+                cache.popitem(last=False)
+        cache.move_to_end(key)
+        return entries
+
+    def sort_items(self, items, folder_path, entries=None):
+        """Sort items according to current tab's sort settings.
+
+        entries is an optional {name: os.DirEntry} map for folder_path (see _scan_dir_entries);
+        it is built here when not given so each item is stat()ed at most once.
+        """
+        case_sensitive = self.case_sensitive
+        # A plain name sort with no folder or type grouping needs neither stat data nor a key tuple
+        if (self.sort_by == "name" and not self.natural_sort
+                and not self.directories_first and not self.group_by_type):
+            return sorted(items, key=None if case_sensitive else str.lower,
+                          reverse=(self.sort_order == "descending"))
+        if entries is None:
+            try:
+                entries = _scan_dir_entries(folder_path)
+            except OSError:
+                entries = {}
+        if self.sort_by in ("size", "date"):
+            # A size sort ranks folders by child count, so their stat() would be wasted
+            _stat_entries(entries.values(), skip_dirs=(self.sort_by == "size"),
+                          parallel=_is_network_path(folder_path))
+        # Read the settings once; get_sort_key runs for every item
+        natural_sort = self.natural_sort
+        directories_first = self.directories_first
+        group_by_type = self.group_by_type
+        sort_by = self.sort_by
+
         def natural_sort_key(text):
             """Convert a string to a list of mixed strings and numbers for natural sorting"""
-            if not self.natural_sort:
-                return text.lower() if not self.case_sensitive else text
-                
-            # Split string into chunks of letters and numbers
-            chunks = re.split(r'(\d+)', text)
-            # Convert number chunks to integers for proper sorting
-            for i in range(len(chunks)):
-                if chunks[i].isdigit():
-                    chunks[i] = int(chunks[i])
-                else:
-                    chunks[i] = chunks[i].lower() if not self.case_sensitive else chunks[i]
-            return chunks
+            if not natural_sort:
+                text = text.lower() if not case_sensitive else text
+                return (_sort_prefix(text), text)
+            # Number chunks become ints so "file10" sorts after "file9". Only the leading text chunk
+            # goes into the prefix; a digit byte would order "file10" before "file9"
+            chunks = [int(c) if c.isdigit() else (c if case_sensitive else c.lower()) for c in _NUM_SPLIT(text)]
+            return (_sort_prefix(chunks[0]), chunks)
         
         def get_sort_key(item_name):
             """Get the sort key for an item based on current sort settings"""
-            full_path = os.path.join(folder_path, item_name)
-            is_dir = os.path.isdir(full_path)
+            entry = entries.get(item_name)
+            if entry is not None:
+                full_path = entry.path
+                is_dir = _entry_is_dir(entry)
+            else:
+                full_path = os.path.join(folder_path, item_name)
+                is_dir = os.path.isdir(full_path)
             
+            # Extension is shared by the group, type and extension keys. Same result as
+            # os.path.splitext: leading dots (".bashrc") don't start an extension
+            extension = ""
+            if not is_dir:
+                stem, dot, suffix = item_name.rpartition('.')
+                if dot and stem.lstrip('.'):
+                    extension = '.' + suffix.lower()
+
             # Primary sort: directories first if enabled
-            primary_key = not is_dir if self.directories_first else 0
+            primary_key = not is_dir if directories_first else 0
             
             # Secondary sort: by group type if enabled
             secondary_key = ""
-            if self.group_by_type and not is_dir:
-                extension = os.path.splitext(item_name)[1].lower()
-                # Group by file type categories
-                if extension in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']:
-                    secondary_key = "1_images"
-                elif extension in ['.txt', '.pdf', '.doc', '.docx', '.rtf', '.odt']:
-                    secondary_key = "2_documents"
-                elif extension in ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']:
-                    secondary_key = "3_videos"
-                elif extension in ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma']:
-                    secondary_key = "4_audio"
-                elif extension in ['.py', '.js', '.html', '.css', '.cpp', '.java', '.c']:
-                    secondary_key = "5_code"
-                elif extension in ['.zip', '.rar', '.7z', '.tar', '.gz']:
-                    secondary_key = "6_archives"
-                else:
-                    secondary_key = "7_other"
+            if group_by_type and not is_dir:
+                secondary_key = _EXT_CATEGORY.get(extension, "7_other")
             
             # Tertiary sort: by the selected criteria
             tertiary_key = None
             try:
-                if self.sort_by == "name":
+                if sort_by == "name":
                     tertiary_key = natural_sort_key(item_name)
-                elif self.sort_by == "size":
+                elif sort_by == "size":
                     if is_dir:
                         # For directories, use 0 size or count of items
                         try:
                             tertiary_key = len(os.listdir(full_path))
                         except:
                             tertiary_key = 0
+                    elif entry is not None:
+                        tertiary_key = entry.stat().st_size
                     else:
                         tertiary_key = os.path.getsize(full_path)
-                elif self.sort_by == "date":
-                    tertiary_key = os.path.getmtime(full_path)
-                elif self.sort_by == "type":
+                elif sort_by == "date":
+                    # DirEntry caches its stat result, so each item costs at most one syscall
+                    tertiary_key = entry.stat().st_mtime if entry is not None else os.path.getmtime(full_path)
+                elif sort_by == "type":
                     if is_dir:
                         tertiary_key = "0_directory"  # Directories first in type sort
                     else:
-                        extension = os.path.splitext(item_name)[1].lower()
                         tertiary_key = f"1_{extension}" if extension else "1_no_extension"
-                elif self.sort_by == "extension":
+                elif sort_by == "extension":
                     if is_dir:
                         tertiary_key = ""
                     else:
-                        extension = os.path.splitext(item_name)[1].lower()
+                        # extension is already lower-cased
                         tertiary_key = extension[1:] if extension else "zzz_no_extension"
-                        if not self.case_sensitive:
-                            tertiary_key = tertiary_key.lower()
                 else:
                     tertiary_key = natural_sort_key(item_name)
             except (OSError, IOError):
@@ -21212,14 +22067,13 @@ class FileManagerTab(QWidget):
             
             return (primary_key, secondary_key, tertiary_key)
         
-        # Sort items
-        sorted_items = sorted(items, key=get_sort_key)
-        
-        # Reverse if descending order
-        if self.sort_order == "descending":
-            sorted_items.reverse()
-            
-        return sorted_items
+        # sorted() calls get_sort_key once per item and caches the tuples (decorate-sort-undecorate)
+        return sorted(items, key=get_sort_key, reverse=(self.sort_order == "descending"))
+
+    def _sort_dir_entries(self, entries):
+        """Sort a list of os.DirEntry objects from the current folder with sort_items"""
+        by_name = {entry.name: entry for entry in entries}
+        return [by_name[name] for name in self.sort_items(list(by_name), self.current_folder, by_name)]
 
     def refresh_current_view(self):
         """Refresh the current view with files from current folder"""
@@ -21234,9 +22088,12 @@ class FileManagerTab(QWidget):
     def refresh_thumbnail_view(self):
         """Refresh thumbnail view with current folder contents"""
         # Get settings from main window using direct reference
-        main_window = self.tab_manager.main_window if self.tab_manager else None
+        main_window = self._main_window
         thumbnail_size = getattr(main_window, 'thumbnail_size', 64) if main_window else 64
         icons_wide = getattr(main_window, 'icons_wide', 0) if main_window else 0
+        # Callbacks from an earlier refresh (thumbnail precache, virtual loader chunks) drop out once this moves on
+        self._refresh_epoch += 1
+        epoch = self._refresh_epoch
 
         # If this tab is a My Computer drive-list, render connected drives instead
         if getattr(self, 'is_drive_list', False):
@@ -21262,19 +22119,15 @@ class FileManagerTab(QWidget):
                         def _drv_dd(p, tab=self):
                             try:
                                 if getattr(tab, 'is_drive_list', False) and isinstance(p, str) and os.path.isdir(p):
-                                    tab.is_drive_list = False
-                                    tab.list_model = FormattedFileSystemModel()
-                                    tab.list_view.setModel(tab.list_model)
-                                    tab.detail_model = FormattedFileSystemModel()
-                                    tab.detail_view.setModel(tab.detail_model)
+                                    tab._leave_drive_list()
                                     tab.navigate_to(p)
                                     return
                                 tab.handle_double_click(p)
                             except Exception:
                                 pass
                         icon_widget.doubleClicked.connect(_drv_dd)
-                        if self.tab_manager and self.tab_manager.main_window:
-                            mw = self.tab_manager.main_window
+                        mw = self._main_window
+                        if mw:
                             icon_widget.clicked.connect(mw.icon_clicked)
                             icon_widget.rightClicked.connect(mw.icon_right_clicked)
                         icon_container.add_widget_optimized(icon_widget, thumbnail_size, icons_wide)
@@ -21296,17 +22149,13 @@ class FileManagerTab(QWidget):
                             icon_widget = IconWidget(label, folder_path, True, thumbnail_size, getattr(main_window, 'thumbnail_cache', None), use_icon_only=getattr(self, 'icon_view_active', False))
                             def _std_dd(p, tab=self):
                                 try:
-                                    tab.is_drive_list = False
-                                    tab.list_model = FormattedFileSystemModel()
-                                    tab.list_view.setModel(tab.list_model)
-                                    tab.detail_model = FormattedFileSystemModel()
-                                    tab.detail_view.setModel(tab.detail_model)
+                                    tab._leave_drive_list()
                                     tab.navigate_to(p)
                                 except Exception:
                                     pass
                             icon_widget.doubleClicked.connect(_std_dd)
-                            if self.tab_manager and self.tab_manager.main_window:
-                                mw = self.tab_manager.main_window
+                            mw = self._main_window
+                            if mw:
                                 icon_widget.clicked.connect(mw.icon_clicked)
                                 icon_widget.rightClicked.connect(mw.icon_right_clicked)
                             icon_container.add_widget_optimized(icon_widget, thumbnail_size, icons_wide)
@@ -21332,36 +22181,32 @@ class FileManagerTab(QWidget):
             in_icon_view = False
 
         def after_thumbnailing():
-            # Clear existing icons
+            if epoch != self._refresh_epoch:
+                return  # The user has navigated or refreshed again meanwhile
             icon_container = self.get_icon_container_safely()
             if not icon_container:
                 return  # Cannot refresh icons without icon_container
-            layout = icon_container.layout()
-            for i in reversed(range(layout.count())):
-                child = layout.itemAt(i).widget()
-                if child:
-                    child.setParent(None)
-            # Force layout update after clearing
-            layout.update()
-            icon_container.update()
             # Check if directory is large and use virtual loading if needed
             try:
+                entries = None
                 if main_window and hasattr(main_window, 'virtual_file_loader') and main_window.virtual_file_loader:
-                    # Count items first to decide on loading strategy
-                    item_count = len([name for name in os.listdir(self.current_folder) 
-                                    if not name.startswith('.')])
-                    if item_count > 1000:  # Use virtual loading for large directories
+                    # The scan stops counting at 1001 visible items; below that it is reused for the standard load
+                    entries = self._scan_folder_cached(self.current_folder, need_stat=self.sort_by in ("size", "date"), limit=1000)
+                    if entries is None:  # Use virtual loading for large directories
+                        # Chunks are appended, so start from an empty grid
+                        self._clear_icons(icon_container)
                         # Use virtual file loader for large directories
                         main_window.virtual_file_loader.load_directory_async(
                             self.current_folder,
-                            lambda chunk, is_final: self._add_icons_chunk(chunk, is_final, thumbnail_size, icons_wide, main_window),
-                            sort_func=lambda items: self.sort_items(items, self.current_folder)
+                            lambda chunk, is_final: self._add_icons_chunk(chunk, is_final, thumbnail_size, icons_wide, main_window, epoch),
+                            sort_func=self._sort_dir_entries
                         )
                         return
-                # Standard loading for smaller directories
-                self._load_icons_standard(thumbnail_size, icons_wide, main_window)
+                # Standard loading for smaller directories; it diffs against the icons already shown
+                self._load_icons_standard(thumbnail_size, icons_wide, main_window, entries)
             except PermissionError:
-                pass
+                # Don't leave the previous folder's icons up for an unreadable one
+                self._clear_icons(icon_container)
 
         if not in_icon_view and main_window and hasattr(main_window, 'thumbnail_cache') and main_window.thumbnail_cache:
             thumbnail_debug('About to call precache_text_pdf_thumbnails_in_directory for {} size={}', self.current_folder, thumbnail_size)
@@ -21381,69 +22226,21 @@ class FileManagerTab(QWidget):
 
         # If not thumbnailing, just refresh immediately
         after_thumbnailing()
-
-        # Clear existing icons
-        icon_container = self.get_icon_container_safely()
-        if not icon_container:
-            return  # Cannot refresh icons without icon_container
-            
-        layout = icon_container.layout()
-        for i in reversed(range(layout.count())):
-            child = layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        # Force layout update after clearing
-        layout.update()
-        icon_container.update()
-        
-    # Check if directory is large and use virtual loading if needed
-        try:
-            if main_window and hasattr(main_window, 'virtual_file_loader') and main_window.virtual_file_loader:
-                # Count items first to decide on loading strategy
-                item_count = len([name for name in os.listdir(self.current_folder) 
-                                if not name.startswith('.')])
-                
-                if item_count > 1000:  # Use virtual loading for large directories
-                    # Use virtual file loader for large directories
-                    main_window.virtual_file_loader.load_directory_async(
-                        self.current_folder,
-                        lambda chunk, is_final: self._add_icons_chunk(chunk, is_final, thumbnail_size, icons_wide, main_window),
-                        sort_func=lambda items: self.sort_items(items, self.current_folder)
-                    )
-                    return
-            
-            # Standard loading for smaller directories
-            self._load_icons_standard(thumbnail_size, icons_wide, main_window)
-            
-        except PermissionError:
-            # Handle permission errors gracefully
-            # ...removed thumbnail debug message...
-            pass
     
-    def _load_icons_standard(self, thumbnail_size, icons_wide, main_window):
-        """Standard icon loading for smaller directories"""
+    def _load_icons_standard(self, thumbnail_size, icons_wide, main_window, entries=None):
+        """Standard icon loading for smaller directories (entries: a fresh _scan_folder_cached result, if the caller has one)"""
         icon_container = self.get_icon_container_safely()
         if not icon_container:
             return  # Cannot load icons without icon_container
             
-        items = os.listdir(self.current_folder)
+        if entries is None:
+            entries = self._scan_folder_cached(self.current_folder, need_stat=self.sort_by in ("size", "date"))
+        items = list(entries)
         # If we're at the user's home or the filesystem root, show standard folders first
         try:
-            home_dir = os.path.expanduser('~')
-            cur_abs = os.path.abspath(self.current_folder)
-            root_abs = os.path.abspath(os.sep)
-            if cur_abs == os.path.abspath(home_dir) or cur_abs == root_abs:
-                std_names = ['Desktop', 'Documents', 'Downloads', 'Pictures', 'Music', 'Videos']
-                prepend = []
-                for name in std_names:
-                    candidate = os.path.join(home_dir, name)
-                    # If the candidate exists and isn't already listed, show it first
-                    if os.path.exists(candidate):
-                        base = os.path.basename(candidate)
-                        if base not in items:
-                            prepend.append(base)
-                # Prepend in reverse order so Desktop ends up first
+            if os.path.normcase(os.path.abspath(self.current_folder)) in _HOME_AND_ROOT:
+                # Existing standard folders that aren't already listed are shown first
+                prepend = [name for name in _standard_home_folders() if name not in entries]
                 if prepend:
                     items = prepend + items
         except Exception:
@@ -21451,25 +22248,79 @@ class FileManagerTab(QWidget):
             pass
         
         # Use advanced sorting
-        sorted_items = self.sort_items(items, self.current_folder)
-        
-        for item in sorted_items:
-            self._create_and_add_icon(item, thumbnail_size, icons_wide, main_window)
+        sorted_items = self.sort_items(items, self.current_folder, entries)
+
+        # Keyed diff against the icons already in the grid: a refresh of the same folder only builds
+        # widgets for new or modified items and drops those for vanished ones; the rest are re-placed
+        icon_key = (self.current_folder, thumbnail_size, self._effective_icon_only(main_window))
+        # Hold repaints while the grid is taken apart and refilled; one update() follows at the end
+        icon_container.setUpdatesEnabled(False)
+        try:
+            self._fill_icon_grid(icon_container, sorted_items, entries, icon_key, thumbnail_size, icons_wide, main_window)
+        finally:
+            icon_container.setUpdatesEnabled(True)
         
         # Force layout update after adding widgets
         layout = icon_container.layout()
         layout.update()
         icon_container.update()
         icon_container.updateGeometry()
-    
-    def _add_icons_chunk(self, items_chunk, is_final, thumbnail_size, icons_wide, main_window):
-        """Add a chunk of icons to the view (for virtual loading)"""
+
+    def _fill_icon_grid(self, icon_container, sorted_items, entries, icon_key, thumbnail_size, icons_wide, main_window):
+        """Re-place the grid in sorted_items order, reusing unmodified icons from the last build (see _load_icons_standard)"""
+        if icon_key == self._icon_widgets_key:
+            previous = self._icon_widgets_by_name
+        else:
+            previous = {}
+            # Deselect in one go rather than once per dropped icon (see IconContainer.childEvent)
+            icon_container.clear_selection()
+        # Fresh stats, so in-place edits are seen even when entries is a reused scan
+        folder = self.current_folder
+        signatures = dict(zip(sorted_items, _path_signatures(
+            [os.path.join(folder, item) for item in sorted_items], parallel=_is_network_path(folder))))
+        shown = set(icon_container.take_widgets())
+        widgets = {}
+        for item in sorted_items:
+            old = previous.get(item)
+            if old is None or old[0] not in shown:
+                continue
+            signature = signatures[item]
+            if signature is not None and signature == old[1]:
+                widgets[item] = (old[0], signature)
+        kept = {widget for widget, _ in widgets.values()}
+        for widget in shown:
+            if widget not in kept:
+                widget.setParent(None)
+
+        batch = icon_container.begin_add_batch(thumbnail_size, icons_wide)
+        for item in sorted_items:
+            built = widgets.get(item)
+            if built is None:
+                built = widgets[item] = (self._create_icon_widget(item, thumbnail_size, main_window, entries.get(item)),
+                                         signatures[item])
+            icon_container.add_widget_fast(built[0], batch)
+        self._icon_widgets_by_name = widgets
+        self._icon_widgets_key = icon_key
+    
+    def _add_icons_chunk(self, items_chunk, is_final, thumbnail_size, icons_wide, main_window, epoch=None):
+        """Add a chunk of icons to the view (for virtual loading; items_chunk holds os.DirEntry objects).
+
+        epoch is the _refresh_epoch of the refresh that started the load; stale chunks are ignored.
+        """
+        if epoch is not None and epoch != self._refresh_epoch:
+            return
         icon_container = self.get_icon_container_safely()
         if not icon_container:
             return  # Cannot add icons without icon_container
             
-        for item in items_chunk:
-            self._create_and_add_icon(item, thumbnail_size, icons_wide, main_window)
+        batch = icon_container.begin_add_batch(thumbnail_size, icons_wide)
+        # One repaint per chunk instead of one per icon
+        icon_container.setUpdatesEnabled(False)
+        try:
+            for entry in items_chunk:
+                self._create_and_add_icon(entry.name, thumbnail_size, icons_wide, main_window, batch, entry)
+        finally:
+            icon_container.setUpdatesEnabled(True)
         
         if is_final:
             # Force layout update after adding final chunk
@@ -21478,22 +22329,42 @@ class FileManagerTab(QWidget):
             icon_container.update()
             icon_container.updateGeometry()
     
-    def _create_and_add_icon(self, item, thumbnail_size, icons_wide, main_window):
-        """Create and add a single icon widget"""
+    def _clear_icons(self, icon_container):
+        """Remove every icon from icon_container; the next standard load builds from scratch"""
+        icon_container.clear_selection()
+        layout = icon_container.layout()
+        for i in reversed(range(layout.count())):
+            child = layout.itemAt(i).widget()
+            if child:
+                child.setParent(None)
+        self._icon_widgets_by_name = {}
+        self._icon_widgets_key = None
+        # Force layout update after clearing
+        layout.update()
+        icon_container.update()
+
+    def _create_and_add_icon(self, item, thumbnail_size, icons_wide, main_window, batch=None, entry=None):
+        """Create and add a single icon widget (batch: optional IconContainer.begin_add_batch result)"""
         icon_container = self.get_icon_container_safely()
         if not icon_container:
             return  # Cannot add icons without icon_container
-            
-        item_path = os.path.join(self.current_folder, item)
-        is_dir = os.path.isdir(item_path)
-        
-        # Decide effective icon-only mode for this item. This combines:
-        # - per-tab runtime flag (self.icon_view_active)
-        # - main window view mode (ViewModeManager.ICON_VIEW)
-        # - persisted user preference (main_window.icon_view_use_icons_only)
-        effective_icon_only = False
-        detected_mode = None
+        icon_widget = self._create_icon_widget(item, thumbnail_size, main_window, entry)
+        # Use the optimized layout from main window
+        if batch is not None:
+            icon_container.add_widget_fast(icon_widget, batch)
+        else:
+            icon_container.add_widget_optimized(icon_widget, thumbnail_size, icons_wide)
+
+    def _effective_icon_only(self, main_window):
+        """Whether icons are shown without thumbnails.
+
+        This combines:
+        - per-tab runtime flag (self.icon_view_active)
+        - main window view mode (ViewModeManager.ICON_VIEW)
+        - persisted user preference (main_window.icon_view_use_icons_only)
+        """
         try:
+            detected_mode = None
             if main_window and hasattr(main_window, 'view_mode_manager'):
                 detected_mode = main_window.view_mode_manager.get_mode()
 
@@ -21509,9 +22380,24 @@ class FileManagerTab(QWidget):
                 pref = True
                 if main_window and hasattr(main_window, 'icon_view_use_icons_only'):
                     pref = bool(main_window.icon_view_use_icons_only)
-                effective_icon_only = bool(pref)
+                return bool(pref)
         except Exception:
-            effective_icon_only = False
+            pass
+        return False
+
+    def _create_icon_widget(self, item, thumbnail_size, main_window, entry=None):
+        """Build the IconWidget for item in the current folder and connect its signals.
+
+        entry is the item's os.DirEntry when the caller scanned the folder, which saves an isdir() stat.
+        """
+        if entry is not None:
+            item_path = entry.path
+            is_dir = _entry_is_dir(entry)
+        else:
+            item_path = os.path.join(self.current_folder, item)
+            is_dir = os.path.isdir(item_path)
+
+        effective_icon_only = self._effective_icon_only(main_window)
 
         # If we're not in effective icon-only mode and a thumbnail cache exists, provide it.
         if not effective_icon_only and main_window and hasattr(main_window, 'thumbnail_cache') and main_window.thumbnail_cache:
@@ -21523,13 +22409,11 @@ class FileManagerTab(QWidget):
         icon_widget.doubleClicked.connect(self.handle_double_click)
         
         # Connect to main window handlers through tab manager
-        if self.tab_manager and self.tab_manager.main_window:
-            main_window = self.tab_manager.main_window
+        if self._main_window:
+            main_window = self._main_window
             icon_widget.clicked.connect(main_window.icon_clicked)
             icon_widget.rightClicked.connect(main_window.icon_right_clicked)
-        
-        # Use the optimized layout from main window
-        icon_container.add_widget_optimized(icon_widget, thumbnail_size, icons_wide)
+        return icon_widget
 
     def refresh_list_view(self):
         """Refresh list view"""
@@ -21568,20 +22452,11 @@ class FileManagerTab(QWidget):
         super().resizeEvent(event)
         
         # If we're in auto-width mode, trigger a relayout of the icon container
-        main_window = self.tab_manager.main_window if self.tab_manager else None
+        main_window = self._main_window
         if main_window and getattr(main_window, 'icons_wide', 0) == 0:
-            # Get the current view's icon container safely
-            icon_container = self.get_icon_container_safely()
-            if icon_container:
-                # Use a timer to prevent excessive relayout calls during resize
-                if not hasattr(self, '_tab_resize_timer'):
-                    from PyQt5.QtCore import QTimer
-                    self._tab_resize_timer = QTimer()
-                    self._tab_resize_timer.setSingleShot(True)
-                    self._tab_resize_timer.timeout.connect(lambda: self.get_icon_container_safely() and self.get_icon_container_safely().relayout_icons())
-                
-                self._tab_resize_timer.stop()
-                self._tab_resize_timer.start(150)  # Delay 150ms before relayout
+            # Restarting the timer prevents excessive relayout calls during resize
+            if self.get_icon_container_safely():
+                self._tab_resize_timer.start()
     
     def eventFilter(self, obj, event):
         """Handle events from child widgets, specifically scroll area viewport resizes"""
@@ -21589,22 +22464,18 @@ class FileManagerTab(QWidget):
             obj == getattr(getattr(self, 'scroll_area', None), 'viewport', lambda: None)()):
             if event.type() == QEvent.Resize:
                 # Viewport was resized, trigger auto-width recalculation if needed
-                main_window = self.tab_manager.main_window if self.tab_manager else None
+                main_window = self._main_window
                 if main_window and getattr(main_window, 'icons_wide', 0) == 0:
-                    icon_container = self.get_icon_container_safely()
-                    if icon_container:
-                        # Use a shorter delay for viewport resize events
-                        if not hasattr(self, '_viewport_resize_timer'):
-                            from PyQt5.QtCore import QTimer
-                            self._viewport_resize_timer = QTimer()
-                            self._viewport_resize_timer.setSingleShot(True)
-                            self._viewport_resize_timer.timeout.connect(lambda: self.get_icon_container_safely() and self.get_icon_container_safely().relayout_icons())
-                        
-                        self._viewport_resize_timer.stop()
-                        self._viewport_resize_timer.start(50)  # Quick response for viewport changes
+                    if self.get_icon_container_safely():
+                        self._viewport_resize_timer.start()
         
         return super().eventFilter(obj, event)
     
+    def _do_relayout(self):
+        icon_container = self.get_icon_container_safely()
+        if icon_container:
+            icon_container.relayout_icons()
+
     def get_icon_container_safely(self):
         """Safely get icon_container reference, returns None if not available"""
         if hasattr(self, 'icon_container') and self.icon_container:
@@ -21614,7 +22485,7 @@ class FileManagerTab(QWidget):
     def handle_double_click(self, path):
         """Handle double click on file/folder"""
         if os.path.isdir(path):
-            self.navigate_to(path)
+            self.navigate_to(path, is_dir=True)
         elif path.lower().endswith('.gsfmt'):
             # Handle .gsfmt files specially - load them as custom themes
             main_window = self.parent()
@@ -21985,6 +22856,10 @@ class TabManager(QWidget):
         except Exception:
             pass
 
+        # Stop remote listings before the tab (their parent) is deleted
+        if hasattr(tab, '_stop_remote_activity'):
+            tab._stop_remote_activity()
+
         self.tabs.remove(tab)
         
         # Remove from UI components
@@ -34444,6 +35319,9 @@ def main():
 
         app = QApplication(sys.argv)
 
+        # Room for decoded thumbnail/preview pixmaps (limit is in KiB)
+        QPixmapCache.setCacheLimit(100 * 1024)
+
         # Enable QSS stylesheet support and advanced features
         app.setAttribute(Qt.AA_UseStyleSheetPropagationInWidgetStyles, True)
         